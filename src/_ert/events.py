@@ -115,6 +115,7 @@ class RealizationBaseEvent(BaseEvent):
 
 class RealizationPending(RealizationBaseEvent):
     event_type: Id.REALIZATION_PENDING_TYPE = Id.REALIZATION_PENDING
+    submit_rate: Union[float, None] = None
 
 
 class RealizationRunning(RealizationBaseEvent):
@@ -123,11 +124,13 @@ class RealizationRunning(RealizationBaseEvent):
 
 class RealizationSuccess(RealizationBaseEvent):
     event_type: Id.REALIZATION_SUCCESS_TYPE = Id.REALIZATION_SUCCESS
+    ingestion_backlog: Union[int, None] = None
 
 
 class RealizationFailed(RealizationBaseEvent):
     event_type: Id.REALIZATION_FAILURE_TYPE = Id.REALIZATION_FAILURE
     message: Union[str, None] = None  # Only used for JobState.FAILED
+    ingestion_backlog: Union[int, None] = None
 
 
 class RealizationUnknown(RealizationBaseEvent):
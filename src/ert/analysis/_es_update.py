@@ -2,13 +2,21 @@
 
 import functools
 import logging
+import queue
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from contextlib import ExitStack, contextmanager, suppress
 from fnmatch import fnmatch
 from typing import (
     TYPE_CHECKING,
+    Any,
     Callable,
+    Dict,
     Generic,
     Iterable,
+    Iterator,
     List,
     Optional,
     Sequence,
@@ -26,11 +34,14 @@
 from typing_extensions import Self
 
 from ert.config import (
+    Field,
     GenKwConfig,
+    ParameterConfig,
 )
+from ert.storage import ParameterLayout
 
 from ..config.analysis_config import ObservationGroups, UpdateSettings
-from ..config.analysis_module import ESSettings, IESSettings
+from ..config.analysis_module import BaseSettings, ESSettings, IESSettings
 from . import misfit_preprocessor
 from .event import (
     AnalysisCompleteEvent,
@@ -64,6 +75,9 @@ def noop_progress_callback(_: AnalysisEvent) -> None:
 
 T = TypeVar("T")
 
+# Upper bound on the parameter data handed to storage in one write
+_SAVE_BATCH_BYTES = 256 * 1024**2
+
 
 class TimedIterator(Generic[T]):
     SEND_FREQUENCY = 1.0  # seconds
@@ -104,6 +118,42 @@ def __next__(self) -> T:
         return result
 
 
+class _ForwardedProgress:
+    """A progress callback that can be called from worker threads. Events
+    from other threads than the one that created it are queued until that
+    thread delivers them, as progress consumers like the GUI expect to be
+    called from the thread running the update."""
+
+    def __init__(self, callback: Callable[[AnalysisEvent], None]) -> None:
+        self._callback = callback
+        self._thread_id = threading.get_ident()
+        self._events: queue.SimpleQueue[AnalysisEvent] = queue.SimpleQueue()
+
+    def __call__(self, event: AnalysisEvent) -> None:
+        if threading.get_ident() == self._thread_id:
+            self._callback(event)
+        else:
+            self._events.put(event)
+
+    def deliver(self) -> None:
+        with suppress(queue.Empty):
+            while True:
+                self._callback(self._events.get_nowait())
+
+
+def _result(future: Future[T], progress_callback: Callable[[AnalysisEvent], None]) -> T:
+    """Waits for the result of work on another thread while delivering the
+    progress events it sends"""
+    while True:
+        try:
+            return future.result(timeout=0.1)
+        except FutureTimeoutError:
+            pass
+        finally:
+            if isinstance(progress_callback, _ForwardedProgress):
+                progress_callback.deliver()
+
+
 def _all_parameters(
     ensemble: Ensemble,
     iens_active_index: npt.NDArray[np.int_],
@@ -125,11 +175,42 @@ def _save_param_ensemble_array_to_disk(
     param_ensemble_array: npt.NDArray[np.float64],
     param_group: str,
     iens_active_index: npt.NDArray[np.int_],
+    progress_callback: Callable[[AnalysisEvent], None] = noop_progress_callback,
+    batch_bytes: int = _SAVE_BATCH_BYTES,
 ) -> None:
+    """Saves the updated parameters in batches of realizations, each batch
+    written with a single bulk call so that storage can write it at once.
+    A batch, with the copy of it that is written, takes at most batch_bytes
+    unless a single realization is larger."""
     config_node = ensemble.experiment.parameter_configuration[param_group]
-    for i, realization in enumerate(iens_active_index):
-        config_node.save_parameters(
-            ensemble, param_group, realization, param_ensemble_array[:, i]
+    iens_active_index = np.asarray(iens_active_index)
+    num_realizations = len(iens_active_index)
+    if num_realizations == 0:
+        return
+    # Fields are written with their inactive cells filled in
+    values_written = (
+        config_node.mask.size
+        if isinstance(config_node, Field)
+        else param_ensemble_array.shape[0]
+    )
+    bytes_per_realization = max(1, (param_ensemble_array.shape[0] + values_written) * 8)
+    batch_size = max(1, batch_bytes // bytes_per_realization)
+    # Sliced exactly, as np.array_split would allow batches of almost
+    # twice batch_size
+    for start in range(0, num_realizations, batch_size):
+        batch = slice(start, start + batch_size)
+        config_node.save_parameters_many(
+            ensemble,
+            param_group,
+            iens_active_index[batch],
+            param_ensemble_array[:, batch],
+        )
+        progress_callback(
+            AnalysisStatusEvent(
+                msg=f"Storing data for {param_group}: "
+                f"{min(start + batch_size, num_realizations)}/{num_realizations} "
+                "realizations"
+            )
         )
 
 
@@ -161,9 +242,13 @@ def _get_observations_and_responses(
         observations_for_type = observations_by_type[response_type].filter(
             polars.col("observation_key").is_in(list(selected_observations))
         )
-        responses_for_type = ensemble.load_responses(
-            response_type, realizations=tuple(iens_active_index)
-        )
+        responses_for_type = _select_observed_responses(
+            ensemble.scan_responses(
+                response_type, realizations=iens_active_index.tolist()
+            ),
+            observations_for_type,
+            response_cls.primary_key,
+        ).collect()
 
         # Note that if there are duplicate entries for one
         # response at one index, they are aggregated together
@@ -173,6 +258,14 @@ def _get_observations_and_responses(
             index=["response_key", *response_cls.primary_key],
             aggregate_function="mean",
         )
+        # Realizations without any observed responses get no column from the
+        # pivot, but S is read by position so every realization needs one
+        realization_columns = [str(realization) for realization in iens_active_index]
+        pivoted = pivoted.with_columns(
+            polars.lit(None, dtype=polars.Float32).alias(column)
+            for column in realization_columns
+            if column not in pivoted.columns
+        ).select(["response_key", *response_cls.primary_key, *realization_columns])
 
         # We need to either assume that if there is a time column
         # we will approx-join that, or we could specify in response configs
@@ -217,10 +310,49 @@ def _get_observations_and_responses(
 
         dfs.append(joined)
 
-    ensemble.load_responses.cache_clear()
     return polars.concat(dfs)
 
 
+def _select_observed_responses(
+    responses: polars.LazyFrame,
+    observations: polars.DataFrame,
+    primary_key: List[str],
+) -> polars.LazyFrame:
+    """Keeps only the responses that can be matched with an observation, so
+    that the pivot over realizations scales with the number of observations
+    rather than the number of responses. Time is matched within the same
+    one second tolerance as the join in _get_observations_and_responses."""
+    responses = responses.filter(
+        polars.col("response_key").is_in(observations["response_key"].unique())
+    )
+    if "time" not in primary_key:
+        return responses.join(
+            observations.lazy().select(["response_key", *primary_key]).unique(),
+            on=["response_key", *primary_key],
+            how="semi",
+        )
+
+    observed_times = (
+        observations.lazy()
+        .select("response_key", polars.col("time").alias("__observed_time__"))
+        .unique()
+        .sort("__observed_time__")
+    )
+    return (
+        responses.sort("time")
+        .join_asof(
+            observed_times,
+            left_on="time",
+            right_on="__observed_time__",
+            by="response_key",
+            strategy="forward",
+            tolerance="1s",
+        )
+        .filter(polars.col("__observed_time__").is_not_null())
+        .drop("__observed_time__")
+    )
+
+
 def _expand_wildcards(
     input_list: npt.NDArray[np.str_], patterns: List[str]
 ) -> List[str]:
@@ -482,6 +614,284 @@ def _calculate_adaptive_batch_size(num_params: int, num_obs: int) -> int:
     )
 
 
+def _memory_budget_bytes(settings: BaseSettings) -> Optional[int]:
+    if settings.update_memory_budget is None:
+        return None
+    return int(settings.update_memory_budget * 1024**3)
+
+
+def _estimated_update_bytes(config_node: ParameterConfig, ensemble_size: int) -> int:
+    # The prior, the posterior and a batch being saved
+    return 3 * len(config_node) * ensemble_size * 8
+
+
+class _MemoryBudget:
+    """Admits work while the combined size of what is in flight fits within
+    the budget. Work larger than the whole budget runs on its own."""
+
+    def __init__(self, budget: Optional[int]) -> None:
+        self._budget = budget
+        self._in_use = 0
+        self._condition = threading.Condition()
+
+    def acquire(self, nbytes: int) -> None:
+        budget = self._budget
+        with self._condition:
+            if budget is not None:
+                self._condition.wait_for(
+                    lambda: self._in_use == 0 or self._in_use + nbytes <= budget
+                )
+            self._in_use += nbytes
+
+    def release(self, nbytes: int) -> None:
+        with self._condition:
+            self._in_use -= nbytes
+            self._condition.notify_all()
+
+    @contextmanager
+    def reserve(self, nbytes: int) -> Iterator[None]:
+        self.acquire(nbytes)
+        try:
+            yield
+        finally:
+            self.release(nbytes)
+
+
+def _update_param_groups(
+    parameters: Iterable[str],
+    load_param_group: Callable[[str], npt.NDArray[np.float64]],
+    update_param_group: Callable[
+        [str, npt.NDArray[np.float64]], npt.NDArray[np.float64]
+    ],
+    save_param_group: Callable[[str, npt.NDArray[np.float64]], None],
+    ensemble: Ensemble,
+    ensemble_size: int,
+    settings: BaseSettings,
+    progress_callback: Callable[[AnalysisEvent], None] = noop_progress_callback,
+) -> None:
+    """Loads, updates and saves each parameter group.
+
+    By default the groups are processed one at a time. With more workers, up
+    to settings.update_workers groups are processed in parallel. With a
+    single worker and settings.update_memory_budget set, the groups are
+    pipelined: the next group is prefetched and the previous one written back
+    on background threads while the current one is updated. Groups are only
+    admitted while their estimated memory use fits within the budget.
+    """
+    param_groups = list(parameters)
+    budget = _MemoryBudget(_memory_budget_bytes(settings))
+    parameter_configuration = ensemble.experiment.parameter_configuration
+    nbytes = {
+        param_group: _estimated_update_bytes(
+            parameter_configuration[param_group], ensemble_size
+        )
+        for param_group in param_groups
+    }
+    stage_times = dict.fromkeys(["load", "update", "save"], 0.0)
+    stage_lock = threading.Lock()
+
+    def timed(stage: str, func: Callable[..., T], *args: Any) -> T:
+        start = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            with stage_lock:
+                stage_times[stage] += time.perf_counter() - start
+
+    start = time.perf_counter()
+    if settings.update_workers == 1 and settings.update_memory_budget is None:
+        for param_group in TimedIterator(param_groups, progress_callback):
+            param_ensemble_array = timed("load", load_param_group, param_group)
+            param_ensemble_array = timed(
+                "update", update_param_group, param_group, param_ensemble_array
+            )
+            timed("save", save_param_group, param_group, param_ensemble_array)
+    elif settings.update_workers == 1:
+        _pipeline_param_groups(
+            param_groups,
+            functools.partial(timed, "load", load_param_group),
+            functools.partial(timed, "update", update_param_group),
+            functools.partial(timed, "save", save_param_group),
+            budget,
+            nbytes,
+            progress_callback,
+        )
+    else:
+
+        def run(param_group: str) -> None:
+            with budget.reserve(nbytes[param_group]):
+                param_ensemble_array = timed("load", load_param_group, param_group)
+                param_ensemble_array = timed(
+                    "update", update_param_group, param_group, param_ensemble_array
+                )
+                timed("save", save_param_group, param_group, param_ensemble_array)
+
+        with ThreadPoolExecutor(max_workers=settings.update_workers) as executor:
+            futures = [
+                executor.submit(run, param_group) for param_group in param_groups
+            ]
+            for future in TimedIterator(futures, progress_callback):
+                _result(future, progress_callback)
+
+    log_msg = (
+        f"Updated {len(param_groups)} parameter groups in "
+        f"{time.perf_counter() - start:.2f}s (load {stage_times['load']:.2f}s, "
+        f"update {stage_times['update']:.2f}s, save {stage_times['save']:.2f}s)"
+    )
+    logger.info(log_msg)
+    progress_callback(AnalysisStatusEvent(msg=log_msg))
+
+
+def _pipeline_param_groups(
+    param_groups: List[str],
+    load_param_group: Callable[[str], npt.NDArray[np.float64]],
+    update_param_group: Callable[
+        [str, npt.NDArray[np.float64]], npt.NDArray[np.float64]
+    ],
+    save_param_group: Callable[[str, npt.NDArray[np.float64]], None],
+    budget: _MemoryBudget,
+    nbytes: Dict[str, int],
+    progress_callback: Callable[[AnalysisEvent], None],
+) -> None:
+    """Updates one group at a time while the next group is loaded and the
+    previous one saved on background threads. A group holds its share of the
+    budget from before it is loaded until it has been saved."""
+
+    def prefetch(param_group: str) -> npt.NDArray[np.float64]:
+        budget.acquire(nbytes[param_group])
+        try:
+            return load_param_group(param_group)
+        except BaseException:
+            budget.release(nbytes[param_group])
+            raise
+
+    def write_back(
+        param_group: str, param_ensemble_array: npt.NDArray[np.float64]
+    ) -> None:
+        try:
+            save_param_group(param_group, param_ensemble_array)
+        finally:
+            budget.release(nbytes[param_group])
+
+    with (
+        ThreadPoolExecutor(max_workers=1) as loader,
+        ThreadPoolExecutor(max_workers=1) as writer,
+    ):
+        next_load = loader.submit(prefetch, param_groups[0]) if param_groups else None
+        pending_save: Optional[Future[None]] = None
+        for i, param_group in enumerate(TimedIterator(param_groups, progress_callback)):
+            assert next_load is not None
+            param_ensemble_array = _result(next_load, progress_callback)
+            next_load = (
+                loader.submit(prefetch, param_groups[i + 1])
+                if i + 1 < len(param_groups)
+                else None
+            )
+            try:
+                param_ensemble_array = update_param_group(
+                    param_group, param_ensemble_array
+                )
+                if pending_save is not None:
+                    _result(pending_save, progress_callback)
+            except BaseException:
+                budget.release(nbytes[param_group])
+                raise
+            pending_save = writer.submit(write_back, param_group, param_ensemble_array)
+        if pending_save is not None:
+            _result(pending_save, progress_callback)
+
+
+def _update_param_group_in_chunks(
+    source_ensemble: Ensemble,
+    target_ensemble: Ensemble,
+    param_group: str,
+    iens_active_index: npt.NDArray[np.int_],
+    T: npt.NDArray[np.float64],
+    memory_budget: int,
+    progress_callback: Callable[[AnalysisEvent], None],
+) -> None:
+    """Computes the posterior of a parameter group that does not fit within
+    the memory budget by multiplying blocks of rows with the transition
+    matrix T. Each posterior block is written to a memory mapped file in the
+    swap directory of the storage, which is then saved in batches of
+    realizations that fit within the budget.
+
+    With the per-realization layout, each realization file is read once into
+    a memory mapped copy of the prior that the blocks are taken from, rather
+    than once for every block."""
+    config_node = source_ensemble.experiment.parameter_configuration[param_group]
+    num_params = len(config_node)
+    num_realizations = len(iens_active_index)
+    # A block of the prior, its posterior and the block of realizations that
+    # the prior is read through
+    rows_per_chunk = max(1, memory_budget // (3 * num_realizations * 8))
+    load_block_bytes = rows_per_chunk * num_realizations * 8
+    chunks = [
+        np.arange(start, min(start + rows_per_chunk, num_params))
+        for start in range(0, num_params, rows_per_chunk)
+    ]
+
+    log_msg = (
+        f"Updating {param_group} in {len(chunks)} chunks of "
+        f"at most {rows_per_chunk} parameters.."
+    )
+    logger.info(log_msg)
+    progress_callback(AnalysisStatusEvent(msg=log_msg))
+    start = time.time()
+    with ExitStack() as stack:
+        if source_ensemble.parameter_layout == ParameterLayout.REALIZATION:
+            prior_matrix = np.memmap(
+                stack.enter_context(source_ensemble.temporary_file()),
+                dtype=np.float64,
+                mode="w+",
+                shape=(num_params, num_realizations),
+                order="F",
+            )
+            for i in range(num_realizations):
+                prior_matrix[:, i] = config_node.load_parameters(
+                    source_ensemble, param_group, iens_active_index[i : i + 1]
+                )[:, 0]
+
+            def load_rows(rows: npt.NDArray[np.int_]) -> npt.NDArray[np.float64]:
+                return np.asarray(prior_matrix[rows])
+
+        else:
+
+            def load_rows(rows: npt.NDArray[np.int_]) -> npt.NDArray[np.float64]:
+                return config_node.load_parameter_rows(
+                    source_ensemble,
+                    param_group,
+                    iens_active_index,
+                    rows,
+                    block_bytes=load_block_bytes,
+                )
+
+        # Column major so that saving a batch of realizations reads
+        # contiguous blocks
+        posterior = np.memmap(
+            stack.enter_context(target_ensemble.temporary_file()),
+            dtype=np.float64,
+            mode="w+",
+            shape=(num_params, num_realizations),
+            order="F",
+        )
+        for rows in TimedIterator(chunks, progress_callback):
+            prior = load_rows(rows)
+            posterior[rows] = prior @ T.astype(prior.dtype)
+        posterior.flush()
+        _save_param_ensemble_array_to_disk(
+            target_ensemble,
+            posterior,
+            param_group,
+            iens_active_index,
+            progress_callback,
+            batch_bytes=memory_budget,
+        )
+    logger.info(
+        f"Chunked update of {param_group} completed in {(time.time() - start) / 60} minutes"
+    )
+
+
 def _copy_unupdated_parameters(
     all_parameter_groups: Iterable[str],
     updated_parameter_groups: Iterable[str],
@@ -512,11 +922,12 @@ def _copy_unupdated_parameters(
         set(all_parameter_groups) - set(updated_parameter_groups)
     )
 
-    # Copy the non-updated parameter groups from source to target for each active realization
+    # Copy the non-updated parameter groups from source to target for the active
+    # realizations, letting storage link the files rather than re-encoding them
     for parameter_group in not_updated_parameter_groups:
-        for realization in iens_active_index:
-            ds = source_ensemble.load_parameters(parameter_group, realization)
-            target_ensemble.save_parameters(parameter_group, realization, ds)
+        target_ensemble.copy_parameters_from(
+            source_ensemble, parameter_group, iens_active_index
+        )
 
 
 def analysis_ES(
@@ -534,6 +945,8 @@ def analysis_ES(
     progress_callback: Callable[[AnalysisEvent], None],
     auto_scale_observations: Optional[List[ObservationGroups]],
 ) -> None:
+    # Parameter groups may be updated on worker threads
+    progress_callback = _ForwardedProgress(progress_callback)
     iens_active_index = np.flatnonzero(ens_mask)
 
     ensemble_size = ens_mask.sum()
@@ -609,16 +1022,26 @@ def adaptive_localization_progress_callback(
         # Add identity in place for fast computation
         np.fill_diagonal(T, T.diagonal() + 1)
 
+    # Groups may be updated in parallel, so the cross correlations are saved
+    # once all groups have been updated
+    cross_correlations_by_group: Dict[
+        str, Tuple[npt.NDArray[np.float64], List[str]]
+    ] = {}
+
     def correlation_callback(
         cross_correlations_of_batch: npt.NDArray[np.float64],
         cross_correlations_accumulator: List[npt.NDArray[np.float64]],
     ) -> None:
         cross_correlations_accumulator.append(cross_correlations_of_batch)
 
-    for param_group in parameters:
-        param_ensemble_array = _load_param_ensemble_array(
+    def load_param_group(param_group: str) -> npt.NDArray[np.float64]:
+        return _load_param_ensemble_array(
             source_ensemble, param_group, iens_active_index
         )
+
+    def update_param_group(
+        param_group: str, param_ensemble_array: npt.NDArray[np.float64]
+    ) -> npt.NDArray[np.float64]:
         if module.localization:
             config_node = source_ensemble.experiment.parameter_configuration[
                 param_group
@@ -663,9 +1086,8 @@ def correlation_callback(
                 ]
                 _cross_correlations = np.vstack(cross_correlations)
                 if _cross_correlations.size != 0:
-                    source_ensemble.save_cross_correlations(
+                    cross_correlations_by_group[param_group] = (
                         _cross_correlations,
-                        param_group,
                         parameter_names[: _cross_correlations.shape[0]],
                     )
             logger.info(
@@ -677,27 +1099,91 @@ def correlation_callback(
             param_ensemble_array = param_ensemble_array @ T.astype(  # noqa: PLR6104
                 param_ensemble_array.dtype
             )
+        return param_ensemble_array
 
+    def save_param_group(
+        param_group: str, param_ensemble_array: npt.NDArray[np.float64]
+    ) -> None:
         log_msg = f"Storing data for {param_group}.."
         logger.info(log_msg)
         progress_callback(AnalysisStatusEvent(msg=log_msg))
         start = time.time()
 
         _save_param_ensemble_array_to_disk(
-            target_ensemble, param_ensemble_array, param_group, iens_active_index
+            target_ensemble,
+            param_ensemble_array,
+            param_group,
+            iens_active_index,
+            progress_callback,
         )
         logger.info(
             f"Storing data for {param_group} completed in {(time.time() - start) / 60} minutes"
         )
 
-        _copy_unupdated_parameters(
-            list(source_ensemble.experiment.parameter_configuration.keys()),
-            parameters,
-            iens_active_index,
+    # Groups whose update does not fit within the memory budget are streamed
+    # from storage in blocks of rows instead of being loaded whole
+    parameters = list(parameters)
+    memory_budget = _memory_budget_bytes(module)
+    chunked_groups = (
+        []
+        if module.localization or memory_budget is None
+        else [
+            param_group
+            for param_group in parameters
+            if _estimated_update_bytes(
+                source_ensemble.experiment.parameter_configuration[param_group],
+                ensemble_size,
+            )
+            > memory_budget
+        ]
+    )
+    _update_param_groups(
+        [
+            param_group
+            for param_group in parameters
+            if param_group not in chunked_groups
+        ],
+        load_param_group,
+        update_param_group,
+        save_param_group,
+        source_ensemble,
+        ensemble_size,
+        module,
+        progress_callback,
+    )
+    # As when the groups are updated one after the other, the correlations
+    # of the last group that has them are the ones saved
+    if correlated_groups := [
+        param_group
+        for param_group in parameters
+        if param_group in cross_correlations_by_group
+    ]:
+        correlations, parameter_names = cross_correlations_by_group[
+            correlated_groups[-1]
+        ]
+        source_ensemble.save_cross_correlations(
+            correlations, correlated_groups[-1], parameter_names
+        )
+    for param_group in chunked_groups:
+        assert memory_budget is not None
+        _update_param_group_in_chunks(
             source_ensemble,
             target_ensemble,
+            param_group,
+            iens_active_index,
+            T,
+            memory_budget,
+            progress_callback,
         )
 
+    _copy_unupdated_parameters(
+        list(source_ensemble.experiment.parameter_configuration.keys()),
+        parameters,
+        iens_active_index,
+        source_ensemble,
+        target_ensemble,
+    )
+
 
 def analysis_IES(
     parameters: Iterable[str],
@@ -716,6 +1202,8 @@ def analysis_IES(
     sies_step_length: Callable[[int], float],
     initial_mask: npt.NDArray[np.bool_],
 ) -> ies.SIES:
+    # Parameter groups may be updated on worker threads
+    progress_callback = _ForwardedProgress(progress_callback)
     iens_active_index = np.flatnonzero(ens_mask)
     # Pick out realizations that were among the initials that are still living
     # Example: initial_mask=[1,1,1,0,1], ens_mask=[0,1,1,0,1]
@@ -786,19 +1274,43 @@ def analysis_IES(
     # Store transition matrix for later use on sies object
     sies_smoother.W[:, masking_of_initial_parameters] = proposed_W
 
-    for param_group in parameters:
-        param_ensemble_array = _load_param_ensemble_array(
+    def load_param_group(param_group: str) -> npt.NDArray[np.float64]:
+        return _load_param_ensemble_array(
             source_ensemble, param_group, iens_active_index
         )
+
+    def update_param_group(
+        param_group: str, param_ensemble_array: npt.NDArray[np.float64]
+    ) -> npt.NDArray[np.float64]:
+        assert sies_smoother is not None
         param_ensemble_array += (
             param_ensemble_array @ sies_smoother.W / np.sqrt(len(iens_active_index) - 1)
         )
+        return param_ensemble_array
 
+    def save_param_group(
+        param_group: str, param_ensemble_array: npt.NDArray[np.float64]
+    ) -> None:
         progress_callback(AnalysisStatusEvent(msg=f"Storing data for {param_group}.."))
         _save_param_ensemble_array_to_disk(
-            target_ensemble, param_ensemble_array, param_group, iens_active_index
+            target_ensemble,
+            param_ensemble_array,
+            param_group,
+            iens_active_index,
+            progress_callback,
         )
 
+    _update_param_groups(
+        parameters,
+        load_param_group,
+        update_param_group,
+        save_param_group,
+        source_ensemble,
+        len(iens_active_index),
+        analysis_config,
+        progress_callback,
+    )
+
     _copy_unupdated_parameters(
         list(source_ensemble.experiment.parameter_configuration.keys()),
         parameters,
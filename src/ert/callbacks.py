@@ -3,7 +3,9 @@
 import asyncio
 import logging
 import time
+from concurrent.futures import Executor
 from pathlib import Path
+from typing import Optional
 
 from ert.config import InvalidResponseFile
 from ert.storage import Ensemble
@@ -14,7 +16,7 @@
 logger = logging.getLogger(__name__)
 
 
-async def _read_parameters(
+def _read_parameters(
     run_path: str,
     realization: int,
     iteration: int,
@@ -30,14 +32,12 @@ async def _read_parameters(
             start_time = time.perf_counter()
             logger.debug(f"Starting to load parameter: {config.name}")
             ds = config.read_from_runpath(Path(run_path), realization, iteration)
-            await asyncio.sleep(0)
             logger.debug(
                 f"Loaded {config.name}",
                 extra={"Time": f"{(time.perf_counter() - start_time):.4f}s"},
             )
             start_time = time.perf_counter()
             ensemble.save_parameters(config.name, realization, ds)
-            await asyncio.sleep(0)
             logger.debug(
                 f"Saved {config.name} to storage",
                 extra={"Time": f"{(time.perf_counter() - start_time):.4f}s"},
@@ -49,7 +49,7 @@ async def _read_parameters(
     return result
 
 
-async def _write_responses_to_storage(
+def _write_responses_to_storage(
     run_path: str,
     realization: int,
     ensemble: Ensemble,
@@ -66,14 +66,12 @@ async def _write_responses_to_storage(
                 errors.append(str(err))
                 logger.warning(f"Failed to write: {realization}: {err}")
                 continue
-            await asyncio.sleep(0)
             logger.debug(
                 f"Loaded {config.response_type}",
                 extra={"Time": f"{(time.perf_counter() - start_time):.4f}s"},
             )
             start_time = time.perf_counter()
             ensemble.save_response(config.response_type, ds, realization)
-            await asyncio.sleep(0)
             logger.debug(
                 f"Saved {config.response_type} to storage",
                 extra={"Time": f"{(time.perf_counter() - start_time):.4f}s"},
@@ -96,6 +94,22 @@ async def forward_model_ok(
     realization: int,
     iter: int,
     ensemble: Ensemble,
+    executor: Optional[Executor] = None,
+) -> LoadResult:
+    """Loads the parameters and responses of a finished realization into
+    storage. The files are read and written by a worker of executor, or of the
+    default executor of the event loop, so that several realizations can be
+    loaded concurrently without blocking the event loop."""
+    return await asyncio.get_running_loop().run_in_executor(
+        executor, _forward_model_ok, run_path, realization, iter, ensemble
+    )
+
+
+def _forward_model_ok(
+    run_path: str,
+    realization: int,
+    iter: int,
+    ensemble: Ensemble,
 ) -> LoadResult:
     parameters_result = LoadResult(LoadStatus.LOAD_SUCCESSFUL, "")
     response_result = LoadResult(LoadStatus.LOAD_SUCCESSFUL, "")
@@ -103,7 +117,7 @@ async def forward_model_ok(
         # We only read parameters after the prior, after that, ERT
         # handles parameters
         if iter == 0:
-            parameters_result = await _read_parameters(
+            parameters_result = _read_parameters(
                 run_path,
                 realization,
                 iter,
@@ -111,7 +125,7 @@ async def forward_model_ok(
             )
 
         if parameters_result.status == LoadStatus.LOAD_SUCCESSFUL:
-            response_result = await _write_responses_to_storage(
+            response_result = _write_responses_to_storage(
                 run_path,
                 realization,
                 ensemble,
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 import fnmatch
+import hashlib
 import os
 import os.path
 import re
+import threading
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from enum import Enum, auto
 from typing import (
@@ -188,7 +191,7 @@ def _get_summary_filenames(filepath: str) -> Tuple[str, str]:
 
 def read_summary(
     filepath: str, fetch_keys: Sequence[str]
-) -> Tuple[datetime, List[str], Sequence[datetime], Any]:
+) -> Tuple[datetime, List[str], npt.NDArray[np.datetime64], Any]:
     summary, spec = _get_summary_filenames(filepath)
     try:
         date_index, start_date, date_units, keys, indices = _read_spec(spec, fetch_keys)
@@ -248,9 +251,44 @@ def _fetch_keys_to_matcher(fetch_keys: Sequence[str]) -> Callable[[str], bool]:
     return lambda s: regex.fullmatch(s) is not None
 
 
-def _read_spec(
-    spec: str, fetch_keys: Sequence[str]
-) -> Tuple[int, datetime, DateUnit, List[str], npt.NDArray[np.int64]]:
+_SpecIndex = Tuple[int, datetime, DateUnit, List[str], npt.NDArray[np.int64]]
+
+_SPEC_CACHE_SIZE = 32
+_spec_cache: OrderedDict[Tuple[bytes, bool, Tuple[str, ...]], _SpecIndex] = (
+    OrderedDict()
+)
+_spec_cache_lock = threading.Lock()
+
+
+def _read_spec(spec: str, fetch_keys: Sequence[str]) -> _SpecIndex:
+    """
+    Reads the summary specification and resolves which of its vectors
+    match fetch_keys.
+
+    The realizations of an ensemble almost always share the same summary
+    specification, so the resolved index is cached by the content of the
+    file and the keys, and the specification is only parsed and matched
+    once per process.
+    """
+    with open(spec, "rb") as fp:
+        fingerprint = hashlib.sha256(fp.read()).digest()
+    cache_key = (fingerprint, spec.lower().endswith("fsmspec"), tuple(fetch_keys))
+    with _spec_cache_lock:
+        cached = _spec_cache.get(cache_key)
+        if cached is not None:
+            _spec_cache.move_to_end(cache_key)
+    if cached is None:
+        cached = _parse_spec(spec, fetch_keys)
+        cached[4].flags.writeable = False
+        with _spec_cache_lock:
+            _spec_cache[cache_key] = cached
+            while len(_spec_cache) > _SPEC_CACHE_SIZE:
+                _spec_cache.popitem(last=False)
+    date_index, start_date, date_unit, keys, indices = cached
+    return date_index, start_date, date_unit, list(keys), indices
+
+
+def _parse_spec(spec: str, fetch_keys: Sequence[str]) -> _SpecIndex:
     date = None
     n = None
     nx = None
@@ -402,17 +440,126 @@ def optional_get(arr: Optional[npt.NDArray[Any]], idx: int) -> Any:
     )
 
 
-def _round_to_seconds(dt: datetime) -> datetime:
+def _make_dates(
+    start_date: datetime, unit: DateUnit, offsets: npt.NDArray[np.float32]
+) -> npt.NDArray[np.datetime64]:
     """
-    >>> _round_to_seconds(datetime(2000, 1, 1, 1, 0, 1, 1))
-    datetime.datetime(2000, 1, 1, 1, 0, 1)
-    >>> _round_to_seconds(datetime(2000, 1, 1, 1, 0, 1, 500001))
-    datetime.datetime(2000, 1, 1, 1, 0, 2)
-    >>> _round_to_seconds(datetime(2000, 1, 1, 1, 0, 1, 499999))
-    datetime.datetime(2000, 1, 1, 1, 0, 1)
+    The dates ``start_date + unit.make_delta(offset)`` of all offsets,
+    rounded to whole seconds, as one datetime64 vector in milliseconds.
+
+    >>> _make_dates(datetime(2000, 1, 1), DateUnit.DAYS, np.array([0.5, 1.0]))
+    array(['2000-01-01T12:00:00.000', '2000-01-02T00:00:00.000'],
+          dtype='datetime64[ms]')
+    >>> _make_dates(datetime(2000, 1, 1), DateUnit.HOURS, np.array([1.5]))
+    array(['2000-01-01T01:30:00.000'], dtype='datetime64[ms]')
     """
-    extra_sec = round(dt.microsecond / 10**6)
-    return dt.replace(microsecond=0) + timedelta(seconds=extra_sec)
+    microseconds = np.round(
+        offsets.astype(np.float64) * (unit.make_delta(1.0) / timedelta(microseconds=1))
+    ).astype(np.int64)
+    # Due to https://github.com/equinor/ert/issues/6952
+    # times have to be rounded to whole seconds to avoid overflow
+    # in netcdf3 files
+    seconds, remainder = np.divmod(microseconds, 10**6)
+    seconds += np.round(remainder / 10**6).astype(np.int64)
+    return np.datetime64(start_date, "ms") + seconds.astype("timedelta64[s]")
+
+
+_PARAMS_GROUP_LEN = 1000
+_PARAMS_DTYPE = np.dtype(">f4")
+
+
+def _find_params(summary: str) -> Tuple[List[int], Optional[int]]:
+    """
+    Finds the byte offsets of the PARAMS records that end each report step
+    of an unformatted summary file, without reading their values.
+
+    Returns the offsets and the common length of the records, or None as
+    length if the records are not all REAL arrays of the same length.
+    """
+    offsets: List[int] = []
+    lengths = set()
+    last_params = None
+
+    with open(summary, "rb") as fp:
+        for entry in resfo.lazy_read(fp, resfo.Format.UNFORMATTED):
+            kw = entry.read_keyword()
+            if kw == "PARAMS  ":
+                last_params = entry
+            if kw == "SEQHDR  " and last_params is not None:
+                offsets.append(last_params.start)
+                lengths.add((last_params.read_type(), last_params.read_length()))
+                last_params = None
+        if last_params is not None:
+            offsets.append(last_params.start)
+            lengths.add((last_params.read_type(), last_params.read_length()))
+
+    if len(lengths) != 1:
+        return offsets, None
+    ((params_type, length),) = lengths
+    if params_type not in (b"REAL", "REAL"):
+        return offsets, None
+    return offsets, length
+
+
+def _read_unformatted_params(
+    summary: str, indices: npt.NDArray[np.int64]
+) -> Optional[npt.NDArray[np.float32]]:
+    """
+    Reads the given indices of the PARAMS records that end each report step
+    of an unformatted summary file into a (len(indices), report steps) array.
+
+    The file is memory mapped and only the requested values are gathered
+    from a strided view of each record, so the cost is proportional to the
+    number of fetched values and not to the size of the file. Returns None
+    when the records do not have the regular layout this requires, in which
+    case the caller falls back to reading record by record.
+    """
+    offsets, length = _find_params(summary)
+    if not offsets or length is None or (len(indices) and indices.max() >= length):
+        return None
+
+    # Each record is a 24 byte header followed by the values in groups
+    # of 1000, each group enclosed in 4 byte record markers
+    group_bytes = _PARAMS_GROUP_LEN * _PARAMS_DTYPE.itemsize
+    full_groups, remainder = divmod(length, _PARAMS_GROUP_LEN)
+    n_groups = full_groups + (remainder > 0)
+    record_bytes = n_groups * 8 + length * _PARAMS_DTYPE.itemsize
+    group_sizes = np.full(n_groups, group_bytes, dtype=np.int32)
+    if remainder:
+        group_sizes[-1] = remainder * _PARAMS_DTYPE.itemsize
+
+    try:
+        mapped = np.memmap(summary, dtype=np.uint8, mode="r")
+    except ValueError:
+        return None
+    if offsets[-1] + 24 + record_bytes > mapped.size:
+        return None
+
+    groups, positions = np.divmod(indices, _PARAMS_GROUP_LEN)
+    byte_offsets = 4 + groups * (group_bytes + 8) + positions * 4
+
+    fetched = np.empty((len(offsets), len(indices)), dtype=np.float32)
+    for step, offset in enumerate(offsets):
+        markers: npt.NDArray[np.int32] = np.ndarray(
+            (n_groups,),
+            dtype=">i4",
+            buffer=mapped,
+            offset=offset + 24,
+            strides=(group_bytes + 8,),
+        )
+        if not np.array_equal(markers, group_sizes):
+            return None
+        # One (overlapping) element per byte of the record, so that
+        # values are picked out by their byte offsets
+        values: npt.NDArray[np.float32] = np.ndarray(
+            (record_bytes - _PARAMS_DTYPE.itemsize + 1,),
+            dtype=_PARAMS_DTYPE,
+            buffer=mapped,
+            offset=offset + 24,
+            strides=(1,),
+        )
+        fetched[step] = values[byte_offsets]
+    return fetched.T
 
 
 def _read_summary(
@@ -421,33 +568,27 @@ def _read_summary(
     unit: DateUnit,
     indices: npt.NDArray[np.int64],
     date_index: int,
-) -> Tuple[npt.NDArray[np.float32], List[datetime]]:
+) -> Tuple[npt.NDArray[np.float32], npt.NDArray[np.datetime64]]:
     if summary.lower().endswith("funsmry"):
         mode = "rt"
         format = resfo.Format.FORMATTED
     else:
         mode = "rb"
         format = resfo.Format.UNFORMATTED
+        fetched = _read_unformatted_params(summary, np.append(indices, date_index))
+        if fetched is not None:
+            return fetched[:-1], _make_dates(start_date, unit, fetched[-1])
 
     last_params = None
     values: List[npt.NDArray[np.float32]] = []
-    dates: List[datetime] = []
+    dates: List[float] = []
 
     def read_params() -> None:
         nonlocal last_params, values
         if last_params is not None:
             vals = _check_vals("PARAMS", summary, last_params.read_array())
             values.append(vals[indices])
-
-            dates.append(
-                _round_to_seconds(
-                    start_date + unit.make_delta(float(vals[date_index]))
-                ),
-            )
-            # Due to https://github.com/equinor/ert/issues/6952
-            # times have to be rounded to whole seconds to avoid overflow
-            # in netcdf3 files
-            # dates.append(start_date + unit.make_delta(float(vals[date_index])))
+            dates.append(vals[date_index])
             last_params = None
 
     with open(summary, mode) as fp:
@@ -458,4 +599,7 @@ def read_params() -> None:
             if kw == "SEQHDR  ":
                 read_params()
         read_params()
-    return np.array(values, dtype=np.float32).T, dates
+    return (
+        np.array(values, dtype=np.float32).T,
+        _make_dates(start_date, unit, np.array(dates, dtype=np.float32)),
+    )
@@ -5,7 +5,7 @@
 from math import ceil
 from os.path import realpath
 from pathlib import Path
-from typing import Any, Dict, Final, List, Optional, Union, no_type_check
+from typing import Any, Dict, Final, List, Literal, Optional, Union, no_type_check
 
 from pydantic import ValidationError
 
@@ -23,6 +23,7 @@
 
 DEFAULT_ANALYSIS_MODE = AnalysisMode.ENSEMBLE_SMOOTHER
 ObservationGroups = List[str]
+ParameterLayoutName = Literal["realization", "ensemble"]
 
 
 @dataclass
@@ -42,6 +43,7 @@ class AnalysisConfig:
     observation_settings: UpdateSettings = field(default_factory=UpdateSettings)
     num_iterations: int = 1
     design_matrix: Optional[DesignMatrix] = None
+    parameter_layout: ParameterLayoutName = "realization"
 
     @no_type_check
     @classmethod
@@ -83,6 +85,17 @@ def from_dict(cls, config_dict: ConfigDict) -> "AnalysisConfig":
 
         design_matrix_config_list = config_dict.get(ConfigKeys.DESIGN_MATRIX, None)
 
+        parameter_layout_str: str = config_dict.get(
+            ConfigKeys.PARAMETER_LAYOUT, "REALIZATION"
+        )
+        parameter_layout = parameter_layout_str.lower()
+        if parameter_layout not in ("realization", "ensemble"):
+            raise ConfigValidationError.with_context(
+                "PARAMETER_LAYOUT must be one of REALIZATION or ENSEMBLE, "
+                f"was {parameter_layout_str!r}",
+                parameter_layout_str,
+            )
+
         options: Dict[str, Dict[str, Any]] = {"STD_ENKF": {}, "IES_ENKF": {}}
         observation_settings: Dict[str, Any] = {
             "alpha": config_dict.get(ConfigKeys.ENKF_ALPHA, 3.0),
@@ -191,6 +204,7 @@ def from_dict(cls, config_dict: ConfigDict) -> "AnalysisConfig":
             max_runtime=config_dict.get(ConfigKeys.MAX_RUNTIME),
             minimum_required_realizations=min_realization,
             update_log_path=config_dict.get(ConfigKeys.UPDATE_LOG_PATH, "update_log"),
+            parameter_layout=parameter_layout,
             observation_settings=obs_settings,
             es_module=es_settings,
             ies_module=ies_settings,
@@ -231,4 +245,7 @@ def __eq__(self, other: object) -> bool:
         if self.es_module != other.es_module:
             return False
 
+        if self.parameter_layout != other.parameter_layout:
+            return False
+
         return self.minimum_required_realizations == other.minimum_required_realizations
@@ -15,6 +15,7 @@
 DEFAULT_IES_DEC_STEPLENGTH = 2.50
 DEFAULT_ENKF_TRUNCATION = 0.98
 DEFAULT_LOCALIZATION = False
+DEFAULT_UPDATE_WORKERS = 1
 
 
 class BaseSettings(BaseModel):
@@ -22,6 +23,14 @@ class BaseSettings(BaseModel):
         float,
         Field(gt=0.0, le=1.0, title="Singular value truncation"),
     ] = DEFAULT_ENKF_TRUNCATION
+    update_workers: Annotated[
+        int,
+        Field(ge=1, title="Parameter groups updated in parallel"),
+    ] = DEFAULT_UPDATE_WORKERS
+    update_memory_budget: Annotated[
+        Optional[float],
+        Field(gt=0.0, title="Memory budget for the update (GiB)"),
+    ] = None
 
     model_config = ConfigDict(extra="forbid", validate_assignment=True)
 
@@ -1,5 +1,6 @@
 # mypy: ignore-errors
 import copy
+import functools
 import importlib
 import logging
 import os
@@ -10,6 +11,7 @@
 from pathlib import Path
 from typing import (
     Any,
+    Callable,
     ClassVar,
     DefaultDict,
     Dict,
@@ -20,9 +22,9 @@
     Type,
     Union,
     no_type_check,
-    overload,
 )
 
+import orjson
 import polars
 from pydantic import ValidationError as PydanticValidationError
 from pydantic import field_validator
@@ -30,7 +32,7 @@
 from typing_extensions import Self
 
 from ert.plugins import ErtPluginManager
-from ert.substitutions import Substitutions
+from ert.substitutions import Substitutions, depends_on_realization
 
 from ._get_num_cpu import get_num_cpu_from_data_file
 from .analysis_config import AnalysisConfig
@@ -99,133 +101,303 @@ def create_forward_model_json(
     env_pr_fm_step: Optional[Dict[str, Dict[str, Any]]] = None,
     skip_pre_experiment_validation: bool = False,
 ) -> Dict[str, Any]:
-    if env_vars is None:
-        env_vars = {}
-    if env_pr_fm_step is None:
-        env_pr_fm_step = {}
+    return ForwardModelJSONTemplate(
+        context=context,
+        forward_model_steps=forward_model_steps,
+        user_config_file=user_config_file,
+        env_vars=env_vars,
+        env_pr_fm_step=env_pr_fm_step,
+        skip_pre_experiment_validation=skip_pre_experiment_validation,
+    ).render(run_id, iens, itr)
+
+
+def _substitute_realization_independent(
+    common: Substitutions,
+    private_args: Substitutions,
+    context_hint: str,
+    string: Optional[str],
+) -> Optional[str]:
+    if string is None:
+        return string
+    string = private_args.substitute(string, context_hint, 1, warn_max_iter=False)
+    return common.substitute(string)
+
+
+class _ForwardModelStepTemplate:
+    """A forward model step of the jobs.json template, which keeps track of
+    where the strings that depend on the realization are"""
+
+    def __init__(
+        self,
+        fm_step: ForwardModelStep,
+        fm_step_json: Dict[str, Any],
+        validate: bool,
+    ) -> None:
+        self.fm_step = fm_step
+        self.validate = validate
+        self.dependent_fields = [
+            name
+            for name in ForwardModelJSONTemplate.STRING_FIELDS
+            if _depends_on_realization(fm_step_json[name])
+        ]
+        self.dependent_args = [
+            index
+            for index, arg in enumerate(fm_step_json["argList"])
+            if _depends_on_realization(arg)
+        ]
+        self.dependent_envs = {}
+        for name in ("environment", "exec_env"):
+            env = [
+                (
+                    key,
+                    value,
+                    _depends_on_realization(key),
+                    _depends_on_realization(value),
+                )
+                for key, value in fm_step_json[name]
+            ]
+            if any(
+                key_dependent or value_dependent
+                for _, _, key_dependent, value_dependent in env
+            ):
+                self.dependent_envs[name] = env
+        self.base: ForwardModelStepJSON = {
+            **fm_step_json,
+            "argList": [
+                arg if index in self.dependent_args else _with_default(fm_step, arg)
+                for index, arg in enumerate(fm_step_json["argList"])
+            ],
+            "environment": _filter_env(
+                fm_step_json["environment"], defer_dependent=True
+            ),
+            "exec_env": _filter_env(fm_step_json["exec_env"], defer_dependent=True),
+        }
+
+    @property
+    def depends_on_realization(self) -> bool:
+        return bool(self.dependent_fields or self.dependent_args or self.dependent_envs)
+
+    def render(self, substitute: Callable[[str], str]) -> ForwardModelStepJSON:
+        if not self.depends_on_realization:
+            # Validation may modify the step, so it is given a copy
+            return copy.deepcopy(self.base) if self.validate else self.base
+        rendered = copy.deepcopy(self.base) if self.validate else dict(self.base)
+        for name in self.dependent_fields:
+            rendered[name] = substitute(rendered[name])
+        if self.dependent_args:
+            arg_list = list(rendered["argList"])
+            for index in self.dependent_args:
+                arg_list[index] = _with_default(
+                    self.fm_step, substitute(arg_list[index])
+                )
+            rendered["argList"] = arg_list
+        for name, env in self.dependent_envs.items():
+            rendered[name] = _filter_env(
+                [
+                    (
+                        substitute(key) if key_dependent else key,
+                        substitute(value) if value_dependent else value,
+                    )
+                    for key, value, key_dependent, value_dependent in env
+                ]
+            )
+        return rendered
+
+
+def _depends_on_realization(string: Optional[str]) -> bool:
+    return isinstance(string, str) and depends_on_realization(string)
+
+
+def _with_default(fm_step: ForwardModelStep, arg: str) -> str:
+    return fm_step.default_mapping.get(arg, arg)
+
+
+def _filter_env(
+    env: List[Tuple[str, Optional[str]]], defer_dependent: bool = False
+) -> Optional[Dict[str, Optional[str]]]:
+    result = {}
+    for key, value in env:
+        if value is None:
+            result[key] = None
+        elif defer_dependent and (
+            _depends_on_realization(key) or _depends_on_realization(value)
+        ):
+            # Filtered once the realization has been substituted
+            result[key] = value
+        elif not (value[0] == "<" and value[-1] == ">"):
+            # Remove values containing "<XXX>". These are expected to be
+            # replaced by substitute, but were not.
+            result[key] = value
+        else:
+            logger.warning(
+                f"Environment variable {key} skipped due to"
+                f" unmatched define {value}",
+            )
+    # Its expected that empty dicts be replaced with "null"
+    # in jobs.json
+    if not result:
+        return None
+    return result
+
+
+class ForwardModelJSONTemplate:
+    """
+    The contents of jobs.json with everything which does not depend on the
+    realization substituted, so that it can be created once for an ensemble.
+    Rendering it for a realization then only substitutes the strings which
+    still contain <IENS>, <ITER> or <GEO_ID>, and sets the run id.
+    """
+
+    STRING_FIELDS = (
+        "name",
+        "executable",
+        "target_file",
+        "error_file",
+        "start_file",
+        "stdout",
+        "stderr",
+        "stdin",
+    )
+
+    def __init__(
+        self,
+        context: Substitutions,
+        forward_model_steps: List[ForwardModelStep],
+        user_config_file: Optional[str] = "",
+        env_vars: Optional[Dict[str, str]] = None,
+        env_pr_fm_step: Optional[Dict[str, Dict[str, Any]]] = None,
+        skip_pre_experiment_validation: bool = False,
+    ) -> None:
+        if env_vars is None:
+            env_vars = {}
+        if env_pr_fm_step is None:
+            env_pr_fm_step = {}
+        self._context = context
+        self._env_vars = env_vars
+        common = context.realization_independent()
+
+        for fm_step in forward_model_steps:
+            for key, val in fm_step.private_args.items():
+                if key in context and key != val and context[key] != val:
+                    logger.info(
+                        f"Private arg '{key}':'{val}' chosen over"
+                        f" global '{context[key]}' in forward model step {fm_step.name}"
+                    )
+        config_file_path = (
+            Path(user_config_file) if user_config_file is not None else None
+        )
+        self._config_path = str(config_file_path.parent) if config_file_path else ""
+        self._config_file = str(config_file_path.name) if config_file_path else ""
 
-    class Substituter:
-        def __init__(self, fm_step):
+        self._steps: List[_ForwardModelStepTemplate] = []
+        for idx, fm_step in enumerate(forward_model_steps):
             fm_step_args = ",".join(
                 [f"{key}={value}" for key, value in fm_step.private_args.items()]
             )
             fm_step_description = f"{fm_step.name}({fm_step_args})"
-            self.substitution_context_hint = (
+            substitution_context_hint = (
                 f"parsing forward model step `FORWARD_MODEL {fm_step_description}` - "
                 "reconstructed, with defines applied during parsing"
             )
-            self.copy_private_args = Substitutions()
-            for key, val in fm_step.private_args.items():
-                self.copy_private_args[key] = context.substitute_real_iter(
-                    val, iens, itr
-                )
-
-        @overload
-        def substitute(self, string: str) -> str: ...
-
-        @overload
-        def substitute(self, string: None) -> None: ...
-
-        def substitute(self, string):
-            if string is None:
-                return string
-            string = self.copy_private_args.substitute(
-                string, self.substitution_context_hint, 1, warn_max_iter=False
+            private_args = Substitutions(
+                {
+                    key: common.substitute(val)
+                    for key, val in fm_step.private_args.items()
+                }
+            )
+            substitute = functools.partial(
+                _substitute_realization_independent,
+                common,
+                private_args,
+                substitution_context_hint,
             )
-            return context.substitute_real_iter(string, iens, itr)
-
-        def filter_env_dict(self, d):
-            result = {}
-            for key, value in d.items():
-                new_key = self.substitute(key)
-                new_value = self.substitute(value)
-                if new_value is None:
-                    result[new_key] = None
-                elif not (new_value[0] == "<" and new_value[-1] == ">"):
-                    # Remove values containing "<XXX>". These are expected to be
-                    # replaced by substitute, but were not.
-                    result[new_key] = new_value
-                else:
-                    logger.warning(
-                        f"Environment variable {new_key} skipped due to"
-                        f" unmatched define {new_value}",
-                    )
-            # Its expected that empty dicts be replaced with "null"
-            # in jobs.json
-            if not result:
-                return None
-            return result
-
-    def handle_default(fm_step: ForwardModelStep, arg: str) -> str:
-        return fm_step.default_mapping.get(arg, arg)
-
-    for fm_step in forward_model_steps:
-        for key, val in fm_step.private_args.items():
-            if key in context and key != val and context[key] != val:
-                logger.info(
-                    f"Private arg '{key}':'{val}' chosen over"
-                    f" global '{context[key]}' in forward model step {fm_step.name}"
-                )
-    config_file_path = Path(user_config_file) if user_config_file is not None else None
-    config_path = str(config_file_path.parent) if config_file_path else ""
-    config_file = str(config_file_path.name) if config_file_path else ""
-
-    job_list_errors = []
-    job_list: List[ForwardModelStepJSON] = []
-    for idx, fm_step in enumerate(forward_model_steps):
-        substituter = Substituter(fm_step)
-        fm_step_json = {
-            "name": substituter.substitute(fm_step.name),
-            "executable": substituter.substitute(fm_step.executable),
-            "target_file": substituter.substitute(fm_step.target_file),
-            "error_file": substituter.substitute(fm_step.error_file),
-            "start_file": substituter.substitute(fm_step.start_file),
-            "stdout": (
-                substituter.substitute(fm_step.stdout_file) + f".{idx}"
-                if fm_step.stdout_file
-                else None
-            ),
-            "stderr": (
-                substituter.substitute(fm_step.stderr_file) + f".{idx}"
-                if fm_step.stderr_file
-                else None
-            ),
-            "stdin": substituter.substitute(fm_step.stdin_file),
-            "argList": [
-                handle_default(fm_step, substituter.substitute(arg))
-                for arg in fm_step.arglist
-            ],
-            "environment": substituter.filter_env_dict(
-                dict(env_pr_fm_step.get(fm_step.name, {}), **fm_step.environment)
-            ),
-            "exec_env": substituter.filter_env_dict(fm_step.exec_env),
-            "max_running_minutes": fm_step.max_running_minutes,
-        }
 
-        try:
-            if not skip_pre_experiment_validation:
-                fm_step_json = fm_step.validate_pre_realization_run(fm_step_json)
-        except ForwardModelStepValidationError as exc:
-            job_list_errors.append(
-                ErrorInfo(
-                    message=f"Validation failed for "
-                    f"forward model step {fm_step.name}: {exc!s}"
-                ).set_context(fm_step.name)
+            fm_step_json = {
+                "name": substitute(fm_step.name),
+                "executable": substitute(fm_step.executable),
+                "target_file": substitute(fm_step.target_file),
+                "error_file": substitute(fm_step.error_file),
+                "start_file": substitute(fm_step.start_file),
+                "stdout": (
+                    substitute(fm_step.stdout_file) + f".{idx}"
+                    if fm_step.stdout_file
+                    else None
+                ),
+                "stderr": (
+                    substitute(fm_step.stderr_file) + f".{idx}"
+                    if fm_step.stderr_file
+                    else None
+                ),
+                "stdin": substitute(fm_step.stdin_file),
+                "argList": [substitute(arg) for arg in fm_step.arglist],
+                "environment": [
+                    (substitute(key), substitute(value))
+                    for key, value in dict(
+                        env_pr_fm_step.get(fm_step.name, {}), **fm_step.environment
+                    ).items()
+                ],
+                "exec_env": [
+                    (substitute(key), substitute(value))
+                    for key, value in fm_step.exec_env.items()
+                ],
+                "max_running_minutes": fm_step.max_running_minutes,
+            }
+            validate = not skip_pre_experiment_validation and (
+                type(fm_step).validate_pre_realization_run
+                is not ForwardModelStep.validate_pre_realization_run
+            )
+            self._steps.append(
+                _ForwardModelStepTemplate(fm_step, fm_step_json, validate)
             )
 
-        job_list.append(fm_step_json)
+    def render(
+        self, run_id: Optional[str], iens: int = 0, itr: int = 0
+    ) -> Dict[str, Any]:
+        # The same few strings, like the run path, are typically used by
+        # many steps, so each is only substituted once
+        substituted: Dict[str, str] = {}
+
+        def substitute(string: str) -> str:
+            if string not in substituted:
+                substituted[string] = self._context.substitute_real_iter(
+                    string, iens, itr
+                )
+            return substituted[string]
 
-    if job_list_errors:
-        raise ConfigValidationError.from_collected(job_list_errors)
+        job_list_errors = []
+        job_list: List[ForwardModelStepJSON] = []
+        for step in self._steps:
+            fm_step_json = step.render(substitute)
+            if step.validate:
+                try:
+                    fm_step_json = step.fm_step.validate_pre_realization_run(
+                        fm_step_json
+                    )
+                except ForwardModelStepValidationError as exc:
+                    job_list_errors.append(
+                        ErrorInfo(
+                            message=f"Validation failed for "
+                            f"forward model step {step.fm_step.name}: {exc!s}"
+                        ).set_context(step.fm_step.name)
+                    )
+            job_list.append(fm_step_json)
+
+        if job_list_errors:
+            raise ConfigValidationError.from_collected(job_list_errors)
+
+        return {
+            "global_environment": self._env_vars,
+            "config_path": self._config_path,
+            "config_file": self._config_file,
+            "jobList": job_list,
+            "run_id": run_id,
+            "ert_pid": str(os.getpid()),
+        }
 
-    return {
-        "global_environment": env_vars,
-        "config_path": config_path,
-        "config_file": config_file,
-        "jobList": job_list,
-        "run_id": run_id,
-        "ert_pid": str(os.getpid()),
-    }
+    def render_json(self, run_id: Optional[str], iens: int = 0, itr: int = 0) -> bytes:
+        return orjson.dumps(
+            self.render(run_id, iens, itr), option=orjson.OPT_NON_STR_KEYS
+        )
 
 
 def forward_model_data_to_json(
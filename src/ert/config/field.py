@@ -199,18 +199,41 @@ def save_parameters(
         ds = xr.Dataset({"values": (["x", "y", "z"], ma.filled())})  # type: ignore
         ensemble.save_parameters(group, realization, ds)
 
+    def save_parameters_many(
+        self,
+        ensemble: Ensemble,
+        group: str,
+        realizations: npt.NDArray[np.int_],
+        data: npt.NDArray[np.float64],
+    ) -> None:
+        values = np.full((len(realizations), self.mask.size), np.nan)
+        values[:, self.active_index] = data.T
+        ds = xr.Dataset(
+            {
+                "values": (
+                    ["realizations", "x", "y", "z"],
+                    values.reshape(-1, *self.mask.shape),
+                )
+            }
+        )
+        ensemble.save_parameters_many(group, realizations, ds)
+
     def load_parameters(
         self, ensemble: Ensemble, group: str, realizations: npt.NDArray[np.int_]
     ) -> npt.NDArray[np.float64]:
-        ds = ensemble.load_parameters(group, realizations)
-        ensemble_size = len(ds.realizations)
-        da = xr.DataArray(
-            [
-                np.ma.MaskedArray(data=d, mask=self.mask).compressed()  # type: ignore
-                for d in ds["values"].values.reshape(ensemble_size, -1)
-            ]
+        return ensemble.load_parameters_numpy(group, realizations, self.active_index)
+
+    def load_parameter_rows(
+        self,
+        ensemble: Ensemble,
+        group: str,
+        realizations: npt.NDArray[np.int_],
+        rows: npt.NDArray[np.int_],
+        block_bytes: Optional[int] = None,
+    ) -> npt.NDArray[np.float64]:
+        return ensemble.load_parameters_numpy(
+            group, realizations, self.active_index[rows], block_bytes
         )
-        return da.T.to_numpy()
 
     def _fetch_from_ensemble(self, real_nr: int, ensemble: Ensemble) -> xr.DataArray:
         da = ensemble.load_parameters(self.name, real_nr)["values"]
@@ -249,6 +272,11 @@ def mask(self) -> Any:
             )
         return np.load(self.mask_file)
 
+    @cached_property
+    def active_index(self) -> npt.NDArray[np.int_]:
+        """Indices of the active cells in the flattened field"""
+        return np.flatnonzero(~self.mask.ravel())
+
 
 TRANSFORM_FUNCTIONS = {
     "LN": np.log,
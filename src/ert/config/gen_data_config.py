@@ -1,10 +1,13 @@
 import dataclasses
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import List, Optional, Tuple, Union
 
 import numpy as np
+import numpy.typing as npt
 import polars
 from typing_extensions import Self
 
@@ -120,61 +123,69 @@ def from_config_dict(cls, config_dict: ConfigDict) -> Optional[Self]:
         )
 
     def read_from_file(self, run_path: str, iens: int, iter: int) -> polars.DataFrame:
-        def _read_file(filename: Path, report_step: int) -> polars.DataFrame:
-            try:
-                data = np.loadtxt(filename, ndmin=1)
-            except ValueError as err:
-                raise InvalidResponseFile(str(err)) from err
-            active_information_file = filename.parent / (filename.name + "_active")
-            if active_information_file.exists():
-                try:
-                    active_list = np.loadtxt(active_information_file)
-                except ValueError as err:
-                    raise InvalidResponseFile(str(err)) from err
-                data[active_list == 0] = np.nan
-            return polars.DataFrame(
-                {
-                    "report_step": polars.Series(
-                        np.full(len(data), report_step), dtype=polars.UInt16
-                    ),
-                    "index": polars.Series(np.arange(len(data)), dtype=polars.UInt16),
-                    "values": polars.Series(data, dtype=polars.Float32),
-                }
-            )
-
-        errors = []
-
         _run_path = Path(run_path)
-        datasets_per_name = []
+        key_indices = []
+        report_steps_per_file = []
+        filenames = []
 
-        for name, input_file, report_steps in zip(
-            self.keys, self.input_files, self.report_steps_list, strict=False
+        for key_index, (_, input_file, report_steps) in enumerate(
+            zip(self.keys, self.input_files, self.report_steps_list, strict=False)
         ):
-            datasets_per_report_step = []
             if report_steps is None:
-                try:
-                    filename = substitute_runpath_name(input_file, iens, iter)
-                    datasets_per_report_step.append(_read_file(_run_path / filename, 0))
-                except (InvalidResponseFile, FileNotFoundError) as err:
-                    errors.append(err)
+                key_indices.append(key_index)
+                report_steps_per_file.append(0)
+                filenames.append(
+                    _run_path / substitute_runpath_name(input_file, iens, iter)
+                )
             else:
                 for report_step in report_steps:
-                    filename = substitute_runpath_name(
-                        input_file % report_step, iens, iter
+                    key_indices.append(key_index)
+                    report_steps_per_file.append(report_step)
+                    filenames.append(
+                        _run_path
+                        / substitute_runpath_name(input_file % report_step, iens, iter)
                     )
-                    try:
-                        datasets_per_report_step.append(
-                            _read_file(_run_path / filename, report_step)
-                        )
-                    except (InvalidResponseFile, FileNotFoundError) as err:
-                        errors.append(err)
-
-            if len(datasets_per_report_step) > 0:
-                ds_all_report_steps = polars.concat(datasets_per_report_step)
-                ds_all_report_steps.insert_column(
-                    0, polars.Series("response_key", [name] * len(ds_all_report_steps))
-                )
-                datasets_per_name.append(ds_all_report_steps)
+
+        def _read_files(
+            filenames: List[Path],
+        ) -> List[Union[Tuple[bytes, Optional[bytes]], FileNotFoundError]]:
+            contents: List[Union[Tuple[bytes, Optional[bytes]], FileNotFoundError]] = []
+            for filename in filenames:
+                try:
+                    contents.append(_read_gen_data_file(filename))
+                except FileNotFoundError as err:
+                    contents.append(err)
+            return contents
+
+        # Only the reads are done in the thread pool, in one batch of files
+        # per task, as the parsing holds the GIL and is done here
+        if len(filenames) >= _PARALLEL_READ_MIN_FILES:
+            batch_size = -(-len(filenames) // _MAX_READ_WORKERS)
+            with ThreadPoolExecutor(max_workers=_MAX_READ_WORKERS) as executor:
+                contents = [
+                    content
+                    for batch in executor.map(
+                        _read_files,
+                        [
+                            filenames[i : i + batch_size]
+                            for i in range(0, len(filenames), batch_size)
+                        ],
+                    )
+                    for content in batch
+                ]
+        else:
+            contents = _read_files(filenames)
+
+        errors: List[Union[InvalidResponseFile, FileNotFoundError]] = []
+        values = []
+        for content in contents:
+            if isinstance(content, FileNotFoundError):
+                errors.append(content)
+                continue
+            try:
+                values.append(_parse_gen_data(*content))
+            except InvalidResponseFile as err:
+                errors.append(err)
 
         if errors:
             if all(isinstance(err, FileNotFoundError) for err in errors):
@@ -188,8 +199,28 @@ def _read_file(filename: Path, report_step: int) -> polars.DataFrame:
                     f"{self.name}, errors: {','.join([str(err) for err in errors])}"
                 )
 
-        combined = polars.concat(datasets_per_name)
-        return combined
+        if not values:
+            raise InvalidResponseFile(
+                f"No files were given to read GEN_DATA {self.name} from"
+            )
+
+        lengths = np.array([len(v) for v in values], dtype=np.int64)
+        offsets = np.cumsum(lengths) - lengths
+        return polars.DataFrame(
+            {
+                "response_key": polars.Series(self.keys, dtype=polars.String).gather(
+                    np.repeat(np.array(key_indices, dtype=np.uint32), lengths)
+                ),
+                "report_step": polars.Series(
+                    np.repeat(report_steps_per_file, lengths), dtype=polars.UInt16
+                ),
+                "index": polars.Series(
+                    np.arange(lengths.sum()) - np.repeat(offsets, lengths),
+                    dtype=polars.UInt16,
+                ),
+                "values": polars.Series(np.concatenate(values), dtype=polars.Float32),
+            }
+        )
 
     def get_args_for_key(self, key: str) -> Tuple[Optional[str], Optional[List[int]]]:
         for i, _key in enumerate(self.keys):
@@ -207,4 +238,69 @@ def primary_key(self) -> List[str]:
         return ["report_step", "index"]
 
 
+# Above this many files per realization, GEN_DATA files are read from a
+# thread pool so that the file system latency of each read overlaps
+_PARALLEL_READ_MIN_FILES = 32
+_MAX_READ_WORKERS = 8
+
+
+def _read_gen_data_file(filename: Path) -> Tuple[bytes, Optional[bytes]]:
+    """
+    Reads the contents of a GEN_DATA file and of its ``_active`` file,
+    if there is one.
+    """
+    try:
+        content = filename.read_bytes()
+    except FileNotFoundError as err:
+        raise FileNotFoundError(f"{filename} not found.") from err
+    try:
+        active_content = (filename.parent / (filename.name + "_active")).read_bytes()
+    except FileNotFoundError:
+        active_content = None
+    return content, active_content
+
+
+def _parse_values(content: bytes) -> npt.NDArray[np.float64]:
+    """
+    Parses whitespace separated numbers, ignoring comments starting with #,
+    as np.loadtxt(..., ndmin=1) does for GEN_DATA files but without its
+    per call overhead.
+
+    >>> _parse_values(b"# header\\n1.0\\n-2.5e-1 # comment\\n nan\\n")
+    array([ 1.  , -0.25,   nan])
+    """
+    if b"#" in content:
+        content = re.sub(rb"#[^\n]*", b"", content)
+    tokens = content.split()
+    try:
+        return np.array(tokens, dtype=np.float64)
+    except ValueError as err:
+        # Rows are counted from 0 and columns from 1, skipping empty lines,
+        # as in the errors of np.loadtxt
+        row = 0
+        for line in content.splitlines():
+            columns = line.split()
+            if not columns:
+                continue
+            for column, token in enumerate(columns, start=1):
+                try:
+                    float(token)
+                except ValueError:
+                    raise InvalidResponseFile(
+                        f"could not convert string {token.decode('latin-1')!r} "
+                        f"to float64 at row {row}, column {column}."
+                    ) from err
+            row += 1
+        raise InvalidResponseFile(str(err)) from err
+
+
+def _parse_gen_data(
+    content: bytes, active_content: Optional[bytes]
+) -> npt.NDArray[np.float64]:
+    data = _parse_values(content)
+    if active_content is not None:
+        data[_parse_values(active_content) == 0] = np.nan
+    return data
+
+
 responses_index.add_response_type(GenDataConfig)
@@ -342,11 +342,40 @@ def save_parameters(
         )
         ensemble.save_parameters(group, realization, ds)
 
+    def save_parameters_many(
+        self,
+        ensemble: Ensemble,
+        group: str,
+        realizations: npt.NDArray[np.int_],
+        data: npt.NDArray[np.float64],
+    ) -> None:
+        ds = xr.Dataset(
+            {
+                "values": (["realizations", "names"], data.T),
+                "transformed_values": (
+                    ["realizations", "names"],
+                    np.stack([self.transform(column) for column in data.T]),
+                ),
+                "names": [e.name for e in self.transform_functions],
+            }
+        )
+        ensemble.save_parameters_many(group, realizations, ds)
+
     @staticmethod
     def load_parameters(
         ensemble: Ensemble, group: str, realizations: npt.NDArray[np.int_]
     ) -> npt.NDArray[np.float64]:
-        return ensemble.load_parameters(group, realizations)["values"].values.T
+        return ensemble.load_parameters_numpy(group, realizations)
+
+    @staticmethod
+    def load_parameter_rows(
+        ensemble: Ensemble,
+        group: str,
+        realizations: npt.NDArray[np.int_],
+        rows: npt.NDArray[np.int_],
+        block_bytes: Optional[int] = None,
+    ) -> npt.NDArray[np.float64]:
+        return ensemble.load_parameters_numpy(group, realizations, rows, block_bytes)
 
     def shouldUseLogScale(self, keyword: str) -> bool:
         for tf in self.transform_functions:
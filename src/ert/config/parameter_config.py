@@ -98,6 +98,21 @@ def save_parameters(
         Save the parameter in internal storage for the given ensemble
         """
 
+    def save_parameters_many(
+        self,
+        ensemble: Ensemble,
+        group: str,
+        realizations: npt.NDArray[np.int_],
+        data: npt.NDArray[np.float64],
+    ) -> None:
+        """
+        Save the parameters of several realizations in internal storage for
+        the given ensemble. data has shape (number of parameters, number of
+        realizations), the same as returned by load_parameters.
+        """
+        for i, realization in enumerate(realizations):
+            self.save_parameters(ensemble, group, realization, data[:, i])
+
     @abstractmethod
     def load_parameters(
         self, ensemble: Ensemble, group: str, realizations: npt.NDArray[np.int_]
@@ -107,6 +122,21 @@ def load_parameters(
         Must return array of shape (number of parameters, number of realizations).
         """
 
+    def load_parameter_rows(
+        self,
+        ensemble: Ensemble,
+        group: str,
+        realizations: npt.NDArray[np.int_],
+        rows: npt.NDArray[np.int_],
+        block_bytes: Optional[int] = None,
+    ) -> npt.NDArray[np.float64]:
+        """
+        Load the given rows of the array returned by load_parameters, which
+        lets large parameters be processed in blocks. Storage that reads
+        several realizations at a time reads blocks of at most block_bytes.
+        """
+        return self.load_parameters(ensemble, group, realizations)[rows]
+
     def to_dict(self) -> Dict[str, Any]:
         data = dataclasses.asdict(self, dict_factory=CustomDict)
         data["_ert_kind"] = self.__class__.__name__
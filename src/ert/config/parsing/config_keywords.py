@@ -53,6 +53,7 @@ class ConfigKeys(StrEnum):
     MAX_RUNTIME = "MAX_RUNTIME"
     TIME_MAP = "TIME_MAP"
     NUM_CPU = "NUM_CPU"
+    PARAMETER_LAYOUT = "PARAMETER_LAYOUT"
     REALIZATION_MEMORY = "REALIZATION_MEMORY"
     CONFIG_DIRECTORY = "CONFIG_DIRECTORY"
     SUBMIT_SLEEP = "SUBMIT_SLEEP"
@@ -327,6 +327,7 @@ def init_user_config_schema() -> ConfigSchemaDict:
         string_keyword(keyword=ConfigKeys.UPDATE_LOG_PATH),
         string_keyword(ConfigKeys.MIN_REALIZATIONS),
         int_keyword(ConfigKeys.MAX_RUNTIME),
+        single_arg_keyword(ConfigKeys.PARAMETER_LAYOUT),
         stop_long_running_keyword(),
         analysis_set_var_keyword(),
         # the two fault types are just added to the config object only to
@@ -39,6 +39,12 @@ class QueueOptions:
     name: str
     max_running: pydantic.NonNegativeInt = 0
     submit_sleep: pydantic.NonNegativeFloat = 0.0
+    adaptive_submit: bool = False
+    array_submit: bool = False
+    max_array_size: pydantic.PositiveInt = 1000
+    pack_size: pydantic.PositiveInt = 1
+    pack_parallel: bool = True
+    ingestion_workers: pydantic.PositiveInt = 8
     project_code: Optional[str] = None
     activate_script: str = field(default_factory=activate_script)
 
@@ -116,6 +122,10 @@ def driver_options(self) -> Dict[str, Any]:
         driver_dict["queue_name"] = driver_dict.pop("lsf_queue")
         driver_dict["resource_requirement"] = driver_dict.pop("lsf_resource")
         driver_dict.pop("submit_sleep")
+        driver_dict.pop("adaptive_submit")
+        driver_dict.pop("pack_size")
+        driver_dict.pop("pack_parallel")
+        driver_dict.pop("ingestion_workers")
         driver_dict.pop("max_running")
         return driver_dict
 
@@ -144,6 +154,10 @@ def driver_options(self) -> Dict[str, Any]:
         driver_dict["queue_name"] = driver_dict.pop("queue")
         driver_dict.pop("max_running")
         driver_dict.pop("submit_sleep")
+        driver_dict.pop("adaptive_submit")
+        driver_dict.pop("pack_size")
+        driver_dict.pop("pack_parallel")
+        driver_dict.pop("ingestion_workers")
         driver_dict.pop("qstat_options")
         driver_dict.pop("queue_query_timeout")
         return driver_dict
@@ -184,6 +198,10 @@ def driver_options(self) -> Dict[str, Any]:
         driver_dict["queue_name"] = driver_dict.pop("partition")
         driver_dict.pop("max_running")
         driver_dict.pop("submit_sleep")
+        driver_dict.pop("adaptive_submit")
+        driver_dict.pop("pack_size")
+        driver_dict.pop("pack_parallel")
+        driver_dict.pop("ingestion_workers")
         return driver_dict
 
     @pydantic.field_validator("memory", "memory_per_cpu")
@@ -393,6 +411,14 @@ def max_running(self) -> int:
     def submit_sleep(self) -> float:
         return self.queue_options.submit_sleep
 
+    @property
+    def adaptive_submit(self) -> bool:
+        return self.queue_options.adaptive_submit
+
+    @property
+    def ingestion_workers(self) -> int:
+        return self.queue_options.ingestion_workers
+
 
 def _check_num_cpu_requirement(
     num_cpu: int, torque_options: TorqueQueueOptions, raw_queue_options: List[List[str]]
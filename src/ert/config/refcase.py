@@ -48,7 +48,7 @@ def from_config_dict(cls, config_dict: ConfigDict) -> Optional["Refcase"]:
                 raise ConfigValidationError(f"Could not read refcase: {err}") from err
 
         return (
-            cls(start_date, refcase_keys, time_map, data.tolist())
+            cls(start_date, refcase_keys, time_map.tolist(), data.tolist())
             if data is not None
             else None
         )
@@ -5,6 +5,8 @@
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Optional, Set, Union, no_type_check
 
+import numpy as np
+
 from ert.substitutions import substitute_runpath_name
 
 from ._read_summary import read_summary
@@ -52,16 +54,21 @@ def read_from_file(self, run_path: str, iens: int, iter: int) -> polars.DataFram
 
         # Important: Pick lowest unit resolution to allow for using
         # datetimes many years into the future
-        time_map_series = polars.Series(time_map).dt.cast_time_unit("ms")
-        df = polars.DataFrame(
+        time_map = time_map.astype("datetime64[ms]")
+        # Build the long format columns directly from the (keys, times)
+        # matrix, without going through a Python object per key
+        return polars.DataFrame(
             {
-                "response_key": keys,
-                "time": [time_map_series for _ in data],
-                "values": [polars.Series(row, dtype=polars.Float32) for row in data],
+                "response_key": polars.Series(keys, dtype=polars.String).gather(
+                    np.repeat(np.arange(len(keys), dtype=np.uint32), len(time_map))
+                ),
+                "time": polars.Series(np.tile(time_map, len(keys))),
+                "values": polars.Series(
+                    np.ascontiguousarray(data, dtype=np.float32).ravel(),
+                    dtype=polars.Float32,
+                ),
             }
         )
-        df = df.explode("values", "time")
-        return df
 
     @property
     def response_type(self) -> str:
@@ -2,7 +2,7 @@
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, List, Optional
 
 import numpy as np
 import xarray as xr
@@ -162,10 +162,35 @@ def save_parameters(
         )
         ensemble.save_parameters(group, realization, ds)
 
+    def save_parameters_many(
+        self,
+        ensemble: Ensemble,
+        group: str,
+        realizations: npt.NDArray[np.int_],
+        data: npt.NDArray[np.float64],
+    ) -> None:
+        ds = xr.Dataset(
+            {
+                "values": (
+                    ["realizations", "x", "y"],
+                    data.T.reshape(-1, self.ncol, self.nrow).astype("float32"),
+                )
+            }
+        )
+        ensemble.save_parameters_many(group, realizations, ds)
+
     @staticmethod
     def load_parameters(
         ensemble: Ensemble, group: str, realizations: npt.NDArray[np.int_]
     ) -> npt.NDArray[np.float64]:
-        ds = ensemble.load_parameters(group, realizations)
-        ensemble_size = len(ds.realizations)
-        return ds["values"].values.reshape(ensemble_size, -1).T
+        return ensemble.load_parameters_numpy(group, realizations)
+
+    @staticmethod
+    def load_parameter_rows(
+        ensemble: Ensemble,
+        group: str,
+        realizations: npt.NDArray[np.int_],
+        rows: npt.NDArray[np.int_],
+        block_bytes: Optional[int] = None,
+    ) -> npt.NDArray[np.float64]:
+        return ensemble.load_parameters_numpy(group, realizations, rows, block_bytes)
@@ -123,18 +123,21 @@ def data_for_key(
         response_type = response_key_to_response_type[response_key]
 
         if response_type == "summary":
-            summary_data = ensemble.load_responses(
-                response_key,
-                tuple(ensemble.get_realization_list_with_responses()),
+            summary_realizations = ensemble.get_realization_list_with_responses()
+            if not summary_realizations:
+                return pd.DataFrame()
+            summary_data = (
+                ensemble.scan_responses("summary", summary_realizations)
+                .filter(polars.col("response_key") == response_key)
+                .select("time", "realization", "values")
+                .collect()
             )
             if summary_data.is_empty():
                 return pd.DataFrame()
 
-            df = (
-                summary_data.rename({"time": "Date", "realization": "Realization"})
-                .drop("response_key")
-                .to_pandas()
-            )
+            df = summary_data.rename(
+                {"time": "Date", "realization": "Realization"}
+            ).to_pandas()
             df = df.set_index(["Date", "Realization"])
             # This performs the same aggragation by mean of duplicate values
             # as in ert/analysis/_es_update.py
@@ -155,16 +158,21 @@ def data_for_key(
                 )
                 mask = ensemble.get_realization_mask_with_responses()
                 realizations = np.where(mask)[0]
-                data = ensemble.load_responses(response_key, tuple(realizations))
             except ValueError as err:
                 logger.info(f"Dark storage could not load response {key}: {err}")
                 return pd.DataFrame()
 
             try:
-                vals = data.filter(polars.col("report_step").eq(report_step))
-                pivoted = vals.drop("response_key", "report_step").pivot(
-                    on="index", values="values"
+                vals = (
+                    ensemble.scan_responses("gen_data", realizations)
+                    .filter(
+                        (polars.col("response_key") == response_key)
+                        & (polars.col("report_step") == report_step)
+                    )
+                    .select("realization", "index", "values")
+                    .collect()
                 )
+                pivoted = vals.pivot(on="index", values="values")
                 data = pivoted.to_pandas().set_index("realization")
                 data.columns = data.columns.astype(int)
                 data.columns.name = "axis"
@@ -108,16 +108,20 @@ def _get_data(
             observations_for_type = observations_by_type[response_type].filter(
                 polars.col("observation_key").is_in(observation_keys)
             )
-            responses_for_type = ensemble.load_responses(
-                response_type,
-                realizations=tuple(ensemble.get_realization_list_with_responses()),
-            )
-
-            if responses_for_type.is_empty():
+            realizations = ensemble.get_realization_list_with_responses()
+            scanned = ensemble.scan_responses(response_type, realizations)
+            if not realizations or scanned.head(1).collect().is_empty():
                 raise ResponseError(
                     f"No response loaded for observation type: {response_type}"
                 )
 
+            # Only read the responses that have observations
+            responses_for_type = scanned.filter(
+                polars.col("response_key").is_in(
+                    observations_for_type["response_key"].unique()
+                )
+            ).collect()
+
             # Note that if there are duplicate entries for one
             # response at one index, they are aggregated together
             # with "mean" by default
@@ -126,6 +130,14 @@ def _get_data(
                 index=["response_key", *response_cls.primary_key],
                 aggregate_function="mean",
             )
+            # Realizations without observed responses get no column from
+            # the pivot
+            realization_columns = [str(realization) for realization in realizations]
+            pivoted = pivoted.with_columns(
+                polars.lit(None, dtype=polars.Float32).alias(column)
+                for column in realization_columns
+                if column not in pivoted.columns
+            ).select(["response_key", *response_cls.primary_key, *realization_columns])
 
             if "time" in pivoted:
                 joined = observations_for_type.join_asof(
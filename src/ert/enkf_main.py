@@ -4,11 +4,15 @@
 import logging
 import os
 import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     Dict,
     Iterable,
     List,
@@ -21,10 +25,14 @@
 import orjson
 from numpy.random import SeedSequence
 
-from ert.config.ert_config import forward_model_data_to_json
+from ert.config.ert_config import ForwardModelJSONTemplate
 from ert.config.forward_model_step import ForwardModelStep
 from ert.config.model_config import ModelConfig
-from ert.substitutions import Substitutions, substitute_runpath_name
+from ert.substitutions import (
+    Substitutions,
+    depends_on_realization,
+    substitute_runpath_name,
+)
 
 from .config import (
     ExtParamConfig,
@@ -201,6 +209,115 @@ def sample_prior(
     logger.debug(f"sample_prior() time_used {(time.perf_counter() - t):.4f}s")
 
 
+_RUN_PATH_WORKERS = 16
+
+
+@dataclass
+class _Template:
+    """A template which has been read and substituted with everything but the
+    realization specific magic strings"""
+
+    target: str
+    content: str
+
+    def render(
+        self, substitutions: Substitutions, iens: int, iteration: int
+    ) -> Tuple[str, str]:
+        return (
+            _render(substitutions, self.target, iens, iteration),
+            _render(substitutions, self.content, iens, iteration),
+        )
+
+
+def _render(
+    substitutions: Substitutions, pre_rendered: str, iens: int, iteration: int
+) -> str:
+    if not depends_on_realization(pre_rendered):
+        return pre_rendered
+    return substitutions.substitute_real_iter(pre_rendered, iens, iteration)
+
+
+def _compile_templates(
+    templates: List[Tuple[str, str]], substitutions: Substitutions
+) -> List[_Template]:
+    """Reads each template once and substitutes everything which does not
+    depend on the realization, so that rendering for a realization only has
+    to resolve <IENS>, <ITER> and <GEO_ID>."""
+    common = substitutions.realization_independent()
+    compiled = []
+    for source_file, target_file in templates:
+        try:
+            file_content = Path(source_file).read_text("utf-8")
+        except UnicodeDecodeError as e:
+            raise ValueError(
+                f"Unsupported non UTF-8 character found in file: {source_file}"
+            ) from e
+        compiled.append(
+            _Template(
+                target=common.substitute(target_file),
+                content=common.substitute(file_content),
+            )
+        )
+    return compiled
+
+
+def _create_realization_run_path(
+    run_arg: RunArg,
+    ensemble: Ensemble,
+    substitutions: Substitutions,
+    templates: List[_Template],
+    jobs_json: ForwardModelJSONTemplate,
+    model_config: ModelConfig,
+) -> Dict[str, float]:
+    """Creates the run path of a single realization, and returns the time
+    spent in each phase"""
+    timings: Dict[str, float] = {}
+    t = time.perf_counter()
+    run_path = Path(run_arg.runpath)
+    run_path.mkdir(parents=True, exist_ok=True)
+    for template in templates:
+        target_file, result = template.render(
+            substitutions, run_arg.iens, ensemble.iteration
+        )
+        target = run_path / target_file
+        if not target.parent.exists():
+            os.makedirs(
+                target.parent,
+                exist_ok=True,
+            )
+        target.write_text(result)
+    timings["templates"] = time.perf_counter() - t
+
+    t = time.perf_counter()
+    _generate_parameter_files(
+        ensemble.experiment.parameter_configuration.values(),
+        model_config.gen_kw_export_name,
+        run_path,
+        run_arg.iens,
+        ensemble,
+        ensemble.iteration,
+    )
+    timings["parameters"] = time.perf_counter() - t
+
+    t = time.perf_counter()
+    path = run_path / "jobs.json"
+    _backup_if_existing(path)
+
+    with open(run_path / "jobs.json", mode="wb") as fptr:
+        fptr.write(
+            jobs_json.render_json(run_arg.run_id, run_arg.iens, ensemble.iteration)
+        )
+    timings["jobs.json"] = time.perf_counter() - t
+
+    t = time.perf_counter()
+    # Write MANIFEST file to runpath use to avoid NFS sync issues
+    data = _manifest_to_json(ensemble, run_arg.iens, run_arg.itr)
+    with open(run_path / "manifest.json", mode="wb") as fptr:
+        fptr.write(orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS))
+    timings["manifest"] = time.perf_counter() - t
+    return timings
+
+
 def create_run_path(
     run_args: List[RunArg],
     ensemble: Ensemble,
@@ -213,73 +330,60 @@ def create_run_path(
     model_config: ModelConfig,
     runpaths: Runpaths,
     context_env: Optional[Dict[str, str]] = None,
+    realization_ready: Optional[Callable[[RunArg], None]] = None,
 ) -> None:
+    """Creates the run paths of the active realizations. Templates are read
+    once, and the run paths are written concurrently as they mostly wait
+    on the file system.
+
+    If given, realization_ready is called with the run argument of each
+    realization as soon as its run path is complete, so that it can be
+    submitted while the remaining run paths are being written."""
     if context_env is None:
         context_env = {}
     t = time.perf_counter()
     runpaths.set_ert_ensemble(ensemble.name)
-    for run_arg in run_args:
-        run_path = Path(run_arg.runpath)
-        if run_arg.active:
-            run_path.mkdir(parents=True, exist_ok=True)
-            for source_file, target_file in templates:
-                target_file = substitutions.substitute_real_iter(
-                    target_file, run_arg.iens, ensemble.iteration
-                )
-                try:
-                    file_content = Path(source_file).read_text("utf-8")
-                except UnicodeDecodeError as e:
-                    raise ValueError(
-                        f"Unsupported non UTF-8 character found in file: {source_file}"
-                    ) from e
-
-                result = substitutions.substitute_real_iter(
-                    file_content,
-                    run_arg.iens,
-                    ensemble.iteration,
-                )
-                target = run_path / target_file
-                if not target.parent.exists():
-                    os.makedirs(
-                        target.parent,
-                        exist_ok=True,
-                    )
-                target.write_text(result)
-
-            _generate_parameter_files(
-                ensemble.experiment.parameter_configuration.values(),
-                model_config.gen_kw_export_name,
-                run_path,
-                run_arg.iens,
-                ensemble,
-                ensemble.iteration,
-            )
+    active_run_args = [run_arg for run_arg in run_args if run_arg.active]
+    compiled_templates = (
+        _compile_templates(templates, substitutions) if active_run_args else []
+    )
+    jobs_json = ForwardModelJSONTemplate(
+        context=substitutions,
+        forward_model_steps=forward_model_steps,
+        user_config_file=user_config_file,
+        env_vars={**env_vars, **context_env},
+        env_pr_fm_step=env_pr_fm_step,
+    )
+    timings: Dict[str, float] = defaultdict(float)
+    timings["preparing templates"] = time.perf_counter() - t
+
+    def _create(run_arg: RunArg) -> Dict[str, float]:
+        return _create_realization_run_path(
+            run_arg,
+            ensemble,
+            substitutions,
+            compiled_templates,
+            jobs_json,
+            model_config,
+        )
 
-            path = run_path / "jobs.json"
-            _backup_if_existing(path)
-
-            forward_model_output = forward_model_data_to_json(
-                substitutions=substitutions,
-                forward_model_steps=forward_model_steps,
-                user_config_file=user_config_file,
-                env_vars=env_vars,
-                env_pr_fm_step=env_pr_fm_step,
-                run_id=run_arg.run_id,
-                iens=run_arg.iens,
-                itr=ensemble.iteration,
-                context_env=context_env,
-            )
-            with open(run_path / "jobs.json", mode="wb") as fptr:
-                fptr.write(
-                    orjson.dumps(forward_model_output, option=orjson.OPT_NON_STR_KEYS)
-                )
-            # Write MANIFEST file to runpath use to avoid NFS sync issues
-            data = _manifest_to_json(ensemble, run_arg.iens, run_arg.itr)
-            with open(run_path / "manifest.json", mode="wb") as fptr:
-                fptr.write(orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS))
+    with ThreadPoolExecutor(max_workers=_RUN_PATH_WORKERS) as executor:
+        futures = {
+            executor.submit(_create, run_arg): run_arg for run_arg in active_run_args
+        }
+        for future in as_completed(futures):
+            for phase, duration in future.result().items():
+                timings[phase] += duration
+            if realization_ready is not None:
+                realization_ready(futures[future])
 
     runpaths.write_runpath_list(
-        [ensemble.iteration], [real.iens for real in run_args if real.active]
+        [ensemble.iteration], [real.iens for real in active_run_args]
     )
 
-    logger.debug(f"create_run_path() time_used {(time.perf_counter() - t):.4f}s")
+    logger.debug(
+        f"Created {len(active_run_args)} run paths in "
+        f"{(time.perf_counter() - t):.4f}s ("
+        + ", ".join(f"{phase}: {duration:.4f}s" for phase, duration in timings.items())
+        + ", summed over realizations)"
+    )
@@ -116,6 +116,9 @@ class LegacyEnsemble:
     _queue_config: QueueConfig
     min_required_realizations: int
     id_: str
+    # When given, the run paths are still being created and the scheduler
+    # submits each realization once it has been put on this queue
+    ready_realizations: Optional[asyncio.Queue[Optional[int]]] = None
 
     def __post_init__(self) -> None:
         self._scheduler: Optional[_KillAllJobs] = None
@@ -284,6 +287,8 @@ async def _evaluate_inner(  # pylint: disable=too-many-branches
                 max_submit=self._queue_config.max_submit,
                 max_running=self._queue_config.max_running,
                 submit_sleep=self._queue_config.submit_sleep,
+                adaptive_submit=self._queue_config.adaptive_submit,
+                ingestion_workers=self._queue_config.ingestion_workers,
                 ens_id=self.id_,
                 ee_uri=self._config.dispatch_uri,
                 ee_cert=self._config.cert,
@@ -301,8 +306,11 @@ async def _evaluate_inner(  # pylint: disable=too-many-branches
                 else 0
             )
 
-            self._scheduler.add_dispatch_information_to_jobs_file()
-            result = await self._scheduler.execute(min_required_realizations)
+            if self.ready_realizations is None:
+                self._scheduler.add_dispatch_information_to_jobs_file()
+            result = await self._scheduler.execute(
+                min_required_realizations, self.ready_realizations
+            )
 
         except Exception as exc:
             logger.exception(
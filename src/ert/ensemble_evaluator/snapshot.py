@@ -121,6 +121,8 @@ def __init__(self) -> None:
         ] = defaultdict(FMStepSnapshot)  # type: ignore
 
         self._ensemble_state: Optional[str] = None
+        self._submit_rate: Optional[float] = None
+        self._ingestion_backlog: Optional[int] = None
         # TODO not sure about possible values at this point, as GUI hijacks this one as
         # well
         self._metadata = EnsembleSnapshotMetadata(
@@ -137,6 +139,10 @@ def from_nested_dict(cls, source: Mapping[Any, Any]) -> "EnsembleSnapshot":
             ensemble._metadata = source["metadata"]
         if "status" in source:
             ensemble._ensemble_state = source["status"]
+        if "submit_rate" in source:
+            ensemble._submit_rate = source["submit_rate"]
+        if "ingestion_backlog" in source:
+            ensemble._ingestion_backlog = source["ingestion_backlog"]
         for real_id, realization_data in source.get("reals", {}).items():
             ensemble.add_realization(
                 real_id, _realization_dict_to_realization_snapshot(realization_data)
@@ -156,6 +162,10 @@ def merge_snapshot(self, ensemble: "EnsembleSnapshot") -> "EnsembleSnapshot":
         self._metadata.update(ensemble._metadata)
         if ensemble._ensemble_state is not None:
             self._ensemble_state = ensemble._ensemble_state
+        if ensemble._submit_rate is not None:
+            self._submit_rate = ensemble._submit_rate
+        if ensemble._ingestion_backlog is not None:
+            self._ingestion_backlog = ensemble._ingestion_backlog
         for real_id, other_real_data in ensemble._realization_snapshots.items():
             self._realization_snapshots[real_id].update(other_real_data)
         for fm_step_id, other_fm_data in ensemble._fm_step_snapshots.items():
@@ -172,6 +182,10 @@ def to_dict(self) -> Dict[str, Any]:
             _dict["metadata"] = self._metadata
         if self._ensemble_state:
             _dict["status"] = self._ensemble_state
+        if self._submit_rate is not None:
+            _dict["submit_rate"] = self._submit_rate
+        if self._ingestion_backlog is not None:
+            _dict["ingestion_backlog"] = self._ingestion_backlog
         if self._realization_snapshots:
             _dict["reals"] = self._realization_snapshots
 
@@ -191,6 +205,17 @@ def to_dict(self) -> Dict[str, Any]:
     def status(self) -> Optional[str]:
         return self._ensemble_state
 
+    @property
+    def submit_rate(self) -> Optional[float]:
+        """The number of submits per second the scheduler last allowed"""
+        return self._submit_rate
+
+    @property
+    def ingestion_backlog(self) -> Optional[int]:
+        """The number of finished realizations whose results were still being
+        loaded into storage when the last realization finished"""
+        return self._ingestion_backlog
+
     @property
     def metadata(self) -> EnsembleSnapshotMetadata:
         return self._metadata
@@ -297,6 +322,13 @@ def update_from_event(
                 end_time = convert_iso8601_to_datetime(timestamp)
             if type(event) is RealizationFailed:
                 message = event.message
+            if type(event) is RealizationPending and event.submit_rate is not None:
+                self._submit_rate = event.submit_rate
+            if (
+                isinstance(event, (RealizationSuccess, RealizationFailed))
+                and event.ingestion_backlog is not None
+            ):
+                self._ingestion_backlog = event.ingestion_backlog
             self.update_realization(
                 event.real,
                 status,
@@ -15,6 +15,7 @@
 from queue import SimpleQueue
 from typing import (
     TYPE_CHECKING,
+    Callable,
     Dict,
     Generator,
     List,
@@ -69,7 +70,7 @@
 )
 from ert.mode_definitions import MODULE_MODE
 from ert.runpaths import Runpaths
-from ert.storage import Ensemble, Storage
+from ert.storage import Ensemble, ParameterLayout, Storage
 from ert.trace import tracer
 from ert.workflow_runner import WorkflowRunner
 
@@ -272,6 +273,12 @@ def queue_system(self) -> QueueSystem:
     def ensemble_size(self) -> int:
         return len(self._initial_realizations_mask)
 
+    @property
+    def parameter_layout(self) -> ParameterLayout:
+        """The storage layout of the parameters of the prior ensemble, which
+        its posteriors inherit"""
+        return ParameterLayout(self.ert_config.analysis_config.parameter_layout)
+
     def cancel(self) -> None:
         self._end_queue.put("END")
 
@@ -559,12 +566,22 @@ async def run_ensemble_evaluator_async(
         run_args: List[RunArg],
         ensemble: Ensemble,
         ee_config: EvaluatorServerConfig,
+        create_run_paths: Optional[Callable[[Callable[[RunArg], None]], None]] = None,
     ) -> List[int]:
+        """Evaluates the ensemble. If create_run_paths is given, it is called
+        in a separate thread with a callback for each realization whose run
+        path is ready, and realizations are submitted as their run paths
+        become ready instead of after all of them have been created."""
         if not self._end_queue.empty():
             logger.debug("Run model canceled - pre evaluation")
             self._end_queue.get()
             return []
-        ee_ensemble = self._build_ensemble(run_args, ensemble.experiment_id)
+        ready_realizations: Optional[asyncio.Queue[Optional[int]]] = None
+        if create_run_paths is not None:
+            ready_realizations = asyncio.Queue()
+        ee_ensemble = self._build_ensemble(
+            run_args, ensemble.experiment_id, ready_realizations
+        )
         evaluator = EnsembleEvaluator(
             ee_ensemble,
             ee_config,
@@ -572,8 +589,25 @@ async def run_ensemble_evaluator_async(
         evaluator_task = asyncio.create_task(
             evaluator.run_and_get_successful_realizations()
         )
-        if not (await self.run_monitor(ee_config, ensemble.iteration)):
-            return []
+        run_path_task: Optional[asyncio.Task[None]] = None
+        if create_run_paths is not None:
+            assert ready_realizations is not None
+            run_path_task = asyncio.create_task(
+                self._create_run_paths_async(
+                    create_run_paths, ready_realizations, ee_ensemble
+                )
+            )
+        try:
+            if not (await self.run_monitor(ee_config, ensemble.iteration)):
+                return []
+        finally:
+            if run_path_task is not None:
+                try:
+                    await run_path_task
+                except BaseException:
+                    evaluator_task.cancel()
+                    await asyncio.gather(evaluator_task, return_exceptions=True)
+                    raise
 
         logger.debug("observed that model was finished, waiting tasks completion...")
         # The model has finished, we indicate this by sending a DONE
@@ -588,6 +622,30 @@ async def run_ensemble_evaluator_async(
 
         return evaluator_task.result()
 
+    @staticmethod
+    async def _create_run_paths_async(
+        create_run_paths: Callable[[Callable[[RunArg], None]], None],
+        ready_realizations: asyncio.Queue[Optional[int]],
+        ee_ensemble: EEEnsemble,
+    ) -> None:
+        loop = asyncio.get_running_loop()
+
+        def _realization_ready(run_arg: RunArg) -> None:
+            loop.call_soon_threadsafe(ready_realizations.put_nowait, run_arg.iens)
+
+        t = time.perf_counter()
+        try:
+            await asyncio.to_thread(create_run_paths, _realization_ready)
+        except BaseException:
+            ee_ensemble.cancel()
+            raise
+        finally:
+            ready_realizations.put_nowait(None)
+        logger.info(
+            "Run paths were created while submitting realizations "
+            f"in {(time.perf_counter() - t):.2f}s"
+        )
+
     # This function needs to be there for the sake of testing that expects sync ee run
     @tracer.start_as_current_span(f"{__name__}.run_ensemble_evaluator")
     def run_ensemble_evaluator(
@@ -595,9 +653,12 @@ def run_ensemble_evaluator(
         run_args: List[RunArg],
         ensemble: Ensemble,
         ee_config: EvaluatorServerConfig,
+        create_run_paths: Optional[Callable[[Callable[[RunArg], None]], None]] = None,
     ) -> List[int]:
         successful_realizations = asyncio.run(
-            self.run_ensemble_evaluator_async(run_args, ensemble, ee_config)
+            self.run_ensemble_evaluator_async(
+                run_args, ensemble, ee_config, create_run_paths
+            )
         )
         return successful_realizations
 
@@ -605,6 +666,7 @@ def _build_ensemble(
         self,
         run_args: List[RunArg],
         experiment_id: uuid.UUID,
+        ready_realizations: Optional[asyncio.Queue[Optional[int]]] = None,
     ) -> EEEnsemble:
         realizations = []
         for run_arg in run_args:
@@ -626,6 +688,7 @@ def _build_ensemble(
             self._queue_config,
             self.minimum_required_realizations,
             str(experiment_id),
+            ready_realizations,
         )
 
     @property
@@ -687,7 +750,8 @@ def _evaluate_and_postprocess(
         ensemble: Ensemble,
         evaluator_server_config: EvaluatorServerConfig,
     ) -> int:
-        create_run_path(
+        create_run_paths = functools.partial(
+            create_run_path,
             run_args=run_args,
             ensemble=ensemble,
             user_config_file=self.ert_config.user_config_file,
@@ -701,12 +765,26 @@ def _evaluate_and_postprocess(
             context_env=self._context_env,
         )
 
-        self.run_workflows(HookRuntime.PRE_SIMULATION, self._storage, ensemble)
-        successful_realizations = self.run_ensemble_evaluator(
-            run_args,
-            ensemble,
-            evaluator_server_config,
-        )
+        if self.ert_config.hooked_workflows[HookRuntime.PRE_SIMULATION]:
+            # The workflows may need all run paths, so they must all be
+            # created before any realization is submitted
+            create_run_paths()
+            self.run_workflows(HookRuntime.PRE_SIMULATION, self._storage, ensemble)
+            successful_realizations = self.run_ensemble_evaluator(
+                run_args,
+                ensemble,
+                evaluator_server_config,
+            )
+        else:
+            self.run_workflows(HookRuntime.PRE_SIMULATION, self._storage, ensemble)
+            successful_realizations = self.run_ensemble_evaluator(
+                run_args,
+                ensemble,
+                evaluator_server_config,
+                create_run_paths=lambda realization_ready: create_run_paths(
+                    realization_ready=realization_ready
+                ),
+            )
         starting_realizations = [real.iens for real in run_args if real.active]
         failed_realizations = list(
             set(starting_realizations) - set(successful_realizations)
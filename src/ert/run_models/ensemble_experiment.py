@@ -74,6 +74,7 @@ def run_experiment(
                 self.experiment,
                 name=self.ensemble_name,
                 ensemble_size=self.ensemble_size,
+                parameter_layout=self.parameter_layout,
             )
         else:
             self.active_realizations = self._create_mask_from_failed_realizations()
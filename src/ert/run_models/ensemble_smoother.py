@@ -75,6 +75,7 @@ def run_experiment(
             experiment,
             ensemble_size=self.ensemble_size,
             name=ensemble_format % 0,
+            parameter_layout=self.parameter_layout,
         )
         self.set_env_key("_ERT_ENSEMBLE_ID", str(prior.id))
         prior_args = create_run_arguments(
@@ -118,6 +118,7 @@ def run_experiment(
                 ensemble_size=self.ensemble_size,
                 iteration=0,
                 name=self.target_ensemble_format % 0,
+                parameter_layout=self.parameter_layout,
             )
             self.set_env_key("_ERT_EXPERIMENT_ID", str(experiment.id))
             self.set_env_key("_ERT_ENSEMBLE_ID", str(prior.id))
@@ -11,6 +11,7 @@
 from .local_driver import LocalDriver
 from .lsf_driver import LsfDriver
 from .openpbs_driver import OpenPBSDriver
+from .packed_driver import PackedDriver
 from .scheduler import Scheduler
 from .slurm_driver import SlurmDriver
 
@@ -19,6 +20,15 @@
 
 
 def create_driver(queue_options: QueueOptions) -> Driver:
+    driver = _create_queue_driver(queue_options)
+    if queue_options.pack_size > 1:
+        return PackedDriver(
+            driver, queue_options.pack_size, parallel=queue_options.pack_parallel
+        )
+    return driver
+
+
+def _create_queue_driver(queue_options: QueueOptions) -> Driver:
     if queue_options.name == QueueSystem.LOCAL:
         return LocalDriver()
     elif queue_options.name == QueueSystem.TORQUE:
@@ -3,12 +3,30 @@
 import asyncio
 import logging
 import shlex
+import time
 from abc import ABC, abstractmethod
+from collections import defaultdict
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
 
 from .event import Event
 
+T = TypeVar("T")
+
 SIGNAL_OFFSET = 128
 """Bash and other shells add an offset of 128 to the signal value when a process exited due to a signal"""
 
@@ -24,10 +42,230 @@ def create_submit_script(
     )
 
 
+def create_array_submit_script(
+    index_variable: str,
+    tasks: Mapping[int, ArrayTask],
+    activate_script: str,
+    output_suffixes: Optional[Tuple[str, str]] = None,
+) -> str:
+    """The submit script of an array job, which runs the task given by the
+    array index in the environment variable index_variable. With
+    output_suffixes, the output of each task goes to files named by the
+    job name in its runpath."""
+    lines = ["#!/usr/bin/env bash", f'case "${index_variable}" in']
+    for index, task in tasks.items():
+        lines += [f"{index})", f"  cd {shlex.quote(str(task.runpath))}"]
+        if output_suffixes is not None:
+            stdout_suffix, stderr_suffix = output_suffixes
+            lines.append(
+                f"  exec >{shlex.quote(task.name + stdout_suffix)} "
+                f"2>{shlex.quote(task.name + stderr_suffix)}"
+            )
+        if activate_script:
+            lines.append(f"  {activate_script}")
+        lines += [
+            f"  exec -a {shlex.quote(task.executable)} {task.executable} "
+            f"{shlex.join(task.args)}",
+            "  ;;",
+        ]
+    lines += [
+        "*)",
+        f'  echo "No realization for array index ${index_variable}" >&2',
+        "  exit 1",
+        "  ;;",
+        "esac",
+    ]
+    return "\n".join(lines) + "\n"
+
+
 class FailedSubmit(RuntimeError):
     pass
 
 
+@dataclass
+class ArrayTask:
+    """A realization to be submitted as a task of an array job"""
+
+    iens: int
+    executable: str
+    args: Tuple[str, ...]
+    name: str
+    runpath: Path
+    num_cpu: int = 1
+    realization_memory: int = 0
+
+
+class ArraySubmitter:
+    """Gathers the realizations submitted within COLLECT_PERIOD of the first
+    one into array jobs, one for each set of resource requirements, so that
+    the queue system is called once for all of them. With max_size, larger
+    sets are split into array jobs of at most max_size realizations.
+
+    submit_array submits one array job and returns the job id of each of
+    its tasks by realization. Its errors are raised to all the submitters.
+    """
+
+    COLLECT_PERIOD = 1.0  # seconds
+
+    def __init__(
+        self,
+        submit_array: Callable[[List[ArrayTask]], Awaitable[Dict[int, str]]],
+        max_size: Optional[int] = None,
+    ) -> None:
+        self._submit_array = submit_array
+        self._max_size = max_size
+        self._waiting: Dict[int, Tuple[ArrayTask, asyncio.Future[str]]] = {}
+        self._submitting: Dict[int, asyncio.Future[str]] = {}
+        self._batches: Set[asyncio.Task[None]] = set()
+
+    async def submit(self, task: ArrayTask) -> str:
+        job_id = asyncio.get_running_loop().create_future()
+        if not self._waiting:
+            batch = asyncio.create_task(self._submit_batch())
+            self._batches.add(batch)
+            batch.add_done_callback(self._batches.discard)
+        self._waiting[task.iens] = (task, job_id)
+        return await asyncio.shield(job_id)
+
+    async def settle(self, iens: int) -> None:
+        """Withdraws the realization if it is still waiting to be submitted,
+        else waits until the array job it is part of has been submitted, so
+        that it can be killed"""
+        if iens in self._waiting:
+            _, job_id = self._waiting.pop(iens)
+            job_id.cancel()
+        elif iens in self._submitting:
+            await asyncio.wait([self._submitting[iens]])
+
+    async def _submit_batch(self) -> None:
+        await asyncio.sleep(self.COLLECT_PERIOD)
+        waiting, self._waiting = self._waiting, {}
+        groups: Dict[Tuple[int, int], List[ArrayTask]] = defaultdict(list)
+        for task, job_id in waiting.values():
+            groups[task.num_cpu, task.realization_memory].append(task)
+            self._submitting[task.iens] = job_id
+        chunks = [
+            tasks[start : start + (self._max_size or len(tasks))]
+            for tasks in groups.values()
+            for start in range(0, len(tasks), self._max_size or len(tasks))
+        ]
+        await asyncio.gather(*(self._submit_group(tasks) for tasks in chunks))
+
+    async def _submit_group(self, tasks: List[ArrayTask]) -> None:
+        job_ids = {task.iens: self._submitting[task.iens] for task in tasks}
+        try:
+            submitted = await self._submit_array(tasks)
+        except Exception as err:
+            for job_id in job_ids.values():
+                job_id.set_exception(err)
+        else:
+            for iens, job_id in job_ids.items():
+                job_id.set_result(submitted[iens])
+        finally:
+            for iens in job_ids:
+                del self._submitting[iens]
+
+
+@dataclass
+class CommandMetrics:
+    calls: int = 0
+    failures: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    def __str__(self) -> str:
+        mean = self.total_seconds / self.calls if self.calls else 0.0
+        return (
+            f"{self.calls} calls, {self.failures} failed, "
+            f"mean {mean:.2f}s, max {self.max_seconds:.2f}s"
+        )
+
+
+class DriverMetrics:
+    """Counts and times the commands a driver runs against the queue system,
+    by the name of the command."""
+
+    def __init__(self) -> None:
+        self.commands: Dict[str, CommandMetrics] = defaultdict(CommandMetrics)
+
+    def record(self, command: str, seconds: float, failed: bool = False) -> None:
+        metrics = self.commands[Path(command).name]
+        metrics.calls += 1
+        metrics.failures += failed
+        metrics.total_seconds += seconds
+        metrics.max_seconds = max(metrics.max_seconds, seconds)
+
+    def __str__(self) -> str:
+        return "; ".join(
+            f"{command}: {metrics}" for command, metrics in self.commands.items()
+        )
+
+
+class AdaptivePollPeriod:
+    """The time to wait between polls of the queue system.
+
+    The period grows by BACKOFF_FACTOR for every poll where no job changed
+    state, up to MAX_FACTOR times the base period, or PENDING_MAX_FACTOR
+    times while all jobs are pending, and is reset to the base period as
+    soon as a job changes state.
+    """
+
+    BACKOFF_FACTOR = 1.5
+    MAX_FACTOR = 4.0
+    PENDING_MAX_FACTOR = 15.0
+
+    def __init__(self) -> None:
+        self._factor = 1.0
+        self._job_states: Dict[str, Any] = {}
+
+    def next_period(
+        self, base_period: float, job_states: Mapping[str, Any], num_pending: int
+    ) -> float:
+        if job_states != self._job_states:
+            self._factor = 1.0
+            self._job_states = dict(job_states)
+        else:
+            max_factor = (
+                self.PENDING_MAX_FACTOR
+                if num_pending == len(job_states)
+                else self.MAX_FACTOR
+            )
+            self._factor = min(self._factor * self.BACKOFF_FACTOR, max_factor)
+        return base_period * self._factor
+
+
+class BatchedQuery(Generic[T]):
+    """Coalesces concurrent queries for jobs into one call to query.
+
+    The job ids asked for by tasks that run before the query is made are
+    gathered, so that for instance the exit codes of all the jobs found to
+    have failed in one poll are fetched with one command.
+    """
+
+    def __init__(self, query: Callable[[Set[str]], Awaitable[Dict[str, T]]]) -> None:
+        self._query = query
+        self._job_ids: Set[str] = set()
+        self._batch: Optional[asyncio.Future[Dict[str, T]]] = None
+
+    async def get(self, job_id: str) -> Optional[T]:
+        return (await self.get_many({job_id})).get(job_id)
+
+    async def get_many(self, job_ids: Iterable[str]) -> Dict[str, T]:
+        job_ids = set(job_ids)
+        self._job_ids |= job_ids
+        if self._batch is None:
+            self._batch = asyncio.ensure_future(self._run_batch())
+        # Shielded, as the batch also answers the other tasks waiting for it
+        results = await asyncio.shield(self._batch)
+        return {job_id: results[job_id] for job_id in job_ids if job_id in results}
+
+    async def _run_batch(self) -> Dict[str, T]:
+        await asyncio.sleep(0)
+        job_ids, self._job_ids = self._job_ids, set()
+        self._batch = None
+        return await self._query(job_ids)
+
+
 class Driver(ABC):
     """Adapter for the HPC cluster."""
 
@@ -35,6 +273,14 @@ def __init__(self, activate_script: str = "") -> None:
         self._event_queue: Optional[asyncio.Queue[Event]] = None
         self._job_error_message_by_iens: Dict[int, str] = {}
         self.activate_script = activate_script
+        self.metrics = DriverMetrics()
+        self._array_submitter: Optional[ArraySubmitter] = None
+
+    @property
+    def gathers_submits(self) -> bool:
+        """Whether realizations submitted close together are gathered into
+        one job, as tasks of an array job or as a pack"""
+        return self._array_submitter is not None
 
     @property
     def event_queue(self) -> asyncio.Queue[Event]:
@@ -89,8 +335,31 @@ def read_stdout_and_stderr_files(
         """Each driver should provide some output in case of failure."""
         return ""
 
-    @staticmethod
+    def error_message(self, iens: int) -> str:
+        """The error the queue system reported for the job of the
+        realization, or an empty string if there is none."""
+        return self._job_error_message_by_iens.get(iens, "")
+
+    async def _run_command(self, *cmd_with_args: str) -> Tuple[int, bytes, bytes]:
+        """Runs a command against the queue system, and records it in the
+        metrics. Returns the return code, stdout and stderr."""
+        start_time = time.perf_counter()
+        process = await asyncio.create_subprocess_exec(
+            *cmd_with_args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        stdout, stderr = await process.communicate()
+        assert process.returncode is not None
+        self.metrics.record(
+            cmd_with_args[0],
+            time.perf_counter() - start_time,
+            failed=process.returncode != 0,
+        )
+        return process.returncode, stdout, stderr
+
     async def _execute_with_retry(
+        self,
         cmd_with_args: List[str],
         retry_on_empty_stdout: Optional[bool] = False,
         retry_codes: Iterable[int] = (),
@@ -107,6 +376,7 @@ async def _execute_with_retry(
         error_message: Optional[str] = None
 
         for i in range(total_attempts):
+            start_time = time.perf_counter()
             try:
                 process = await asyncio.create_subprocess_exec(
                     *cmd_with_args,
@@ -120,6 +390,11 @@ async def _execute_with_retry(
             stdout, stderr = await process.communicate(stdin)
 
             assert process.returncode is not None
+            self.metrics.record(
+                cmd_with_args[0],
+                time.perf_counter() - start_time,
+                failed=process.returncode != 0,
+            )
             outputs = (
                 f"exit code {process.returncode}, "
                 f'output: "{stdout.decode(errors="ignore").strip() or "<empty>"}", and '
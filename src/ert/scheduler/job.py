@@ -7,7 +7,7 @@
 from contextlib import suppress
 from enum import Enum
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
 
 from lxml import etree
 from pydantic_core._pydantic_core import ValidationError
@@ -28,6 +28,10 @@
 
 logger = logging.getLogger(__name__)
 
+_CHECKSUM_CHUNK_SIZE = 1024**2
+_INITIAL_WAIT_INTERVAL = 0.05
+_MAX_WAIT_INTERVAL = 2.0
+
 
 class JobState(str, Enum):
     WAITING = "WAITING"
@@ -65,6 +69,8 @@ def __init__(self, scheduler: Scheduler, real: Realization) -> None:
         self.real = real
         self.state = JobState.WAITING
         self.started = asyncio.Event()
+        self.run_path_ready = asyncio.Event()
+        self.run_path_ready.set()
         self.exec_hosts: str = "-"
         self.returncode: asyncio.Future[int] = asyncio.Future()
         self._scheduler: Scheduler = scheduler
@@ -106,6 +112,7 @@ async def _submit_and_run_once(self, sem: asyncio.BoundedSemaphore) -> None:
             if self._scheduler.submit_sleep_state:
                 await self._scheduler.submit_sleep_state.sleep_until_we_can_submit()
             await self._send(JobState.SUBMITTING)
+            submit_started = time.time()
             try:
                 await self.driver.submit(
                     self.real.iens,
@@ -117,10 +124,12 @@ async def _submit_and_run_once(self, sem: asyncio.BoundedSemaphore) -> None:
                     runpath=Path(self.real.run_arg.runpath),
                 )
             except FailedSubmit as err:
+                self._record_submit(submit_started, failed=True)
                 await self._send(JobState.FAILED)
                 logger.error(f"Failed to submit: {err}")
                 self.returncode.cancel()
                 return
+            self._record_submit(submit_started)
 
             await self._send(JobState.PENDING)
             await self.started.wait()
@@ -143,13 +152,21 @@ async def _submit_and_run_once(self, sem: asyncio.BoundedSemaphore) -> None:
                 timeout_task.cancel()
             sem.release()
 
+    def _record_submit(self, started: float, failed: bool = False) -> None:
+        if self._scheduler.submit_sleep_state:
+            self._scheduler.submit_sleep_state.record_submit(
+                started,
+                time.time() - started,
+                failed,
+                pending=self._scheduler.pending_jobs,
+            )
+
     async def run(
         self,
         sem: asyncio.BoundedSemaphore,
-        forward_model_ok_lock: asyncio.Lock,
-        checksum_lock: asyncio.Lock,
         max_submit: int = 1,
     ) -> None:
+        await self.run_path_ready.wait()
         with tracer.start_as_current_span(f"{__name__}.run.realization_{self.iens}"):
             self._requested_max_submit = max_submit
             for attempt in range(max_submit):
@@ -160,9 +177,8 @@ async def run(
 
                 if self.returncode.result() == 0:
                     if self._scheduler._manifest_queue is not None:
-                        await self._verify_checksum(checksum_lock)
-                    async with forward_model_ok_lock:
-                        await self._handle_finished_forward_model()
+                        await self._verify_checksum()
+                    await self._handle_finished_forward_model()
                     break
 
                 if attempt < max_submit - 1:
@@ -189,18 +205,14 @@ async def _max_runtime_task(self) -> None:
         )
         self.returncode.cancel()
 
-    async def _verify_checksum(
-        self, checksum_lock: asyncio.Lock, timeout: Optional[int] = None
-    ) -> None:
+    async def _verify_checksum(self, timeout: Optional[float] = None) -> None:
         if timeout is None:
             timeout = self.DEFAULT_CHECKSUM_TIMEOUT
         # Wait for job runpath to be in the checksum dictionary
         runpath = self.real.run_arg.runpath
-        while runpath not in self._scheduler.checksum:
-            if timeout <= 0:
-                break
-            timeout -= 1
-            await asyncio.sleep(1)
+        timeout -= await _wait_with_backoff(
+            lambda: runpath in self._scheduler.checksum, timeout
+        )
 
         checksum = self._scheduler.checksum.get(runpath)
         if checksum is None:
@@ -216,36 +228,46 @@ async def _verify_checksum(
         valid_checksums = [info for info in checksum.values() if "error" not in info]
 
         # Wait for files in checksum
-        while not all(Path(info["path"]).exists() for info in valid_checksums):
-            if timeout <= 0:
-                break
-            timeout -= 1
+        if not all(Path(info["path"]).exists() for info in valid_checksums):
             logger.debug("Waiting for disk synchronization")
-            await asyncio.sleep(1)
-        async with checksum_lock:
-            for info in valid_checksums:
-                file_path = Path(info["path"])
-                expected_md5sum = info.get("md5sum")
-                if file_path.exists() and expected_md5sum:
-                    actual_md5sum = hashlib.md5(file_path.read_bytes()).hexdigest()
-                    if expected_md5sum == actual_md5sum:
-                        logger.debug(f"File {file_path} checksum successful.")
-                    else:
-                        logger.warning(
-                            f"File {file_path} checksum verification failed."
-                        )
-                elif file_path.exists() and expected_md5sum is None:
-                    logger.warning(f"Checksum not received for file {file_path}")
-                else:
-                    logger.error(f"Disk synchronization failed for {file_path}")
+            await _wait_with_backoff(
+                lambda: all(Path(info["path"]).exists() for info in valid_checksums),
+                timeout,
+            )
+        await asyncio.gather(
+            *(self._verify_file_checksum(info) for info in valid_checksums)
+        )
+
+    async def _verify_file_checksum(self, info: Dict[str, Any]) -> None:
+        file_path = Path(info["path"])
+        expected_md5sum = info.get("md5sum")
+        if file_path.exists() and expected_md5sum:
+            # Hashing large files is done by the checksum workers, so that
+            # the files of several realizations are verified concurrently
+            actual_md5sum = await asyncio.get_running_loop().run_in_executor(
+                self._scheduler.checksum_executor, _md5sum, file_path
+            )
+            if expected_md5sum == actual_md5sum:
+                logger.debug(f"File {file_path} checksum successful.")
+            else:
+                logger.warning(f"File {file_path} checksum verification failed.")
+        elif file_path.exists() and expected_md5sum is None:
+            logger.warning(f"Checksum not received for file {file_path}")
+        else:
+            logger.error(f"Disk synchronization failed for {file_path}")
 
     async def _handle_finished_forward_model(self) -> None:
-        callback_status, status_msg = await forward_model_ok(
-            run_path=self.real.run_arg.runpath,
-            realization=self.real.run_arg.iens,
-            iter=self.real.run_arg.itr,
-            ensemble=self.real.run_arg.ensemble_storage,
-        )
+        self._scheduler.ingestion_backlog += 1
+        try:
+            callback_status, status_msg = await forward_model_ok(
+                run_path=self.real.run_arg.runpath,
+                realization=self.real.run_arg.iens,
+                iter=self.real.run_arg.itr,
+                ensemble=self.real.run_arg.ensemble_storage,
+                executor=self._scheduler.ingestion_executor,
+            )
+        finally:
+            self._scheduler.ingestion_backlog -= 1
         if self._message:
             self._message = status_msg
         else:
@@ -266,7 +288,7 @@ async def _handle_failure(self) -> None:
             f"\n\t{self._message}"
         )
 
-        if msg := self.driver._job_error_message_by_iens.get(self.iens, ""):
+        if msg := self.driver.error_message(self.iens):
             error_msg += f"\nDriver reported: {msg}"
 
         error_msg += self.driver.read_stdout_and_stderr_files(
@@ -295,6 +317,14 @@ async def _send(self, state: JobState) -> None:
             "real": str(self.iens),
             "exec_hosts": self.exec_hosts,
         }
+        if state == JobState.PENDING and self._scheduler.submit_sleep_state:
+            event_dict["submit_rate"] = self._scheduler.submit_sleep_state.submit_rate
+        if state in {JobState.COMPLETED, JobState.FAILED}:
+            event_dict["ingestion_backlog"] = self._scheduler.ingestion_backlog
+        if self.state == JobState.PENDING:
+            self._scheduler.pending_jobs -= 1
+        if state == JobState.PENDING:
+            self._scheduler.pending_jobs += 1
         self.state = state
         if state == JobState.FAILED:
             event_dict["message"] = self._message
@@ -314,6 +344,27 @@ async def _send(self, state: JobState) -> None:
         await self._scheduler._events.put(msg)
 
 
+def _md5sum(path: Path) -> str:
+    md5 = hashlib.md5()
+    with open(path, "rb") as f:
+        while chunk := f.read(_CHECKSUM_CHUNK_SIZE):
+            md5.update(chunk)
+    return md5.hexdigest()
+
+
+async def _wait_with_backoff(condition: Callable[[], bool], timeout: float) -> float:
+    """Waits until condition is true or timeout seconds have passed, checking
+    it with exponentially increasing intervals. Returns the time waited."""
+    waited = 0.0
+    interval = _INITIAL_WAIT_INTERVAL
+    while not condition() and waited < timeout:
+        delay = min(interval, timeout - waited)
+        await asyncio.sleep(delay)
+        waited += delay
+        interval = min(2 * interval, _MAX_WAIT_INTERVAL)
+    return waited
+
+
 def log_info_from_exit_file(exit_file_path: Path) -> None:
     if not exit_file_path.exists():
         return
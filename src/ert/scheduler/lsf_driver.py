@@ -21,13 +21,24 @@
     MutableMapping,
     Optional,
     Sequence,
+    Set,
     Type,
     Union,
     cast,
     get_args,
 )
 
-from .driver import SIGNAL_OFFSET, Driver, FailedSubmit, create_submit_script
+from .driver import (
+    SIGNAL_OFFSET,
+    AdaptivePollPeriod,
+    ArraySubmitter,
+    ArrayTask,
+    BatchedQuery,
+    Driver,
+    FailedSubmit,
+    create_array_submit_script,
+    create_submit_script,
+)
 from .event import Event, FinishedEvent, StartedEvent
 
 _POLL_PERIOD = 2.0  # seconds
@@ -135,6 +146,15 @@ def parse_bjobs(bjobs_output: str) -> Dict[str, JobState]:
     return data
 
 
+def _parse_exit_code(output: str) -> int:
+    try:
+        return int(output)
+    except ValueError:
+        # bjobs will sometimes return only "-" as exit code.
+        # running bhist will not help in this case.
+        return LSF_FAILED_JOB
+
+
 def parse_bjobs_exec_hosts(bjobs_output: str) -> Dict[str, str]:
     data: Dict[str, str] = {}
     for line in bjobs_output.splitlines():
@@ -264,6 +284,8 @@ def __init__(
         bjobs_cmd: Optional[str] = None,
         bkill_cmd: Optional[str] = None,
         bhist_cmd: Optional[str] = None,
+        array_submit: bool = False,
+        max_array_size: int = 1000,
         activate_script: str = "",
     ) -> None:
         super().__init__(activate_script)
@@ -286,6 +308,8 @@ def __init__(
         self._max_bsub_attempts = 10
 
         self._poll_period = _POLL_PERIOD
+        self._adaptive_poll_period = AdaptivePollPeriod()
+        self._exit_code_query = BatchedQuery(self._get_exit_codes)
 
         self._bhist_cmd = Path(bhist_cmd or shutil.which("bhist") or "bhist")
         self._bhist_cache: Optional[Dict[str, Dict[str, int]]] = None
@@ -293,6 +317,10 @@ def __init__(
         self._bhist_cache_timestamp: float = time.time()
 
         self._submit_locks: MutableMapping[int, asyncio.Lock] = {}
+        if array_submit:
+            self._array_submitter = ArraySubmitter(
+                self._submit_array, max_size=max_array_size
+            )
 
     async def submit(
         self,
@@ -308,33 +336,34 @@ async def submit(
         if runpath is None:
             runpath = Path.cwd()
 
-        arg_queue_name = ["-q", self._queue_name] if self._queue_name else []
-        arg_project_code = ["-P", self._project_code] if self._project_code else []
+        if iens not in self._submit_locks:
+            self._submit_locks[iens] = asyncio.Lock()
+
+        if self._array_submitter is not None:
+            async with self._submit_locks[iens]:
+                await self._array_submitter.submit(
+                    ArrayTask(
+                        iens,
+                        executable,
+                        args,
+                        name,
+                        runpath,
+                        num_cpu or 1,
+                        realization_memory or 0,
+                    )
+                )
+            return
+
         script = create_submit_script(runpath, executable, args, self.activate_script)
-        script_path: Optional[Path] = None
         try:
-            with NamedTemporaryFile(
-                dir=runpath,
-                prefix=".lsf_submit_",
-                suffix=".sh",
-                mode="w",
-                encoding="utf-8",
-                delete=False,
-            ) as script_handle:
-                script_handle.write(script)
-                script_path = Path(script_handle.name)
-        except OSError as err:
-            error_message = f"Could not create submit script: {err}"
-            self._job_error_message_by_iens[iens] = error_message
-            raise FailedSubmit(error_message) from err
-
-        assert script_path is not None
-        script_path.chmod(script_path.stat().st_mode | stat.S_IEXEC)
+            script_path = _write_submit_script(runpath, script)
+        except FailedSubmit as err:
+            self._job_error_message_by_iens[iens] = str(err)
+            raise
 
         bsub_with_args: list[str] = [
             str(self._bsub_cmd),
-            *arg_queue_name,
-            *arg_project_code,
+            *self._queue_and_project_args(),
             "-o",
             str(runpath / (name + ".LSF-stdout")),
             "-e",
@@ -350,44 +379,98 @@ async def submit(
             str(runpath),
         ]
 
-        if iens not in self._submit_locks:
-            self._submit_locks[iens] = asyncio.Lock()
-
         async with self._submit_locks[iens]:
-            logger.debug(f"Submitting to LSF with command {shlex.join(bsub_with_args)}")
-            process_success, process_message = await self._execute_with_retry(
-                bsub_with_args,
-                retry_on_empty_stdout=True,
-                retry_codes=(FLAKY_SSH_RETURNCODE,),
-                total_attempts=self._max_bsub_attempts,
-                retry_interval=self._sleep_time_between_cmd_retries,
-                error_on_msgs=BSUB_FAILURE_MESSAGES,
-            )
-            if not process_success:
-                self._job_error_message_by_iens[iens] = process_message
-                raise FailedSubmit(process_message)
-
-            match = re.search(
-                r"Job <([0-9]+)> is submitted to .*queue", process_message
-            )
-            if match is None:
-                raise FailedSubmit(
-                    f"Could not understand '{process_message}' from bsub"
-                )
-            job_id = match[1]
+            try:
+                job_id = await self._run_bsub(bsub_with_args)
+            except FailedSubmit as err:
+                self._job_error_message_by_iens[iens] = str(err)
+                raise
             logger.info(f"Realization {iens} accepted by LSF, got id {job_id}")
+            self._add_job(iens, job_id, runpath)
+
+    async def _submit_array(self, tasks: List[ArrayTask]) -> Dict[int, str]:
+        """Submits the tasks as one array job, where task i runs the i-th
+        task, as LSF array indices start at one and may not exceed
+        MAX_JOB_ARRAY_SIZE"""
+        first_task = tasks[0]
+        script = create_array_submit_script(
+            "LSB_JOBINDEX",
+            dict(enumerate(tasks, start=1)),
+            self.activate_script,
+            output_suffixes=(".LSF-stdout", ".LSF-stderr"),
+        )
+        try:
+            script_path = _write_submit_script(first_task.runpath, script)
+            bsub_with_args: list[str] = [
+                str(self._bsub_cmd),
+                *self._queue_and_project_args(),
+                # The tasks write their output in their own runpath
+                "-o",
+                "/dev/null",
+                "-e",
+                "/dev/null",
+                "-n",
+                str(first_task.num_cpu),
+                *self._build_resource_requirement_arg(
+                    realization_memory=first_task.realization_memory
+                ),
+                "-J",
+                f"{first_task.name}[1-{len(tasks)}]",
+                str(script_path),
+            ]
+            array_job_id = await self._run_bsub(bsub_with_args)
+        except FailedSubmit as err:
+            for task in tasks:
+                self._job_error_message_by_iens[task.iens] = str(err)
+            raise
+        logger.info(
+            f"{len(tasks)} realizations accepted by LSF as array job {array_job_id}"
+        )
 
-            (Path(runpath) / LSF_INFO_JSON_FILENAME).write_text(
-                json.dumps({"job_id": job_id}), encoding="utf-8"
-            )
-            self._jobs[job_id] = JobData(
-                iens=iens,
-                job_state=QueuedJob(job_state="PEND"),
-                submitted_timestamp=time.time(),
-            )
-            self._iens2jobid[iens] = job_id
+        job_ids = {}
+        for index, task in enumerate(tasks, start=1):
+            job_ids[task.iens] = f"{array_job_id}[{index}]"
+            self._add_job(task.iens, job_ids[task.iens], task.runpath)
+        return job_ids
+
+    def _queue_and_project_args(self) -> List[str]:
+        arg_queue_name = ["-q", self._queue_name] if self._queue_name else []
+        arg_project_code = ["-P", self._project_code] if self._project_code else []
+        return [*arg_queue_name, *arg_project_code]
+
+    async def _run_bsub(self, bsub_with_args: List[str]) -> str:
+        """Runs bsub and returns the job id it gives"""
+        logger.debug(f"Submitting to LSF with command {shlex.join(bsub_with_args)}")
+        process_success, process_message = await self._execute_with_retry(
+            bsub_with_args,
+            retry_on_empty_stdout=True,
+            retry_codes=(FLAKY_SSH_RETURNCODE,),
+            total_attempts=self._max_bsub_attempts,
+            retry_interval=self._sleep_time_between_cmd_retries,
+            error_on_msgs=BSUB_FAILURE_MESSAGES,
+        )
+        if not process_success:
+            raise FailedSubmit(process_message)
+
+        match = re.search(r"Job <([0-9]+)> is submitted to .*queue", process_message)
+        if match is None:
+            raise FailedSubmit(f"Could not understand '{process_message}' from bsub")
+        return match[1]
+
+    def _add_job(self, iens: int, job_id: str, runpath: Path) -> None:
+        (Path(runpath) / LSF_INFO_JSON_FILENAME).write_text(
+            json.dumps({"job_id": job_id}), encoding="utf-8"
+        )
+        self._jobs[job_id] = JobData(
+            iens=iens,
+            job_state=QueuedJob(job_state="PEND"),
+            submitted_timestamp=time.time(),
+        )
+        self._iens2jobid[iens] = job_id
 
     async def kill(self, iens: int) -> None:
+        if self._array_submitter is not None:
+            await self._array_submitter.settle(iens)
         if iens not in self._submit_locks:
             logger.error(
                 f"LSF kill failed, realization {iens} has never been submitted"
@@ -419,14 +502,16 @@ async def kill(self, iens: int) -> None:
                 return_on_msgs=(JOB_ALREADY_FINISHED_BKILL_MSG),
             )
             await asyncio.create_subprocess_shell(
-                f"sleep {self._sleep_time_between_bkills}; {self._bkill_cmd} -s SIGKILL {job_id}",
+                f"sleep {self._sleep_time_between_bkills}; "
+                f"{self._bkill_cmd} -s SIGKILL {shlex.quote(job_id)}",
                 start_new_session=True,
                 stdout=asyncio.subprocess.DEVNULL,
                 stderr=asyncio.subprocess.DEVNULL,
             )
 
             if not re.search(
-                f"Job <{job_id}> is being (terminated|signaled)", process_message
+                f"Job <{re.escape(job_id)}> is being (terminated|signaled)",
+                process_message,
             ):
                 if JOB_ALREADY_FINISHED_BKILL_MSG in process_message:
                     logger.debug(f"LSF kill failed with: {process_message}")
@@ -441,30 +526,26 @@ async def poll(self) -> None:
             current_jobids = list(self._jobs.keys())
 
             try:
-                process = await asyncio.create_subprocess_exec(
+                returncode, stdout, stderr = await self._run_command(
                     str(self._bjobs_cmd),
                     "-noheader",
                     "-o",
-                    "jobid stat exec_host delimiter='^'",
+                    self._bjobs_format("jobid stat exec_host"),
                     *current_jobids,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
                 )
             except FileNotFoundError as e:
                 logger.error(str(e))
                 return
 
-            stdout, stderr = await process.communicate()
-            if process.returncode:
+            if returncode:
                 # bjobs may give nonzero return code even when it is providing
                 # at least some correct information
                 logger.warning(
-                    f"bjobs gave returncode {process.returncode} and error {stderr.decode()}"
+                    f"bjobs gave returncode {returncode} and error {stderr.decode()}"
                 )
-            bjobs_states = _parse_jobs_dict(parse_bjobs(stdout.decode(errors="ignore")))
-            self.update_and_log_exec_hosts(
-                parse_bjobs_exec_hosts(stdout.decode(errors="ignore"))
-            )
+            bjobs_output = self._with_array_indices(stdout.decode(errors="ignore"))
+            bjobs_states = _parse_jobs_dict(parse_bjobs(bjobs_output))
+            self.update_and_log_exec_hosts(parse_bjobs_exec_hosts(bjobs_output))
 
             job_ids_found_in_bjobs_output = set(bjobs_states.keys())
             if (
@@ -482,16 +563,31 @@ async def poll(self) -> None:
                 bhist_states = {}
                 missing_in_bhist_and_bjobs = set()
 
-            for job_id, job in itertools.chain(
-                bjobs_states.items(), bhist_states.items()
-            ):
-                await self._process_job_update(job_id, new_state=job)
+            # Updates are processed concurrently, so that the exit codes of
+            # failed jobs are fetched together
+            await asyncio.gather(
+                *(
+                    self._process_job_update(job_id, new_state=job)
+                    for job_id, job in itertools.chain(
+                        bjobs_states.items(), bhist_states.items()
+                    )
+                )
+            )
 
             if missing_in_bhist_and_bjobs and self._bhist_cache is not None:
                 logger.debug(
                     f"bhist did not give status for job_ids {missing_in_bhist_and_bjobs}, giving up for now."
                 )
-            await asyncio.sleep(self._poll_period)
+            job_states = {job_id: job.job_state for job_id, job in self._jobs.items()}
+            await asyncio.sleep(
+                self._adaptive_poll_period.next_period(
+                    self._poll_period,
+                    job_states,
+                    num_pending=sum(
+                        isinstance(state, QueuedJob) for state in job_states.values()
+                    ),
+                )
+            )
 
     async def _process_job_update(self, job_id: str, new_state: AnyJob) -> None:
         if job_id not in self._jobs:
@@ -536,22 +632,66 @@ async def _process_job_update(self, job_id: str, new_state: AnyJob) -> None:
             await self.event_queue.put(event)
 
     async def _get_exit_code(self, job_id: str) -> int:
+        exit_code = await self._exit_code_query.get(job_id)
+        return LSF_FAILED_JOB if exit_code is None else exit_code
+
+    async def _get_exit_codes(self, job_ids: Set[str]) -> Dict[str, int]:
+        if len(job_ids) == 1:
+            job_id = next(iter(job_ids))
+            success, output = await self._execute_with_retry(
+                [f"{self._bjobs_cmd}", "-o exit_code", "-noheader", f"{job_id}"],
+                retry_codes=(FLAKY_SSH_RETURNCODE,),
+                total_attempts=3,
+                retry_interval=self._sleep_time_between_cmd_retries,
+            )
+            if not success:
+                return {job_id: await self._get_exit_code_from_bhist(job_id)}
+            return {job_id: _parse_exit_code(output)}
+
         success, output = await self._execute_with_retry(
-            [f"{self._bjobs_cmd}", "-o exit_code", "-noheader", f"{job_id}"],
+            [
+                f"{self._bjobs_cmd}",
+                "-o",
+                self._bjobs_format("jobid exit_code"),
+                "-noheader",
+                *sorted(job_ids),
+            ],
             retry_codes=(FLAKY_SSH_RETURNCODE,),
             total_attempts=3,
             retry_interval=self._sleep_time_between_cmd_retries,
         )
-
         if not success:
-            return await self._get_exit_code_from_bhist(job_id)
-        else:
-            try:
-                return int(output)
-            except ValueError:
-                # bjobs will sometimes return only "-" as exit code.
-                # running bhist will not help in this case.
-                return LSF_FAILED_JOB
+            bhist_exit_codes = await asyncio.gather(
+                *(self._get_exit_code_from_bhist(job_id) for job_id in job_ids)
+            )
+            return dict(zip(job_ids, bhist_exit_codes, strict=True))
+        exit_codes = {}
+        for line in self._with_array_indices(output).splitlines():
+            job_id, _, exit_code = line.partition("^")
+            exit_codes[job_id.strip()] = _parse_exit_code(exit_code)
+        return {job_id: exit_codes.get(job_id, LSF_FAILED_JOB) for job_id in job_ids}
+
+    def _bjobs_format(self, fields: str) -> str:
+        if self._array_submitter is not None:
+            # The tasks of array jobs share the job id and differ by index
+            fields = fields.replace("jobid", "jobid jobindex")
+        return f"{fields} delimiter='^'"
+
+    def _with_array_indices(self, bjobs_output: str) -> str:
+        """Joins the job ids and indices of array tasks in output from
+        _bjobs_format into the task ids used when they were submitted"""
+        if self._array_submitter is None:
+            return bjobs_output
+        lines = []
+        for line in bjobs_output.splitlines():
+            job_id, _, rest = line.partition("^")
+            index, _, rest = rest.partition("^")
+            lines.append(
+                f"{job_id}^{rest}"
+                if index in {"0", "-"}
+                else f"{job_id}[{index}]^{rest}"
+            )
+        return "\n".join(lines)
 
     async def _get_exit_code_from_bhist(self, job_id: str) -> int:
         success, output = await self._execute_with_retry(
@@ -589,16 +729,13 @@ async def _poll_once_by_bhist(
         if time.time() - self._bhist_cache_timestamp < self._bhist_required_cache_age:
             return {}
 
-        process = await asyncio.create_subprocess_exec(
-            self._bhist_cmd,
+        returncode, stdout, stderr = await self._run_command(
+            str(self._bhist_cmd),
             *[str(job_id) for job_id in missing_job_ids],
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
         )
-        stdout, stderr = await process.communicate()
-        if process.returncode:
+        if returncode:
             logger.error(
-                f"bhist gave returncode {process.returncode} with "
+                f"bhist gave returncode {returncode} with "
                 f"output{stdout.decode(errors='ignore').strip()} "
                 f"and error {stderr.decode(errors='ignore').strip()}"
             )
@@ -679,3 +816,21 @@ def tail_textfile(file_path: Path, num_chars: int) -> str:
         seek_position = max(0, file_end_position - num_chars)
         file.seek(seek_position)
         return file.read()[-num_chars:]
+
+
+def _write_submit_script(runpath: Path, script: str) -> Path:
+    try:
+        with NamedTemporaryFile(
+            dir=runpath,
+            prefix=".lsf_submit_",
+            suffix=".sh",
+            mode="w",
+            encoding="utf-8",
+            delete=False,
+        ) as script_handle:
+            script_handle.write(script)
+            script_path = Path(script_handle.name)
+    except OSError as err:
+        raise FailedSubmit(f"Could not create submit script: {err}") from err
+    script_path.chmod(script_path.stat().st_mode | stat.S_IEXEC)
+    return script_path
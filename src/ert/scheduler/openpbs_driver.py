@@ -23,7 +23,15 @@
     get_type_hints,
 )
 
-from .driver import Driver, FailedSubmit, create_submit_script
+from .driver import (
+    AdaptivePollPeriod,
+    ArraySubmitter,
+    ArrayTask,
+    Driver,
+    FailedSubmit,
+    create_array_submit_script,
+    create_submit_script,
+)
 from .event import Event, FinishedEvent, StartedEvent
 
 logger = logging.getLogger(__name__)
@@ -145,6 +153,8 @@ def __init__(
         qsub_cmd: Optional[str] = None,
         qstat_cmd: Optional[str] = None,
         qdel_cmd: Optional[str] = None,
+        array_submit: bool = False,
+        max_array_size: int = 1000,
         activate_script: str = "",
     ) -> None:
         super().__init__(activate_script)
@@ -160,6 +170,7 @@ def __init__(
         self._max_pbs_cmd_attempts = 10
         self._sleep_time_between_cmd_retries = 2
         self._poll_period = _POLL_PERIOD
+        self._adaptive_poll_period = AdaptivePollPeriod()
 
         self._qsub_cmd = Path(qsub_cmd or shutil.which("qsub") or "qsub")
         self._qstat_cmd = Path(qstat_cmd or shutil.which("qstat") or "qstat")
@@ -170,6 +181,10 @@ def __init__(
         self._non_finished_job_ids: Set[str] = set()
         self._finished_job_ids: Set[str] = set()
         self._finished_iens: Set[int] = set()
+        if array_submit:
+            self._array_submitter = ArraySubmitter(
+                self._submit_array, max_size=max_array_size
+            )
 
         if self._num_nodes is not None and self._num_nodes > 1:
             logger.warning(
@@ -236,25 +251,120 @@ async def submit(
         if runpath is None:
             runpath = Path.cwd()
 
+        if self._array_submitter is not None:
+            await self._array_submitter.submit(
+                ArrayTask(
+                    iens,
+                    executable,
+                    args,
+                    name,
+                    runpath,
+                    num_cpu or 1,
+                    realization_memory or 0,
+                )
+            )
+            return
+        await self._submit_job(
+            iens, executable, args, name, runpath, num_cpu or 1, realization_memory or 0
+        )
+
+    async def _submit_job(
+        self,
+        iens: int,
+        executable: str,
+        args: Tuple[str, ...],
+        name: str,
+        runpath: Path,
+        num_cpu: int,
+        realization_memory: int,
+    ) -> None:
+        script = create_submit_script(runpath, executable, args, self.activate_script)
+        qsub_with_args = self._qsub_with_args(
+            name, num_cpu=num_cpu, realization_memory=realization_memory
+        )
+        try:
+            job_id_ = await self._run_qsub(qsub_with_args, script)
+        except FailedSubmit as err:
+            self._job_error_message_by_iens[iens] = str(err)
+            raise
+        logger.debug(f"Realization {iens} accepted by PBS, got id {job_id_}")
+        self._add_job(iens, job_id_)
+
+    async def _submit_array(self, tasks: List[ArrayTask]) -> Dict[int, str]:
+        """Submits the tasks as one array job, where subjob i runs the i-th
+        task, as PBS array indices form a range"""
+        first_task = tasks[0]
+        if len(tasks) == 1:
+            # PBS does not accept array jobs with only one subjob
+            await self._submit_job(
+                first_task.iens,
+                first_task.executable,
+                first_task.args,
+                first_task.name,
+                first_task.runpath,
+                first_task.num_cpu,
+                first_task.realization_memory,
+            )
+            return {first_task.iens: self._iens2jobid[first_task.iens]}
+
+        script = create_array_submit_script(
+            "PBS_ARRAY_INDEX", dict(enumerate(tasks)), self.activate_script
+        )
+        qsub_with_args = self._qsub_with_args(
+            first_task.name,
+            num_cpu=first_task.num_cpu,
+            realization_memory=first_task.realization_memory,
+            array_range=f"0-{len(tasks) - 1}",
+        )
+        try:
+            array_job_id = await self._run_qsub(qsub_with_args, script)
+            if "[]" not in array_job_id:
+                raise FailedSubmit(
+                    f"Could not understand '{array_job_id}' from qsub as an array job"
+                )
+        except FailedSubmit as err:
+            for task in tasks:
+                self._job_error_message_by_iens[task.iens] = str(err)
+            raise
+        logger.debug(
+            f"{len(tasks)} realizations accepted by PBS as array job {array_job_id}"
+        )
+
+        job_ids = {}
+        for index, task in enumerate(tasks):
+            job_ids[task.iens] = array_job_id.replace("[]", f"[{index}]")
+            self._add_job(task.iens, job_ids[task.iens])
+        return job_ids
+
+    def _qsub_with_args(
+        self,
+        name: str,
+        num_cpu: int,
+        realization_memory: int,
+        array_range: Optional[str] = None,
+    ) -> List[str]:
         arg_queue_name = ["-q", self._queue_name] if self._queue_name else []
         arg_project_code = ["-A", self._project_code] if self._project_code else []
         arg_keep_qsub_output = (
             [] if self._keep_qsub_output else ["-o", "/dev/null", "-e", "/dev/null"]
         )
-
-        script = create_submit_script(runpath, executable, args, self.activate_script)
         name_prefix = self._job_prefix or ""
-        qsub_with_args: List[str] = [
+        return [
             str(self._qsub_cmd),
-            "-rn",  # Don't restart on failure
+            # Don't restart on failure. PBS requires the subjobs of array
+            # jobs to be rerunnable
+            *(["-J", array_range] if array_range else ["-rn"]),
             f"-N{name_prefix}{name}",  # Set name of job
             *arg_queue_name,
             *arg_project_code,
             *arg_keep_qsub_output,
             *self._build_resource_string(
-                num_cpu=num_cpu or 1, realization_memory=realization_memory or 0
+                num_cpu=num_cpu, realization_memory=realization_memory
             ),
         ]
+
+    async def _run_qsub(self, qsub_with_args: List[str], script: str) -> str:
+        """Runs qsub with the script on stdin and returns the job id it gives"""
         logger.debug(f"Submitting to PBS with command {shlex.join(qsub_with_args)}")
 
         process_success, process_message = await self._execute_with_retry(
@@ -270,16 +380,17 @@ async def submit(
             driverlogger=logger,
         )
         if not process_success:
-            self._job_error_message_by_iens[iens] = process_message
             raise FailedSubmit(process_message)
+        return process_message
 
-        job_id_ = process_message
-        logger.debug(f"Realization {iens} accepted by PBS, got id {job_id_}")
-        self._jobs[job_id_] = (iens, QueuedJob())
-        self._iens2jobid[iens] = job_id_
-        self._non_finished_job_ids.add(job_id_)
+    def _add_job(self, iens: int, job_id: str) -> None:
+        self._jobs[job_id] = (iens, QueuedJob())
+        self._iens2jobid[iens] = job_id
+        self._non_finished_job_ids.add(job_id)
 
     async def kill(self, iens: int) -> None:
+        if self._array_submitter is not None:
+            await self._array_submitter.settle(iens)
         if iens in self._finished_iens:
             return
 
@@ -310,24 +421,21 @@ async def poll(self) -> None:
 
             if self._non_finished_job_ids:
                 try:
-                    process = await asyncio.create_subprocess_exec(
+                    returncode, stdout, stderr = await self._run_command(
                         str(self._qstat_cmd),
                         "-Ex",
                         "-w",  # wide format
                         *self._non_finished_job_ids,
-                        stdout=asyncio.subprocess.PIPE,
-                        stderr=asyncio.subprocess.PIPE,
                     )
                 except FileNotFoundError as e:
                     logger.error(str(e))
                     return
-                stdout, stderr = await process.communicate()
-                if process.returncode not in {0, QSTAT_UNKNOWN_JOB_ID}:
+                if returncode not in {0, QSTAT_UNKNOWN_JOB_ID}:
                     # Any unknown job ids will yield QSTAT_UNKNOWN_JOB_ID, but
                     # results for other job ids on stdout can be assumed valid.
                     await asyncio.sleep(self._poll_period)
                     continue
-                if process.returncode == QSTAT_UNKNOWN_JOB_ID:
+                if returncode == QSTAT_UNKNOWN_JOB_ID:
                     logger.debug(
                         f"qstat gave returncode {QSTAT_UNKNOWN_JOB_ID} "
                         f"with message {stderr.decode(errors='ignore')}"
@@ -343,21 +451,18 @@ async def poll(self) -> None:
                         await self._process_job_update(job_id, job)
 
             if self._finished_job_ids:
-                process = await asyncio.create_subprocess_exec(
+                returncode, stdout, stderr = await self._run_command(
                     str(self._qstat_cmd),
                     "-Efx",
                     "-Fjson",
                     *self._finished_job_ids,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
                 )
-                stdout, stderr = await process.communicate()
-                if process.returncode not in {0, QSTAT_UNKNOWN_JOB_ID}:
+                if returncode not in {0, QSTAT_UNKNOWN_JOB_ID}:
                     # Any unknown job ids will yield QSTAT_UNKNOWN_JOB_ID, but
                     # results for other job ids on stdout can be assumed valid.
                     await asyncio.sleep(self._poll_period)
                     continue
-                if process.returncode == QSTAT_UNKNOWN_JOB_ID:
+                if returncode == QSTAT_UNKNOWN_JOB_ID:
                     logger.debug(
                         f"qstat gave returncode {QSTAT_UNKNOWN_JOB_ID} "
                         f"with message {stderr.decode(errors='ignore')}"
@@ -369,7 +474,16 @@ async def poll(self) -> None:
                 for job_id, job in parsed_jobs_dict.items():
                     await self._process_job_update(job_id, job)
 
-            await asyncio.sleep(self._poll_period)
+            job_states = {job_id: state for job_id, (_, state) in self._jobs.items()}
+            await asyncio.sleep(
+                self._adaptive_poll_period.next_period(
+                    self._poll_period,
+                    job_states,
+                    num_pending=sum(
+                        isinstance(state, QueuedJob) for state in job_states.values()
+                    ),
+                )
+            )
 
     async def _process_job_update(self, job_id: str, new_state: AnyJob) -> None:
         if job_id not in self._jobs:
@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+import shlex
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+from .driver import ArraySubmitter, ArrayTask, Driver
+from .event import FinishedEvent, StartedEvent
+
+logger = logging.getLogger(__name__)
+
+PACK_SCRIPT = ".ert_pack.sh"
+"""The script running the realizations of a pack, in the runpath of its first realization"""
+KILL_FILE = ".ert_pack_kill"
+"""Created in the runpath of a realization to have the pack kill it"""
+STARTED_FILE = ".ert_pack_started"
+"""Created by the pack in the runpath of a realization when it starts"""
+RETURNCODE_FILE = ".ert_pack_returncode"
+"""Written by the pack in the runpath of a realization when it has finished"""
+
+
+def create_pack_script(tasks: List[ArrayTask], parallel: bool) -> str:
+    """The script of a pack, which runs each realization from its runpath,
+    marking there when it starts and writing its return code when it has
+    finished. A realization is killed when the kill file appears in its
+    runpath."""
+    lines = [
+        "#!/usr/bin/env bash",
+        "run_realization() {",
+        "  trap 'kill -TERM $(jobs -p) 2>/dev/null; exit 143' TERM INT",
+        '  cd "$1" || return 1',
+        "  shift",
+        f"  touch {STARTED_FILE}",
+        '  "$@" &',
+        "  local pid=$!",
+        f'  (while kill -0 "$pid" 2>/dev/null; do if [ -e {KILL_FILE} ]; '
+        'then kill -TERM "$pid"; exit; fi; sleep 1; done) &',
+        "  local watcher=$!",
+        '  wait "$pid"',
+        "  local returncode=$?",
+        '  kill "$watcher" 2>/dev/null',
+        f'  echo "$returncode" > {RETURNCODE_FILE}',
+        "}",
+        "trap 'kill -TERM $(jobs -p) 2>/dev/null; exit 143' TERM INT",
+    ]
+    for task in tasks:
+        lines.append(
+            "run_realization "
+            + shlex.join((str(task.runpath), task.executable, *task.args))
+            + (" &" if parallel else "")
+        )
+    if parallel:
+        lines.append("wait")
+    return "\n".join(lines) + "\n"
+
+
+@dataclass
+class _Pack:
+    pack_id: int
+    tasks: Dict[int, ArrayTask]
+    running: Set[int] = field(default_factory=set)
+    started: Set[int] = field(default_factory=set)
+    finished: Set[int] = field(default_factory=set)
+    exec_hosts: str = "-"
+
+    @property
+    def first(self) -> ArrayTask:
+        return next(iter(self.tasks.values()))
+
+
+class PackedDriver(Driver):
+    """Runs the realizations submitted close together in packs of at most
+    pack_size realizations, each pack being one job of the wrapped driver, so
+    that the queue system is called once for every pack. The realizations of
+    a pack run in parallel, with the resources of all of them booked, or one
+    after the other.
+
+    Each realization still runs its own forward model dispatcher, which
+    reports its events to the evaluator. The start and end of each
+    realization are picked up from the files the pack writes in its runpath,
+    so that a realization is reported as running only while it actually
+    runs."""
+
+    RUNPATH_POLL_PERIOD = 1.0
+
+    def __init__(self, driver: Driver, pack_size: int, parallel: bool = True) -> None:
+        super().__init__(driver.activate_script)
+        self._driver = driver
+        self._parallel = parallel
+        self.metrics = driver.metrics
+        self._pack_submitter = ArraySubmitter(self._submit_pack, max_size=pack_size)
+        self._pack_ids = itertools.count()
+        self._packs: Dict[int, _Pack] = {}
+        self._pack_by_iens: Dict[int, _Pack] = {}
+
+    @property
+    def gathers_submits(self) -> bool:
+        return True
+
+    async def submit(
+        self,
+        iens: int,
+        executable: str,
+        /,
+        *args: str,
+        name: str = "dummy",
+        runpath: Optional[Path] = None,
+        num_cpu: Optional[int] = 1,
+        realization_memory: Optional[int] = 0,
+    ) -> None:
+        await self._pack_submitter.submit(
+            ArrayTask(
+                iens=iens,
+                executable=executable,
+                args=args,
+                name=name,
+                runpath=runpath or Path.cwd(),
+                num_cpu=num_cpu or 1,
+                realization_memory=realization_memory or 0,
+            )
+        )
+
+    async def _submit_pack(self, tasks: List[ArrayTask]) -> Dict[int, str]:
+        pack = _Pack(
+            next(self._pack_ids),
+            {task.iens: task for task in tasks},
+            running={task.iens for task in tasks},
+        )
+        for task in tasks:
+            for stale_file in (KILL_FILE, STARTED_FILE, RETURNCODE_FILE):
+                (task.runpath / stale_file).unlink(missing_ok=True)
+        script = pack.first.runpath / PACK_SCRIPT
+        script.write_text(create_pack_script(tasks, self._parallel), encoding="utf-8")
+        booked = len(tasks) if self._parallel else 1
+        self._packs[pack.pack_id] = pack
+        try:
+            await self._driver.submit(
+                pack.pack_id,
+                "bash",
+                str(script),
+                name=pack.first.name,
+                runpath=pack.first.runpath,
+                num_cpu=pack.first.num_cpu * booked,
+                realization_memory=pack.first.realization_memory * booked,
+            )
+        except Exception:
+            del self._packs[pack.pack_id]
+            raise
+        logger.info(
+            f"Submitted realizations {sorted(pack.tasks)} as pack {pack.pack_id}"
+        )
+        for iens in pack.tasks:
+            self._pack_by_iens[iens] = pack
+        return {iens: str(pack.pack_id) for iens in pack.tasks}
+
+    async def kill(self, iens: int) -> None:
+        await self._pack_submitter.settle(iens)
+        pack = self._pack_by_iens.get(iens)
+        if pack is None or iens not in pack.running:
+            return
+        pack.running.discard(iens)
+        if pack.running:
+            logger.info(f"Killing realization {iens} in pack {pack.pack_id}")
+            (pack.tasks[iens].runpath / KILL_FILE).touch()
+        else:
+            await self._driver.kill(pack.pack_id)
+
+    async def poll(self) -> None:
+        await asyncio.gather(
+            self._driver.poll(), self._forward_events(), self._watch_runpaths()
+        )
+
+    async def _forward_events(self) -> None:
+        while True:
+            event = await self._driver.event_queue.get()
+            pack = self._packs.get(event.iens)
+            if pack is None:
+                continue
+            if isinstance(event, StartedEvent):
+                pack.exec_hosts = event.exec_hosts
+                await self._check_runpaths(pack)
+            elif isinstance(event, FinishedEvent):
+                del self._packs[pack.pack_id]
+                pack.running.clear()
+                pack.exec_hosts = event.exec_hosts
+                error_message = self._driver.error_message(pack.pack_id)
+                for iens, task in pack.tasks.items():
+                    if iens in pack.finished:
+                        continue
+                    if error_message:
+                        self._job_error_message_by_iens[iens] = error_message
+                    returncode = self._returncode(task)
+                    if returncode is None:
+                        # The realization never finished, so the pack failed
+                        returncode = event.returncode or 1
+                    await self._finish_realization(pack, iens, returncode)
+
+    async def _watch_runpaths(self) -> None:
+        while True:
+            for pack in list(self._packs.values()):
+                await self._check_runpaths(pack)
+            await asyncio.sleep(self.RUNPATH_POLL_PERIOD)
+
+    async def _check_runpaths(self, pack: _Pack) -> None:
+        """Reports the realizations of the pack that have started or finished
+        since the last check"""
+        for iens, task in pack.tasks.items():
+            if iens in pack.finished:
+                continue
+            returncode = self._returncode(task)
+            if returncode is not None:
+                pack.running.discard(iens)
+                await self._finish_realization(pack, iens, returncode)
+            elif iens not in pack.started and (task.runpath / STARTED_FILE).exists():
+                await self._start_realization(pack, iens)
+
+    async def _start_realization(self, pack: _Pack, iens: int) -> None:
+        pack.started.add(iens)
+        await self.event_queue.put(StartedEvent(iens=iens, exec_hosts=pack.exec_hosts))
+
+    async def _finish_realization(
+        self, pack: _Pack, iens: int, returncode: int
+    ) -> None:
+        pack.finished.add(iens)
+        if iens not in pack.started:
+            await self._start_realization(pack, iens)
+        await self.event_queue.put(
+            FinishedEvent(iens=iens, returncode=returncode, exec_hosts=pack.exec_hosts)
+        )
+
+    @staticmethod
+    def _returncode(task: ArrayTask) -> Optional[int]:
+        """The return code written by the pack for the realization, or None
+        if it has not finished"""
+        try:
+            return int(
+                (task.runpath / RETURNCODE_FILE).read_text(encoding="utf-8").strip()
+            )
+        except (OSError, ValueError):
+            return None
+
+    async def finish(self) -> None:
+        await self._driver.finish()
+
+    def read_stdout_and_stderr_files(
+        self, runpath: str, job_name: str, num_characters_to_read_from_end: int = 300
+    ) -> str:
+        """The output of the pack that ran the realization in runpath"""
+        for pack in self._pack_by_iens.values():
+            if any(str(task.runpath) == runpath for task in pack.tasks.values()):
+                runpath, job_name = str(pack.first.runpath), pack.first.name
+                break
+        return self._driver.read_stdout_and_stderr_files(
+            runpath, job_name, num_characters_to_read_from_end
+        )
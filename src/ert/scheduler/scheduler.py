@@ -6,6 +6,7 @@
 import time
 import traceback
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
 from dataclasses import asdict
 from pathlib import Path
@@ -36,6 +37,11 @@
 
 logger = logging.getLogger(__name__)
 
+_INGESTION_WORKERS = 8
+# Verifying checksums reads whole files, so it gets workers of its own
+# instead of holding up the loading of results
+_CHECKSUM_WORKERS = 2
+
 
 @dataclass
 class _JobsJson:
@@ -63,6 +69,82 @@ async def sleep_until_we_can_submit(self) -> None:
         self._last_started = next_start_time
         await asyncio.sleep(max(0, next_start_time - now))
 
+    @property
+    def submit_rate(self) -> float:
+        """The number of submits allowed per second"""
+        return 1 / self._submit_sleep
+
+    def record_submit(
+        self, started: float, duration: float, failed: bool = False, pending: int = 0
+    ) -> None:
+        """Called after every submit, with the time the submit was started,
+        how long the queue system took to answer, whether it failed and how
+        many jobs are pending in the queue system."""
+
+
+class AdaptiveSubmitSleeper(SubmitSleeper):
+    """Adapts the submit rate to how the queue system responds, using
+    additive increase and multiplicative decrease (AIMD).
+
+    Every submit that is answered within SLOW_SUBMIT seconds increases the
+    rate by RATE_INCREASE submits per second, while a slow or failed submit,
+    or one after which more than MAX_PENDING jobs are pending in the queue
+    system, multiplies the rate by RATE_DECREASE. The rate is only decreased
+    once for the submits that were started before the previous decrease, so
+    a burst of slow submits does not throttle the queue to a halt. A
+    positive submit_sleep bounds the rate from above.
+    """
+
+    INITIAL_RATE = 1.0
+    MIN_RATE = 0.1
+    MAX_RATE = 20.0
+    RATE_INCREASE = 0.5
+    RATE_DECREASE = 0.5
+    SLOW_SUBMIT = 2.0
+    MAX_PENDING = 100
+
+    def __init__(self, submit_sleep: float = 0.0):
+        self._max_rate = (
+            min(self.MAX_RATE, 1 / submit_sleep) if submit_sleep > 0 else self.MAX_RATE
+        )
+        self._rate = min(self.INITIAL_RATE, self._max_rate)
+        self._last_started = time.time() - 1 / self._rate
+        self._last_decrease = 0.0
+        self._lock = asyncio.Lock()
+
+    async def sleep_until_we_can_submit(self) -> None:
+        # Submits wait in turn so that changes to the rate also apply to
+        # the submits that are already waiting
+        async with self._lock:
+            now = time.time()
+            await asyncio.sleep(max(0, self._last_started + 1 / self._rate - now))
+            self._last_started = time.time()
+
+    @property
+    def submit_rate(self) -> float:
+        return self._rate
+
+    def record_submit(
+        self, started: float, duration: float, failed: bool = False, pending: int = 0
+    ) -> None:
+        if failed or duration > self.SLOW_SUBMIT or pending > self.MAX_PENDING:
+            if started < self._last_decrease:
+                return
+            self._rate = max(self.MIN_RATE, self._rate * self.RATE_DECREASE)
+            self._last_decrease = time.time()
+            if failed:
+                reason = f"Submit failed after {duration:.2f}s"
+            elif duration > self.SLOW_SUBMIT:
+                reason = f"Submit was slow after {duration:.2f}s"
+            else:
+                reason = f"{pending} jobs are pending"
+            logger.info(
+                f"{reason}, decreasing submit rate to {self._rate:.2f} per second"
+            )
+        elif self._rate < self._max_rate:
+            self._rate = min(self._max_rate, self._rate + self.RATE_INCREASE)
+            logger.debug(f"Increasing submit rate to {self._rate:.2f} per second")
+
 
 class Scheduler:
     def __init__(
@@ -75,6 +157,8 @@ def __init__(
         max_submit: int = 1,
         max_running: int = 1,
         submit_sleep: float = 0.0,
+        adaptive_submit: bool = False,
+        ingestion_workers: int = _INGESTION_WORKERS,
         ens_id: Optional[str] = None,
         ee_uri: Optional[str] = None,
         ee_cert: Optional[str] = None,
@@ -87,7 +171,16 @@ def __init__(
         self._job_tasks: MutableMapping[int, asyncio.Task[None]] = {}
 
         self.submit_sleep_state: Optional[SubmitSleeper] = None
-        if submit_sleep > 0:
+        # The number of jobs pending in the queue system, kept up to date
+        # by the jobs as they change state
+        self.pending_jobs = 0
+        if driver.gathers_submits:
+            # Realizations submitted together become one job, which
+            # sleeping between the submits would split up
+            pass
+        elif adaptive_submit:
+            self.submit_sleep_state = AdaptiveSubmitSleeper(submit_sleep)
+        elif submit_sleep > 0:
             self.submit_sleep_state = SubmitSleeper(submit_sleep)
 
         self._jobs: MutableMapping[int, Job] = {
@@ -116,6 +209,13 @@ def __init__(
 
         self.checksum: Dict[str, Dict[str, Any]] = {}
 
+        # The results of finished realizations are loaded into storage
+        # concurrently by the ingestion executor while execute() runs
+        self._ingestion_workers = ingestion_workers
+        self.ingestion_executor: Optional[ThreadPoolExecutor] = None
+        self.ingestion_backlog = 0
+        self.checksum_executor: Optional[ThreadPoolExecutor] = None
+
     def kill_all_jobs(self) -> None:
         assert self._loop
         # Checking that the loop is running is required because everest is closing the
@@ -248,10 +348,49 @@ async def _monitor_and_handle_tasks(
                         raise task_exception
                 return
 
+    async def _release_ready_jobs(
+        self, ready_realizations: asyncio.Queue[Optional[int]]
+    ) -> None:
+        """Lets the jobs of the realizations put on ready_realizations be
+        submitted, until None is put on the queue. Jobs whose run path never
+        became ready are cancelled and reported as failed."""
+        while (iens := await ready_realizations.get()) is not None:
+            job = self._jobs[iens]
+            # The job waits for run_path_ready, so the files can be written
+            # off the event loop
+            await asyncio.to_thread(
+                self._update_jobs_json, iens, job.real.run_arg.runpath
+            )
+            if job.state == JobState.ABORTED:
+                self._job_tasks[iens].cancel()
+                await self._events.put(self._unscheduled_failure_event(iens))
+            job.run_path_ready.set()
+        for iens, job in self._jobs.items():
+            if not job.run_path_ready.is_set() and iens in self._job_tasks:
+                self._job_tasks[iens].cancel()
+                await self._events.put(self._unscheduled_failure_event(iens))
+
+    def _unscheduled_failure_event(self, iens: int) -> Event:
+        failure = self._jobs[iens].real.run_arg.ensemble_storage.get_failure(iens)
+        return event_from_dict(
+            {
+                "ensemble": self._ens_id,
+                "event_type": Id.REALIZATION_FAILURE,
+                "queue_event_type": JobState.FAILED,
+                "message": failure.message if failure else None,
+                "real": str(iens),
+            }
+        )
+
     async def execute(
         self,
         min_required_realizations: int = 0,
+        ready_realizations: Optional[asyncio.Queue[Optional[int]]] = None,
     ) -> Union[Id.ENSEMBLE_SUCCEEDED_TYPE, Id.ENSEMBLE_CANCELLED_TYPE]:
+        """Runs the jobs of all realizations. If ready_realizations is given,
+        the run paths are still being created, and a job is only submitted
+        once its realization has been put on the queue. The jobs.json files
+        are then also given the dispatch information as they become ready."""
         scheduling_tasks = [
             asyncio.create_task(self._publisher(), name="publisher_task"),
             asyncio.create_task(
@@ -271,42 +410,49 @@ async def execute(
             )
             scheduling_tasks.append(asyncio.create_task(self._update_avg_job_runtime()))
 
+        if ready_realizations is not None:
+            for job in self._jobs.values():
+                job.run_path_ready.clear()
+
         sem = asyncio.BoundedSemaphore(self._max_running or len(self._jobs))
-        # this lock is to assure that no more than 1 task
-        # does internalization at a time
-        forward_model_ok_lock = asyncio.Lock()
-        verify_checksum_lock = asyncio.Lock()
+        self.ingestion_executor = ThreadPoolExecutor(
+            max_workers=self._ingestion_workers, thread_name_prefix="ingestion"
+        )
+        self.checksum_executor = ThreadPoolExecutor(
+            max_workers=_CHECKSUM_WORKERS, thread_name_prefix="checksum"
+        )
         for iens, job in self._jobs.items():
             await asyncio.sleep(0)
             if job.state != JobState.ABORTED:
                 self._job_tasks[iens] = asyncio.create_task(
                     job.run(
                         sem,
-                        forward_model_ok_lock,
-                        verify_checksum_lock,
                         self._max_submit,
                     ),
                     name=f"job-{iens}_task",
                 )
             else:
-                failure = job.real.run_arg.ensemble_storage.get_failure(iens)
-                await self._events.put(
-                    event_from_dict(
-                        {
-                            "ensemble": self._ens_id,
-                            "event_type": Id.REALIZATION_FAILURE,
-                            "queue_event_type": JobState.FAILED,
-                            "message": failure.message if failure else None,
-                            "real": str(iens),
-                        }
-                    )
+                await self._events.put(self._unscheduled_failure_event(iens))
+        if ready_realizations is not None:
+            scheduling_tasks.append(
+                asyncio.create_task(
+                    self._release_ready_jobs(ready_realizations),
+                    name="release_ready_jobs_task",
                 )
+            )
         logger.info("All tasks started")
         self._running.set()
         try:
             await self._monitor_and_handle_tasks(scheduling_tasks)
             await self.driver.finish()
         finally:
+            if isinstance(self.submit_sleep_state, AdaptiveSubmitSleeper):
+                logger.info(
+                    "Submit rate was "
+                    f"{self.submit_sleep_state.submit_rate:.2f} per second"
+                )
+            if self.driver.metrics.commands:
+                logger.info(f"Queue system commands: {self.driver.metrics}")
             for scheduling_task in scheduling_tasks:
                 scheduling_task.cancel()
             # We discard exceptions when cancelling the scheduling tasks
@@ -314,6 +460,16 @@ async def execute(
                 *scheduling_tasks,
                 return_exceptions=True,
             )
+            # Results that are still being written to storage must be
+            # complete before the ensemble is used, so wait for them without
+            # blocking the event loop. Loads not yet started are dropped.
+            for executor in (self.ingestion_executor, self.checksum_executor):
+                if executor is not None:
+                    await asyncio.to_thread(
+                        executor.shutdown, wait=True, cancel_futures=True
+                    )
+            self.ingestion_executor = None
+            self.checksum_executor = None
 
         if self._cancelled:
             logger.debug("Scheduler has been cancelled, jobs are stopped.")
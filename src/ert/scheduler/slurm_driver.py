@@ -12,12 +12,25 @@
 from pathlib import Path
 from tempfile import NamedTemporaryFile
 from typing import (
+    Dict,
     Iterator,
+    List,
     Optional,
+    Set,
     Tuple,
 )
 
-from .driver import SIGNAL_OFFSET, Driver, FailedSubmit, create_submit_script
+from .driver import (
+    SIGNAL_OFFSET,
+    AdaptivePollPeriod,
+    ArraySubmitter,
+    ArrayTask,
+    BatchedQuery,
+    Driver,
+    FailedSubmit,
+    create_array_submit_script,
+    create_submit_script,
+)
 from .event import Event, FinishedEvent, StartedEvent
 
 SLURM_FAILED_EXIT_CODE_FETCH = SIGNAL_OFFSET + 66
@@ -38,12 +51,21 @@ class JobStatus(Enum):
 @dataclass
 class JobData:
     iens: int
-    exit_code: Optional[int] = None
     status: Optional[JobStatus] = None
 
 
 END_STATES = {JobStatus.FAILED, JobStatus.COMPLETED, JobStatus.CANCELLED}
 
+_FAILED_STATES = {
+    "BOOT_FAIL",
+    "DEADLINE",
+    "NODE_FAIL",
+    "OUT_OF_MEMORY",
+    "PREEMPTED",
+    "TIMEOUT",
+}
+"""Slurm job states that end the job without it completing"""
+
 
 @dataclass
 class JobInfo:
@@ -77,6 +99,8 @@ def __init__(
         max_runtime: Optional[float] = None,
         squeue_timeout: float = 2,
         project_code: Optional[str] = None,
+        array_submit: bool = False,
+        max_array_size: int = 1000,
         activate_script: str = "",
     ) -> None:
         """
@@ -128,22 +152,37 @@ def __init__(
         self._sleep_time_between_cmd_retries = 3
         self._sleep_time_between_kills = 30
         self._poll_period = squeue_timeout
+        self._adaptive_poll_period = AdaptivePollPeriod()
+        self._missing_jobs_query = BatchedQuery(self._poll_missing_jobs)
+        self._exit_code_query = BatchedQuery(self._get_exit_codes)
         self._project_code = project_code
+        if array_submit:
+            self._array_submitter = ArraySubmitter(
+                self._submit_array, max_size=max_array_size
+            )
 
     def _submit_cmd(
         self,
         name: str = "dummy",
         runpath: Optional[Path] = None,
         num_cpu: Optional[int] = 1,
+        array_size: Optional[int] = None,
     ) -> list[str]:
         sbatch_with_args = [
             str(self._sbatch),
             f"--job-name={name}",
             f"--chdir={runpath}",
             "--parsable",
-            f"--output={name}.stdout",
-            f"--error={name}.stderr",
         ]
+        if array_size is not None:
+            # The tasks of an array job write their output in their own runpath
+            sbatch_with_args += [
+                "--output=/dev/null",
+                "--error=/dev/null",
+                f"--array=0-{array_size - 1}",
+            ]
+        else:
+            sbatch_with_args += [f"--output={name}.stdout", f"--error={name}.stderr"]
         if num_cpu:
             sbatch_with_args.append(f"--ntasks={num_cpu}")
         if self._realization_memory and self._realization_memory > 0:
@@ -182,30 +221,24 @@ async def submit(
         if runpath is None:
             runpath = Path.cwd()
 
+        if iens not in self._submit_locks:
+            self._submit_locks[iens] = asyncio.Lock()
+
+        if self._array_submitter is not None:
+            async with self._submit_locks[iens]:
+                await self._array_submitter.submit(
+                    ArrayTask(iens, executable, args, name, runpath, num_cpu or 1)
+                )
+            return
+
         script = create_submit_script(runpath, executable, args, self.activate_script)
-        script_path: Optional[Path] = None
         try:
-            with NamedTemporaryFile(
-                dir=runpath,
-                prefix=".slurm_submit_",
-                suffix=".sh",
-                mode="w",
-                encoding="utf-8",
-                delete=False,
-            ) as script_handle:
-                script_handle.write(script)
-                script_path = Path(script_handle.name)
-        except OSError as err:
-            error_message = f"Could not create submit script: {err}"
-            self._job_error_message_by_iens[iens] = error_message
-            raise FailedSubmit(error_message) from err
-        assert script_path is not None
-        script_path.chmod(script_path.stat().st_mode | stat.S_IEXEC)
+            script_path = _write_submit_script(runpath, script)
+        except FailedSubmit as err:
+            self._job_error_message_by_iens[iens] = str(err)
+            raise
         sbatch_with_args = [*self._submit_cmd(name, runpath, num_cpu), str(script_path)]
 
-        if iens not in self._submit_locks:
-            self._submit_locks[iens] = asyncio.Lock()
-
         async with self._submit_locks[iens]:
             logger.debug(
                 f"Submitting to SLURM with command {shlex.join(sbatch_with_args)}"
@@ -231,7 +264,61 @@ async def submit(
             )
             self._iens2jobid[iens] = job_id
 
+    async def _submit_array(self, tasks: List[ArrayTask]) -> Dict[int, str]:
+        """Submits the tasks as one array job, where task i runs the i-th
+        task, as Slurm only accepts array indices below MaxArraySize"""
+        first_task = tasks[0]
+        script = create_array_submit_script(
+            "SLURM_ARRAY_TASK_ID",
+            dict(enumerate(tasks)),
+            self.activate_script,
+            output_suffixes=(".stdout", ".stderr"),
+        )
+        try:
+            script_path = _write_submit_script(first_task.runpath, script)
+        except FailedSubmit as err:
+            for task in tasks:
+                self._job_error_message_by_iens[task.iens] = str(err)
+            raise
+        sbatch_with_args = [
+            *self._submit_cmd(
+                first_task.name,
+                first_task.runpath,
+                first_task.num_cpu,
+                array_size=len(tasks),
+            ),
+            str(script_path),
+        ]
+        logger.debug(f"Submitting to SLURM with command {shlex.join(sbatch_with_args)}")
+        process_success, process_message = await self._execute_with_retry(
+            sbatch_with_args,
+            retry_on_empty_stdout=True,
+            retry_codes=(),
+            total_attempts=self._max_sbatch_attempts,
+            retry_interval=self._sleep_time_between_cmd_retries,
+        )
+        if not process_success:
+            for task in tasks:
+                self._job_error_message_by_iens[task.iens] = process_message
+            raise FailedSubmit(process_message)
+        if not process_message:
+            raise FailedSubmit("sbatch returned empty jobid")
+        logger.info(
+            f"{len(tasks)} realizations accepted by SLURM "
+            f"as array job {process_message}"
+        )
+
+        job_ids = {}
+        for index, task in enumerate(tasks):
+            job_id = f"{process_message}_{index}"
+            self._jobs[job_id] = JobData(iens=task.iens)
+            self._iens2jobid[task.iens] = job_id
+            job_ids[task.iens] = job_id
+        return job_ids
+
     async def kill(self, iens: int) -> None:
+        if self._array_submitter is not None:
+            await self._array_submitter.settle(iens)
         if iens not in self._submit_locks:
             logger.error(f"scancel failed, realization {iens} has never been submitted")
             return
@@ -259,22 +346,21 @@ async def poll(self) -> None:
                 await asyncio.sleep(self._poll_period)
                 continue
             arguments = ["-h", "--format=%i %T"]
+            if self._array_submitter is not None:
+                # One line for each task of array jobs
+                arguments.append("--array")
             if self._user:
                 arguments.append(f"--user={self._user}")
             try:
-                process = await asyncio.create_subprocess_exec(
-                    str(self._squeue),
-                    *arguments,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
+                returncode, stdout, stderr = await self._run_command(
+                    str(self._squeue), *arguments
                 )
             except FileNotFoundError as e:
                 logger.error(str(e))
                 return
-            stdout, stderr = await process.communicate()
-            if process.returncode:
+            if returncode:
                 logger.warning(
-                    f"squeue gave returncode {process.returncode} and error {stderr.decode()}"
+                    f"squeue gave returncode {returncode} and error {stderr.decode()}"
                 )
             squeue_states = dict(_parse_squeue_output(stdout.decode(errors="ignore")))
 
@@ -283,14 +369,11 @@ async def poll(self) -> None:
                 set(self._jobs) - job_ids_found_in_squeue_output
             ):
                 logger.debug(
-                    f"scontrol is used for job ids: {missing_in_squeue_output}"
+                    f"Looking up job ids missing in squeue: {missing_in_squeue_output}"
+                )
+                scontrol_states = await self._missing_jobs_query.get_many(
+                    missing_in_squeue_output
                 )
-                scontrol_states = {}
-                for job_id in missing_in_squeue_output:
-                    if (
-                        scontrol_info := await self._poll_once_by_scontrol(job_id)
-                    ) is not None:
-                        scontrol_states[job_id] = scontrol_info
                 missing_in_squeue_and_scontrol = missing_in_squeue_output - set(
                     scontrol_states.keys()
                 )
@@ -298,16 +381,32 @@ async def poll(self) -> None:
                 scontrol_states = {}
                 missing_in_squeue_and_scontrol = set()
 
-            for job_id, info in itertools.chain(
-                squeue_states.items(), scontrol_states.items()
-            ):
-                await self._process_job_update(job_id, info)
+            # Updates are processed concurrently, so that the exit codes of
+            # failed jobs are fetched together with one scontrol call
+            await asyncio.gather(
+                *(
+                    self._process_job_update(job_id, info)
+                    for job_id, info in itertools.chain(
+                        squeue_states.items(), scontrol_states.items()
+                    )
+                )
+            )
 
             if missing_in_squeue_and_scontrol:
                 logger.debug(
                     f"scontrol did not give status for job_ids {missing_in_squeue_and_scontrol}, giving up for now."
                 )
-            await asyncio.sleep(self._poll_period)
+            job_states = {job_id: job.status for job_id, job in self._jobs.items()}
+            await asyncio.sleep(
+                self._adaptive_poll_period.next_period(
+                    self._poll_period,
+                    job_states,
+                    num_pending=sum(
+                        status in {None, JobStatus.PENDING}
+                        for status in job_states.values()
+                    ),
+                )
+            )
 
     async def _process_job_update(self, job_id: str, new_info: JobInfo) -> None:
         new_state = new_info.status
@@ -345,18 +444,88 @@ async def _process_job_update(self, job_id: str, new_info: JobInfo) -> None:
             await self.event_queue.put(event)
 
     async def _get_exit_code(self, job_id: str) -> int:
-        retries = 0
-        while retries < 10 and self._jobs[job_id].exit_code is None:
-            retries += 1
-            if (scontrol_info := await self._poll_once_by_scontrol(job_id)) is not None:
-                self._jobs[job_id].exit_code = scontrol_info.exit_code
-            else:
+        exit_code = await self._exit_code_query.get(job_id)
+        return SLURM_FAILED_EXIT_CODE_FETCH if exit_code is None else exit_code
+
+    async def _get_exit_codes(self, job_ids: Set[str]) -> Dict[str, int]:
+        """Gets the exit codes of the jobs from scontrol, retrying the jobs
+        that scontrol has not given an exit code for yet"""
+        exit_codes: Dict[str, int] = {}
+        for attempt in range(10):
+            if attempt:
                 await asyncio.sleep(self._poll_period)
+            infos = await self._poll_by_scontrol(job_ids - exit_codes.keys())
+            exit_codes.update(
+                (job_id, info.exit_code)
+                for job_id, info in infos.items()
+                if info.exit_code is not None
+            )
+            if len(exit_codes) == len(job_ids):
+                break
+        return exit_codes
+
+    async def _poll_missing_jobs(self, job_ids: Set[str]) -> Dict[str, JobInfo]:
+        """Gets the states of jobs that are no longer listed by squeue. A
+        single job is looked up with scontrol, and several with one squeue
+        call for just those jobs, as scontrol only takes one job id."""
+        if len(job_ids) == 1:
+            job_id = next(iter(job_ids))
+            info = await self._poll_once_by_scontrol(job_id)
+            return {} if info is None else {job_id: info}
+
+        arguments = ["-h", "--format=%i %T", "--states=all"]
+        if self._array_submitter is not None:
+            arguments.append("--array")
+        returncode, stdout, stderr = await self._run_command(
+            str(self._squeue), *arguments, f"--jobs={','.join(sorted(job_ids))}"
+        )
+        if returncode:
+            logger.error(
+                f"squeue gave returncode {returncode} with "
+                f"output {stdout.decode(errors='ignore').strip()} "
+                f"and error {stderr.decode(errors='ignore').strip()}"
+            )
+        return {
+            job_id: info
+            for job_id, info in _parse_squeue_output(stdout.decode(errors="ignore"))
+            if job_id in job_ids
+        }
+
+    async def _poll_by_scontrol(self, job_ids: Set[str]) -> Dict[str, ScontrolInfo]:
+        """Gets the scontrol information of the jobs. As scontrol only takes
+        one job id, several jobs are looked up by listing all the jobs that
+        Slurm still holds in one call."""
+        if len(job_ids) == 1:
+            job_id = next(iter(job_ids))
+            info = await self._poll_once_by_scontrol(job_id)
+            return {} if info is None else {job_id: info}
+
+        if (
+            time.time() - self._scontrol_cache_timestamp
+            < self._scontrol_required_cache_age
+        ) and job_ids <= self._scontrol_cache.keys():
+            return {job_id: self._scontrol_cache[job_id] for job_id in job_ids}
 
-        code = self._jobs[job_id].exit_code
-        if code is not None:
-            return code
-        return SLURM_FAILED_EXIT_CODE_FETCH
+        returncode, stdout, stderr = await self._run_command(
+            self._scontrol, "show", "job"
+        )
+        if returncode:
+            logger.error(
+                f"scontrol gave returncode {returncode} with "
+                f"output{stdout.decode(errors='ignore').strip()} "
+                f"and error {stderr.decode(errors='ignore').strip()}"
+            )
+            return {}
+
+        # Only the jobs of this driver are kept from the listing
+        infos = {
+            job_id: info
+            for job_id, info in _parse_scontrol_jobs(stdout.decode(errors="ignore"))
+            if job_id in job_ids or job_id in self._jobs
+        }
+        self._scontrol_cache.update(infos)
+        self._scontrol_cache_timestamp = time.time()
+        return {job_id: infos[job_id] for job_id in job_ids if job_id in infos}
 
     async def _poll_once_by_scontrol(
         self, missing_job_id: str
@@ -367,18 +536,12 @@ async def _poll_once_by_scontrol(
         ) and missing_job_id in self._scontrol_cache:
             return self._scontrol_cache[missing_job_id]
 
-        process = await asyncio.create_subprocess_exec(
-            self._scontrol,
-            "show",
-            "job",
-            str(missing_job_id),
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
+        returncode, stdout, stderr = await self._run_command(
+            self._scontrol, "show", "job", str(missing_job_id)
         )
-        stdout, stderr = await process.communicate()
-        if process.returncode:
+        if returncode:
             logger.error(
-                f"scontrol gave returncode {process.returncode} with "
+                f"scontrol gave returncode {returncode} with "
                 f"output{stdout.decode(errors='ignore').strip()} "
                 f"and error {stderr.decode(errors='ignore').strip()}"
             )
@@ -424,10 +587,13 @@ def _tail_textfile(file_path: Path, num_chars: int) -> str:
 
 
 def _parse_squeue_output(output: str) -> Iterator[Tuple[str, SqueueInfo]]:
+    """Yields the state of each job in the output, skipping the lines with
+    states that have no meaning for the driver, like SUSPENDED"""
     for line in output.split("\n"):
         if line:
-            id, status = line.split()
-            yield id, SqueueInfo(JobStatus[status])
+            id, state = line.split()
+            if (status := _job_status(state)) is not None:
+                yield id, SqueueInfo(status)
 
 
 def _seconds_to_slurm_time_format(seconds: float) -> str:
@@ -441,9 +607,51 @@ def _seconds_to_slurm_time_format(seconds: float) -> str:
 
 
 def _parse_scontrol_output(output: str) -> ScontrolInfo:
-    values = dict(w.split("=", 1) for w in output.split())
+    values = dict(w.split("=", 1) for w in output.split() if "=" in w)
     exit_code_str = values.get("ExitCode")
     exit_code = None
     if exit_code_str:
         exit_code = int(exit_code_str.split(":")[0])
-    return ScontrolInfo(JobStatus[values["JobState"]], exit_code)
+    status = _job_status(values["JobState"])
+    if status is None:
+        raise ValueError(f"Unknown job state {values['JobState']}")
+    return ScontrolInfo(status, exit_code)
+
+
+def _parse_scontrol_jobs(output: str) -> Iterator[Tuple[str, ScontrolInfo]]:
+    """Yields the information of each job in output listing several jobs,
+    where array tasks are identified by array job id and task id as when
+    they were submitted. Jobs in states with no meaning for the driver are
+    skipped."""
+    for record in output.split("\n\n"):
+        values = dict(w.split("=", 1) for w in record.split() if "=" in w)
+        if "JobId" not in values or _job_status(values.get("JobState", "")) is None:
+            continue
+        job_id = values["JobId"]
+        if values.get("ArrayTaskId", "N/A") != "N/A" and "ArrayJobId" in values:
+            job_id = f"{values['ArrayJobId']}_{values['ArrayTaskId']}"
+        yield job_id, _parse_scontrol_output(record)
+
+
+def _job_status(state: str) -> Optional[JobStatus]:
+    if state in _FAILED_STATES:
+        return JobStatus.FAILED
+    return JobStatus.__members__.get(state)
+
+
+def _write_submit_script(runpath: Path, script: str) -> Path:
+    try:
+        with NamedTemporaryFile(
+            dir=runpath,
+            prefix=".slurm_submit_",
+            suffix=".sh",
+            mode="w",
+            encoding="utf-8",
+            delete=False,
+        ) as script_handle:
+            script_handle.write(script)
+            script_path = Path(script_handle.name)
+    except OSError as err:
+        raise FailedSubmit(f"Could not create submit script: {err}") from err
+    script_path.chmod(script_path.stat().st_mode | stat.S_IEXEC)
+    return script_path
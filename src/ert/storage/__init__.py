@@ -4,7 +4,7 @@
 from pathlib import Path
 from typing import Union
 
-from ert.storage.local_ensemble import LocalEnsemble
+from ert.storage.local_ensemble import LocalEnsemble, ParameterLayout
 from ert.storage.local_experiment import LocalExperiment
 from ert.storage.local_storage import LocalStorage
 from ert.storage.mode import Mode, ModeLiteral
@@ -47,6 +47,7 @@ def open_storage(
     "Ensemble",
     "Experiment",
     "Mode",
+    "ParameterLayout",
     "Storage",
     "open_storage",
 ]
@@ -3,10 +3,26 @@
 import contextlib
 import logging
 import os
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from enum import Enum
 from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple, Union
+from tempfile import TemporaryFile
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 from uuid import UUID
 
 import numpy as np
@@ -30,6 +46,52 @@
 
 import polars
 
+# Responses are stored sorted by key and primary key, in row groups of this
+# many rows, so that the per row group statistics of the key column let
+# key-filtered reads skip most of each file
+_RESPONSE_ROW_GROUP_SIZE = 64 * 1024
+
+# The size in bytes of the blocks of realizations transposed at a time when
+# loading parameters stored in the ensemble layout
+_LOAD_BLOCK_BYTES = 64 * 1024**2
+
+
+def _contiguous_columns(
+    indices: Optional[npt.NDArray[np.int_]],
+) -> Union[slice, npt.NDArray[np.int_]]:
+    """Returns the indices as a slice when they are a contiguous range, which
+    lets them be read from a memory mapped array as one block per row."""
+    if indices is None:
+        return slice(None)
+    indices = np.asarray(indices, dtype=np.int_)
+    if len(indices) > 0 and np.all(np.diff(indices) == 1):
+        return slice(int(indices[0]), int(indices[-1]) + 1)
+    return indices
+
+
+def _open_memmap_for_writing(
+    path: Path, dtype: npt.DTypeLike, shape: Tuple[int, ...]
+) -> np.memmap[Any, np.dtype[Any]]:
+    """Creates a .npy file of dtype and shape, memory mapped for writing"""
+    memmap: np.memmap[Any, np.dtype[Any]] = np.lib.format.open_memmap(  # type: ignore[no-untyped-call]
+        path, mode="w+", dtype=dtype, shape=shape
+    )
+    return memmap
+
+
+class ParameterLayout(str, Enum):
+    """How parameter groups of an ensemble are laid out on disk.
+
+    REALIZATION stores one NetCDF file per realization and parameter group,
+    i.e. ``realization-<i>/<group>.nc``. ENSEMBLE stores each parameter group
+    as one realization-major, memory-mappable array per variable under
+    ``parameters/<group>/``, so that writing a realization is a slice write
+    and loading many realizations is a single contiguous read.
+    """
+
+    REALIZATION = "realization"
+    ENSEMBLE = "ensemble"
+
 
 class _Index(BaseModel):
     id: UUID
@@ -39,6 +101,12 @@ class _Index(BaseModel):
     name: str
     prior_ensemble_id: Optional[UUID]
     started_at: datetime
+    parameter_layout: ParameterLayout = ParameterLayout.REALIZATION
+
+
+class _ParameterGroupIndex(BaseModel):
+    variables: Dict[str, List[str]]
+    coords: Dict[str, Tuple[List[str], List[Any]]]
 
 
 class _Failure(BaseModel):
@@ -85,6 +153,7 @@ def __init__(
             (path / "index.json").read_text(encoding="utf-8")
         )
         self._error_log_name = "error.json"
+        self._parameter_store_lock = threading.Lock()
 
         @lru_cache(maxsize=None)
         def create_realization_dir(realization: int) -> Path:
@@ -104,6 +173,7 @@ def create(
         iteration: int = 0,
         name: str,
         prior_ensemble_id: Optional[UUID],
+        parameter_layout: ParameterLayout = ParameterLayout.REALIZATION,
     ) -> LocalEnsemble:
         """
         Create a new ensemble in local storage.
@@ -126,6 +196,8 @@ def create(
             Name of ensemble.
         prior_ensemble_id : UUID, optional
             Identifier of prior ensemble.
+        parameter_layout : ParameterLayout
+            How parameters are laid out on disk.
 
         Returns
         -------
@@ -143,6 +215,7 @@ def create(
             name=name,
             prior_ensemble_id=prior_ensemble_id,
             started_at=datetime.now(),
+            parameter_layout=parameter_layout,
         )
 
         storage._write_transaction(
@@ -155,6 +228,15 @@ def create(
     def mount_point(self) -> Path:
         return self._path
 
+    def temporary_file(self) -> IO[bytes]:
+        """An anonymous temporary file for data too large to keep in memory
+        while working on the ensemble. It is created in the swap directory of
+        the storage, on the same file system as the ensemble but outside it.
+        """
+        swap_path = self._storage._swap_path
+        swap_path.mkdir(parents=True, exist_ok=True)
+        return TemporaryFile(dir=swap_path)
+
     @property
     def name(self) -> str:
         return self._index.name
@@ -183,6 +265,10 @@ def iteration(self) -> int:
     def parent(self) -> Optional[UUID]:
         return self._index.prior_ensemble_id
 
+    @property
+    def parameter_layout(self) -> ParameterLayout:
+        return self._index.parameter_layout
+
     @property
     def experiment(self) -> LocalExperiment:
         return self._storage.get_experiment(self.experiment_id)
@@ -271,10 +357,7 @@ def is_initalized(self) -> List[int]:
             i
             for i in range(self.ensemble_size)
             if all(
-                (
-                    self._realization_dir(i)
-                    / (_escape_filename(parameter.name) + ".nc")
-                ).exists()
+                self._has_parameters(parameter.name, i)
                 for parameter in self.experiment.parameter_configuration.values()
                 if not parameter.forward_init
             )
@@ -392,6 +475,7 @@ def get_failure(self, realization: int) -> Optional[_Failure]:
         return None
 
     def refresh_ensemble_state(self) -> None:
+        self._storage.response_cache.invalidate(self.id)
         self.get_ensemble_state.cache_clear()
         self.get_ensemble_state()
 
@@ -425,9 +509,8 @@ def _parameters_exist_for_realization(realization: int) -> bool:
             """
             if not self.experiment.parameter_configuration:
                 return True
-            path = self._realization_dir(realization)
             return all(
-                (path / (_escape_filename(parameter) + ".nc")).exists()
+                self._has_parameters(parameter, realization)
                 for parameter in self.experiment.parameter_configuration
             )
 
@@ -517,11 +600,141 @@ def _load_single_dataset(
                 f"No dataset '{group}' in storage for realization {realization}"
             ) from e
 
+    def _parameter_group_path(self, group: str) -> Path:
+        return self._path / "parameters" / _escape_filename(group)
+
+    def _parameter_group_mask(self, group: str) -> Optional[npt.NDArray[np.bool_]]:
+        """The realizations written to the ensemble wide store of group, or
+        None if the store has not been created"""
+        path = self._parameter_group_path(group)
+        if not (path / "index.json").exists():
+            return None
+        return np.load(path / "realizations.npy", mmap_mode="r")
+
+    def _has_parameters(self, group: str, realization: int) -> bool:
+        if self.parameter_layout == ParameterLayout.ENSEMBLE:
+            mask = self._parameter_group_mask(group)
+            return mask is not None and bool(mask[realization])
+        return (
+            self._realization_dir(realization) / f"{_escape_filename(group)}.nc"
+        ).exists()
+
+    def _create_parameter_group_store(self, group: str, dataset: xr.Dataset) -> None:
+        """Pre-allocates one (ensemble_size, *shape) array per variable in
+        dataset. The index is written last, so its existence means the store
+        is complete."""
+        path = self._parameter_group_path(group)
+        path.mkdir(parents=True, exist_ok=True)
+        for name, data_array in dataset.data_vars.items():
+            array = _open_memmap_for_writing(
+                path / f"{name}.npy",
+                dtype=data_array.dtype,
+                shape=(self.ensemble_size, *data_array.shape),
+            )
+            if np.issubdtype(array.dtype, np.floating):
+                array[:] = np.nan
+            array.flush()
+        written = _open_memmap_for_writing(
+            path / "realizations.npy", dtype=np.bool_, shape=(self.ensemble_size,)
+        )
+        written.flush()
+        index = _ParameterGroupIndex(
+            variables={
+                str(name): [str(d) for d in data_array.dims]
+                for name, data_array in dataset.data_vars.items()
+            },
+            coords={
+                str(name): (
+                    [str(d) for d in coord.dims],
+                    coord.values.tolist(),
+                )
+                for name, coord in dataset.coords.items()
+            },
+        )
+        self._storage._write_transaction(
+            path / "index.json", index.model_dump_json().encode("utf-8")
+        )
+
+    def _save_to_parameter_group_store(
+        self,
+        group: str,
+        realizations: npt.NDArray[np.int_],
+        dataset: xr.Dataset,
+    ) -> None:
+        """Writes dataset, which has a realizations dimension matching
+        realizations, as slices of the ensemble wide store of group"""
+        path = self._parameter_group_path(group)
+        with self._parameter_store_lock:
+            if not (path / "index.json").exists():
+                self._create_parameter_group_store(
+                    group, dataset.isel(realizations=0, drop=True)
+                )
+        for name, data_array in dataset.data_vars.items():
+            array = np.load(path / f"{name}.npy", mmap_mode="r+")
+            data_array = data_array.transpose("realizations", ...)
+            if array.shape[1:] != data_array.shape[1:]:
+                raise ValueError(
+                    f"Parameter group {group} has shape {array.shape[1:]} in "
+                    f"storage, got {data_array.shape[1:]}"
+                )
+            array[realizations] = data_array.values
+            array.flush()
+        written = np.load(path / "realizations.npy", mmap_mode="r+")
+        written[realizations] = True
+        written.flush()
+
+    def _load_from_parameter_group_store(
+        self,
+        group: str,
+        realizations: Union[int, np.int64, npt.NDArray[np.int_], None],
+    ) -> xr.Dataset:
+        path = self._parameter_group_path(group)
+        try:
+            index = _ParameterGroupIndex.model_validate_json(
+                (path / "index.json").read_text(encoding="utf-8")
+            )
+        except FileNotFoundError as e:
+            raise KeyError(f"No dataset '{group}' in storage") from e
+
+        written = np.load(path / "realizations.npy", mmap_mode="r")
+        if realizations is None:
+            reals = np.flatnonzero(written)
+        else:
+            reals = np.atleast_1d(np.asarray(realizations, dtype=np.int_))
+        for realization in reals:
+            if not 0 <= realization < self.ensemble_size or not written[realization]:
+                raise KeyError(
+                    f"No dataset '{group}' in storage for realization {realization}"
+                )
+
+        dataset = xr.Dataset(
+            {
+                name: (
+                    ["realizations", *dims],
+                    np.load(path / f"{name}.npy", mmap_mode="r")[reals],
+                )
+                for name, dims in index.variables.items()
+            },
+            coords={
+                "realizations": reals,
+                **{
+                    name: (dims, np.array(values))
+                    for name, (dims, values) in index.coords.items()
+                },
+            },
+        )
+        if isinstance(realizations, (int, np.integer)):
+            return dataset.isel(realizations=0, drop=True)
+        return dataset
+
     def _load_dataset(
         self,
         group: str,
         realizations: Union[int, np.int64, npt.NDArray[np.int_], None],
     ) -> xr.Dataset:
+        if self.parameter_layout == ParameterLayout.ENSEMBLE:
+            return self._load_from_parameter_group_store(group, realizations)
+
         if isinstance(realizations, (int, np.int64)):
             return self._load_single_dataset(group, int(realizations)).isel(
                 realizations=0, drop=True
@@ -559,6 +772,98 @@ def load_parameters(
 
         return self._load_dataset(group, realizations)
 
+    def load_parameters_numpy(
+        self,
+        group: str,
+        realizations: npt.NDArray[np.int_],
+        indices: Optional[npt.NDArray[np.int_]] = None,
+        block_bytes: Optional[int] = None,
+    ) -> npt.NDArray[np.float64]:
+        """
+        Load the flattened values of a parameter group as a matrix.
+
+        The result is allocated once and filled directly from storage, so the
+        peak memory use is one copy of the returned matrix plus one
+        realization, or for the ensemble layout one block of at most
+        block_bytes. Only the given indices are read from the ensemble
+        layout.
+
+        Parameters
+        ----------
+        group : str
+            Name of parameter group to load.
+        realizations : ndarray of int
+            Realization indices to load.
+        indices : ndarray of int, optional
+            Indices into the flattened values to load, e.g. the active cells
+            of a field. If None, all values are loaded.
+        block_bytes : int, optional
+            The size of the blocks of realizations read at a time with the
+            ensemble layout, at least one realization.
+
+        Returns
+        -------
+        parameters : ndarray
+            C-ordered array of shape (number of parameters, number of
+            realizations).
+        """
+
+        realizations = np.asarray(realizations, dtype=np.int_)
+        if self.parameter_layout == ParameterLayout.ENSEMBLE:
+            path = self._parameter_group_path(group)
+            written = self._parameter_group_mask(group)
+            if written is None:
+                raise KeyError(f"No dataset '{group}' in storage")
+            for realization in realizations:
+                if not written[realization]:
+                    raise KeyError(
+                        f"No dataset '{group}' in storage for realization {realization}"
+                    )
+            values = np.load(path / "values.npy", mmap_mode="r")
+            values = values.reshape(self.ensemble_size, -1)
+            columns = _contiguous_columns(indices)
+            num_columns = (
+                len(range(values.shape[1])[columns])
+                if isinstance(columns, slice)
+                else len(columns)
+            )
+            result = np.empty((num_columns, len(realizations)), values.dtype)
+            block_size = max(
+                1,
+                (_LOAD_BLOCK_BYTES if block_bytes is None else block_bytes)
+                // max(1, num_columns * values.dtype.itemsize),
+            )
+            # Blocks of realizations are transposed into the result, so that
+            # only a block of the requested columns is held besides it
+            for start in range(0, len(realizations), block_size):
+                block_realizations = realizations[start : start + block_size]
+                if isinstance(columns, slice):
+                    block = values[block_realizations, columns]
+                else:
+                    block = values[np.ix_(block_realizations, columns)]
+                result[:, start : start + block_size] = block.T
+            return result
+
+        loaded: Optional[npt.NDArray[np.float64]] = None
+        for i, realization in enumerate(realizations):
+            with self._load_single_dataset(group, int(realization)) as dataset:
+                values = dataset["values"].values.reshape(-1)
+            if indices is not None:
+                values = values[indices]
+            if loaded is None:
+                loaded = np.empty((values.size, len(realizations)), values.dtype)
+            loaded[:, i] = values
+        if loaded is None:
+            return np.empty(
+                (
+                    len(self.experiment.parameter_configuration[group])
+                    if indices is None
+                    else len(indices),
+                    0,
+                )
+            )
+        return loaded
+
     def load_cross_correlations(self) -> xr.Dataset:
         input_path = self.mount_point / "corr_XY.nc"
 
@@ -603,12 +908,15 @@ def save_cross_correlations(
         file_path = os.path.join(self.mount_point, "corr_XY.nc")
         self._storage._to_netcdf_transaction(file_path, dataset)
 
-    @lru_cache  # noqa: B019
-    def load_responses(self, key: str, realizations: Tuple[int]) -> polars.DataFrame:
-        """Load responses for key and realizations into xarray Dataset.
+    def load_responses(
+        self, key: str, realizations: Tuple[int, ...]
+    ) -> polars.DataFrame:
+        """Load responses for key and realizations into polars DataFrame.
 
-        For each given realization, response data is loaded from the NetCDF
-        file whose filename matches the given key parameter.
+        For each given realization, response data is loaded from the parquet
+        file of the response type of the given key. Loaded responses are
+        kept in the response cache of the storage until they are evicted or
+        the ensemble is refreshed or saves a response.
 
         Parameters
         ----------
@@ -632,19 +940,63 @@ def load_responses(self, key: str, realizations: Tuple[int]) -> polars.DataFrame
             response_type = self.experiment.response_key_to_response_type[key]
             select_key = True
 
-        loaded = []
-        for realization in realizations:
-            input_path = self._realization_dir(realization) / f"{response_type}.parquet"
-            if not input_path.exists():
-                raise KeyError(f"No response for key {key}, realization: {realization}")
-            df = polars.read_parquet(input_path)
+        if len(realizations) == 0:
+            return polars.DataFrame()
+        cache_key = (key, tuple(int(realization) for realization in realizations))
+        cached = self._storage.response_cache.get(self.id, cache_key)
+        if cached is not None:
+            return cached
+        responses = self.scan_responses(response_type, realizations)
+        if select_key:
+            responses = responses.filter(polars.col("response_key") == key)
+        loaded = responses.collect()
+        self._storage.response_cache.put(self.id, cache_key, loaded)
+        return loaded
+
+    def scan_responses(
+        self,
+        response_type: str,
+        realizations: Union[Sequence[int], npt.NDArray[np.int_], None] = None,
+    ) -> polars.LazyFrame:
+        """Lazily scan the responses of a type as a single frame.
 
-            if select_key:
-                df = df.filter(polars.col("response_key") == key)
+        Filters and projections applied to the returned frame, e.g. on
+        response_key, time or realization, are pushed down into the parquet
+        reader, so only the selected columns and row groups are read.
 
-            loaded.append(df)
+        Parameters
+        ----------
+        response_type : str
+            Response type to scan, e.g. summary or gen_data.
+        realizations : sequence or ndarray of int, optional
+            Realization indices to scan. If None, all realizations with
+            responses of the type are scanned.
 
-        return polars.concat(loaded) if loaded else polars.DataFrame()
+        Returns
+        -------
+        responses : LazyFrame
+            Lazy polars frame over the responses of the realizations, with
+            a realization column. Empty if there are no realizations.
+        """
+        filename = f"{response_type}.parquet"
+        if realizations is None:
+            paths = sorted(
+                self._path.glob(f"realization-*/{filename}"),
+                key=lambda path: int(path.parent.name.removeprefix("realization-")),
+            )
+        else:
+            paths = []
+            for realization in realizations:
+                input_path = self._realization_dir(realization) / filename
+                if not input_path.exists():
+                    raise KeyError(
+                        f"No response for key {response_type}, "
+                        f"realization: {realization}"
+                    )
+                paths.append(input_path)
+        if not paths:
+            return polars.LazyFrame()
+        return polars.scan_parquet(paths)
 
     @deprecated("Use load_responses")
     def load_all_summary_data(
@@ -781,6 +1133,165 @@ def save_parameters(
             a 1d-vector. When saving multiple realizations, dataset must
             have a 'realizations' dimension.
         """
+        self._validate_parameters(group, dataset)
+
+        if self.parameter_layout == ParameterLayout.ENSEMBLE:
+            if "realizations" in dataset.dims:
+                dataset = dataset.sel(realizations=[realization])
+            else:
+                dataset = dataset.expand_dims(realizations=[realization])
+            self._save_to_parameter_group_store(group, np.array([realization]), dataset)
+            return
+
+        path = self._realization_dir(realization) / f"{_escape_filename(group)}.nc"
+        path.parent.mkdir(exist_ok=True)
+        if "realizations" in dataset.dims:
+            data_to_save = dataset.sel(realizations=[realization])
+        else:
+            data_to_save = dataset.expand_dims(realizations=[realization])
+        self._storage._to_netcdf_transaction(path, data_to_save)
+
+    @require_write
+    def save_parameters_many(
+        self,
+        group: str,
+        realizations: npt.NDArray[np.int_],
+        dataset: xr.Dataset,
+        max_workers: Optional[int] = None,
+    ) -> None:
+        """
+        Saves the parameters of several realizations at once. With the
+        ensemble layout this is a single slice write, otherwise the
+        per-realization files are written concurrently.
+
+        Parameters
+        ----------
+        group : str
+            Parameter group name for saving dataset.
+        realizations : NDArray[int_]
+            Realization indices for saving group.
+        dataset : Dataset
+            Dataset to save. It must contain a variable named 'values'
+            and a 'realizations' dimension where position i holds the
+            parameters of realizations[i].
+        max_workers : int, optional
+            Number of threads writing per-realization files.
+        """
+        self._validate_parameters(group, dataset)
+        realizations = np.asarray(realizations)
+        if dataset.sizes.get("realizations") != len(realizations):
+            raise ValueError(
+                f"Dataset for parameter group '{group}' must have a 'realizations' "
+                f"dimension of length {len(realizations)}"
+            )
+        dataset = dataset.assign_coords(realizations=realizations)
+
+        if self.parameter_layout == ParameterLayout.ENSEMBLE:
+            self._save_to_parameter_group_store(group, realizations, dataset)
+            return
+
+        def _save(index: int) -> None:
+            realization = int(realizations[index])
+            path = self._realization_dir(realization) / f"{_escape_filename(group)}.nc"
+            path.parent.mkdir(exist_ok=True)
+            self._storage._to_netcdf_transaction(
+                path, dataset.isel(realizations=[index])
+            )
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Consume the results so that exceptions are raised here
+            list(executor.map(_save, range(len(realizations))))
+
+    @require_write
+    def copy_parameters_from(
+        self,
+        source: LocalEnsemble,
+        group: str,
+        realizations: npt.NDArray[np.int_],
+    ) -> None:
+        """
+        Copies the parameters of a group for the given realizations from
+        another ensemble without decoding them. Per-realization files are
+        hardlinked, which is safe as they are only ever replaced. An ensemble
+        wide store is copied as a whole as it is modified in place. Other
+        combinations fall back to loading and saving.
+
+        Parameters
+        ----------
+        source : LocalEnsemble
+            Ensemble to copy the parameters from.
+        group : str
+            Parameter group name to copy.
+        realizations : NDArray[int_]
+            Realization indices to copy.
+        """
+        if group not in self.experiment.parameter_configuration:
+            raise ValueError(f"{group} is not registered to the experiment.")
+        realizations = np.asarray(realizations)
+        if len(realizations) == 0:
+            return
+        missing = [r for r in realizations if not source._has_parameters(group, r)]
+        if missing:
+            raise KeyError(
+                f"No dataset '{group}' in storage for realization {missing[0]}"
+            )
+
+        if (
+            source.parameter_layout == ParameterLayout.REALIZATION
+            and self.parameter_layout == ParameterLayout.REALIZATION
+        ):
+            filename = f"{_escape_filename(group)}.nc"
+            for realization in realizations:
+                path = self._realization_dir(realization)
+                path.mkdir(exist_ok=True)
+                self._storage._link_transaction(
+                    source._realization_dir(realization) / filename, path / filename
+                )
+            return
+
+        if (
+            source.parameter_layout == ParameterLayout.ENSEMBLE
+            and self.parameter_layout == ParameterLayout.ENSEMBLE
+            and source.ensemble_size == self.ensemble_size
+        ):
+            with self._parameter_store_lock:
+                if self._copy_parameter_group_store(source, group, realizations):
+                    return
+
+        self.save_parameters_many(
+            group, realizations, source.load_parameters(group, realizations)
+        )
+
+    def _copy_parameter_group_store(
+        self,
+        source: LocalEnsemble,
+        group: str,
+        realizations: npt.NDArray[np.int_],
+    ) -> bool:
+        """Copies the ensemble wide store of group from source, marking only
+        realizations as written. Returns False if this ensemble already has
+        a store for group."""
+        path = self._parameter_group_path(group)
+        if (path / "index.json").exists():
+            return False
+        source_path = source._parameter_group_path(group)
+        path.mkdir(parents=True, exist_ok=True)
+        index = _ParameterGroupIndex.model_validate_json(
+            (source_path / "index.json").read_text(encoding="utf-8")
+        )
+        for name in index.variables:
+            shutil.copyfile(source_path / f"{name}.npy", path / f"{name}.npy")
+        written = _open_memmap_for_writing(
+            path / "realizations.npy", dtype=np.bool_, shape=(self.ensemble_size,)
+        )
+        written[realizations] = True
+        written.flush()
+        self._storage._write_transaction(
+            path / "index.json", index.model_dump_json().encode("utf-8")
+        )
+        return True
+
+    def _validate_parameters(self, group: str, dataset: xr.Dataset) -> None:
         if "values" not in dataset.variables:
             raise ValueError(
                 f"Dataset for parameter group '{group}' must contain a 'values' variable"
@@ -792,14 +1303,6 @@ def save_parameters(
         if group not in self.experiment.parameter_configuration:
             raise ValueError(f"{group} is not registered to the experiment.")
 
-        path = self._realization_dir(realization) / f"{_escape_filename(group)}.nc"
-        path.parent.mkdir(exist_ok=True)
-        if "realizations" in dataset.dims:
-            data_to_save = dataset.sel(realizations=[realization])
-        else:
-            data_to_save = dataset.expand_dims(realizations=[realization])
-        self._storage._to_netcdf_transaction(path, data_to_save)
-
     @require_write
     def save_response(
         self, response_type: str, data: polars.DataFrame, realization: int
@@ -807,6 +1310,9 @@ def save_response(
         """
         Save dataset as response under group and realization index.
 
+        The responses are stored sorted by response key and primary key, so
+        that reads of some of the keys can skip most of the file.
+
         Parameters
         ----------
         response_type : str
@@ -836,12 +1342,20 @@ def save_response(
                 ),
             )
 
+        response_config = self.experiment.response_configuration.get(response_type)
+        data = data.sort(
+            ["response_key", *(response_config.primary_key if response_config else [])]
+        )
+
         output_path = self._realization_dir(realization)
         Path.mkdir(output_path, parents=True, exist_ok=True)
 
         self._storage._to_parquet_transaction(
-            output_path / f"{response_type}.parquet", data
+            output_path / f"{response_type}.parquet",
+            data,
+            row_group_size=_RESPONSE_ROW_GROUP_SIZE,
         )
+        self._storage.response_cache.invalidate(self.id)
 
         if not self.experiment._has_finalized_response_keys(response_type):
             response_keys = data["response_key"].unique().to_list()
@@ -857,10 +1371,9 @@ def calculate_std_dev_for_parameter(self, parameter_group: str) -> xr.Dataset:
     def get_parameter_state(
         self, realization: int
     ) -> Dict[str, RealizationStorageState]:
-        path = self._realization_dir(realization)
         return {
             e: RealizationStorageState.PARAMETERS_LOADED
-            if (path / (_escape_filename(e) + ".nc")).exists()
+            if self._has_parameters(e, realization)
             else RealizationStorageState.UNDEFINED
             for e in self.experiment.parameter_configuration
         }
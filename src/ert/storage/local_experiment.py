@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import threading
 from datetime import datetime
 from functools import cached_property
 from pathlib import Path
@@ -24,7 +25,7 @@
 
 if TYPE_CHECKING:
     from ert.config.parameter_config import ParameterConfig
-    from ert.storage.local_ensemble import LocalEnsemble
+    from ert.storage.local_ensemble import LocalEnsemble, ParameterLayout
     from ert.storage.local_storage import LocalStorage
 
 _KNOWN_PARAMETER_TYPES = {
@@ -79,6 +80,9 @@ def __init__(
         self._index = _Index.model_validate_json(
             (path / "index.json").read_text(encoding="utf-8")
         )
+        # Realizations are saved concurrently, and the response keys are
+        # finalized by whichever saves a response type first
+        self._response_keys_lock = threading.Lock()
 
     @classmethod
     def create(
@@ -166,6 +170,7 @@ def create_ensemble(
         name: str,
         iteration: int = 0,
         prior_ensemble: Optional[LocalEnsemble] = None,
+        parameter_layout: Optional[ParameterLayout] = None,
     ) -> LocalEnsemble:
         """
         Create a new ensemble associated with this experiment.
@@ -181,6 +186,8 @@ def create_ensemble(
             The iteration index for the ensemble.
         prior_ensemble : LocalEnsemble, optional
             An optional ensemble to use as a prior.
+        parameter_layout : ParameterLayout, optional
+            How parameters are laid out on disk.
 
         Returns
         -------
@@ -194,6 +201,7 @@ def create_ensemble(
             iteration=iteration,
             name=name,
             prior_ensemble=prior_ensemble,
+            parameter_layout=parameter_layout,
         )
 
     @property
@@ -372,29 +380,33 @@ def _update_response_keys(
         that the response config saved in this storage has keys corresponding
         to the actual received responses.
         """
-        responses_configuration = self.response_configuration
-        if response_type not in responses_configuration:
-            raise KeyError(
-                f"Response type {response_type} does not exist in current responses.json"
-            )
+        with self._response_keys_lock:
+            responses_configuration = self.response_configuration
+            if response_type not in responses_configuration:
+                raise KeyError(
+                    f"Response type {response_type} does not exist in current responses.json"
+                )
 
-        config = responses_configuration[response_type]
-        config.keys = sorted(response_keys)
-        config.has_finalized_keys = True
-        self._storage._write_transaction(
-            self._path / self._responses_file,
-            json.dumps(
-                {
-                    c.response_type: c.to_dict()
-                    for c in responses_configuration.values()
-                },
-                default=str,
-                indent=2,
-            ).encode("utf-8"),
-        )
+            config = responses_configuration[response_type]
+            if config.has_finalized_keys:
+                # Finalized by a realization saved concurrently
+                return
+            config.keys = sorted(response_keys)
+            config.has_finalized_keys = True
+            self._storage._write_transaction(
+                self._path / self._responses_file,
+                json.dumps(
+                    {
+                        c.response_type: c.to_dict()
+                        for c in responses_configuration.values()
+                    },
+                    default=str,
+                    indent=2,
+                ).encode("utf-8"),
+            )
 
-        if self.response_key_to_response_type is not None:
-            del self.response_key_to_response_type
+            if self.response_key_to_response_type is not None:
+                del self.response_key_to_response_type
 
-        if self.response_type_to_response_keys is not None:
-            del self.response_type_to_response_keys
+            if self.response_type_to_response_keys is not None:
+                del self.response_type_to_response_keys
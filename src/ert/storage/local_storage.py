@@ -32,7 +32,7 @@
 
 from ert.config import ErtConfig
 from ert.shared import __version__
-from ert.storage.local_ensemble import LocalEnsemble
+from ert.storage.local_ensemble import LocalEnsemble, ParameterLayout
 from ert.storage.local_experiment import LocalExperiment
 from ert.storage.mode import (
     BaseMode,
@@ -40,13 +40,14 @@
     require_write,
 )
 from ert.storage.realization_storage_state import RealizationStorageState
+from ert.storage.response_cache import ResponseCache
 
 if TYPE_CHECKING:
     from ert.config import ParameterConfig, ResponseConfig
 
 logger = logging.getLogger(__name__)
 
-_LOCAL_STORAGE_VERSION = 8
+_LOCAL_STORAGE_VERSION = 9
 
 
 class _Migrations(BaseModel):
@@ -98,6 +99,7 @@ def __init__(
 
         super().__init__(mode)
         self.path = Path(path).absolute()
+        self._response_cache = ResponseCache()
 
         self._experiments: Dict[UUID, LocalExperiment]
         self._ensembles: Dict[UUID, LocalEnsemble]
@@ -135,6 +137,11 @@ def __init__(
             )
         self.refresh()
 
+    @property
+    def response_cache(self) -> ResponseCache:
+        """Cache of the responses loaded from the ensembles of this storage"""
+        return self._response_cache
+
     def refresh(self) -> None:
         """
         Reloads the index, experiments, and ensembles from the storage.
@@ -371,6 +378,7 @@ def create_ensemble(
         iteration: int = 0,
         name: Optional[str] = None,
         prior_ensemble: Union[LocalEnsemble, UUID, None] = None,
+        parameter_layout: Optional[ParameterLayout] = None,
     ) -> LocalEnsemble:
         """
         Creates a new ensemble in the storage.
@@ -390,6 +398,9 @@ def create_ensemble(
             The name of the ensemble.
         prior_ensemble : {LocalEnsemble, UUID}, optional
             An optional ensemble to use as a prior.
+        parameter_layout : ParameterLayout, optional
+            How parameters are laid out on disk. Defaults to the layout of
+            the prior ensemble, or one file per realization if there is none.
 
         Returns
         -------
@@ -416,6 +427,12 @@ def create_ensemble(
                 f"New ensemble ({ensemble_size}) must be of equal or "
                 f"smaller size than parent ensemble ({prior_ensemble.ensemble_size})"
             )
+        if parameter_layout is None:
+            parameter_layout = (
+                prior_ensemble.parameter_layout
+                if prior_ensemble
+                else ParameterLayout.REALIZATION
+            )
         ens = LocalEnsemble.create(
             self,
             path,
@@ -425,6 +442,7 @@ def create_ensemble(
             iteration=iteration,
             name=str(name),
             prior_ensemble_id=prior_ensemble_id,
+            parameter_layout=parameter_layout,
         )
         if prior_ensemble:
             for realization, state in enumerate(prior_ensemble.get_ensemble_state()):
@@ -472,6 +490,7 @@ def _migrate(self, version: int) -> None:
             to6,
             to7,
             to8,
+            to9,
         )
 
         try:
@@ -516,7 +535,7 @@ def _migrate(self, version: int) -> None:
 
             elif version < _LOCAL_STORAGE_VERSION:
                 migrations = list(
-                    enumerate([to2, to3, to4, to5, to6, to7, to8], start=1)
+                    enumerate([to2, to3, to4, to5, to6, to7, to8, to9], start=1)
                 )
                 for from_version, migration in migrations[version - 1 :]:
                     print(f"* Updating storage to version: {from_version+1}")
@@ -588,8 +607,32 @@ def _to_netcdf_transaction(
             dataset.to_netcdf(f, engine="scipy")
             os.rename(f.name, filename)
 
+    def _link_transaction(
+        self, source: str | os.PathLike[str], filename: str | os.PathLike[str]
+    ) -> None:
+        """
+        Hardlinks source to filename as a transaction, falling back to a copy
+        where the filesystem does not support hardlinks. This is only safe for
+        files that are replaced, never modified in place.
+
+        Guarantees to not leave half-written or empty files on disk if the copy
+        fails or the process is killed.
+        """
+        self._swap_path.mkdir(parents=True, exist_ok=True)
+        with NamedTemporaryFile(dir=self._swap_path, delete=False) as f:
+            temporary = Path(f.name)
+        temporary.unlink()
+        try:
+            os.link(source, temporary)
+        except OSError:
+            shutil.copyfile(source, temporary)
+        os.rename(temporary, filename)
+
     def _to_parquet_transaction(
-        self, filename: str | os.PathLike[str], dataframe: polars.DataFrame
+        self,
+        filename: str | os.PathLike[str],
+        dataframe: polars.DataFrame,
+        row_group_size: Optional[int] = None,
     ) -> None:
         """
         Writes the dataset to the filename as a transaction.
@@ -599,7 +642,9 @@ def _to_parquet_transaction(
         """
         self._swap_path.mkdir(parents=True, exist_ok=True)
         with NamedTemporaryFile(dir=self._swap_path, delete=False) as f:
-            dataframe.write_parquet(f.name)
+            dataframe.write_parquet(
+                f.name, statistics=True, row_group_size=row_group_size
+            )
             os.rename(f.name, filename)
 
 
@@ -0,0 +1,29 @@
+from pathlib import Path
+
+import polars
+
+info = "Sort responses by key and primary key"
+
+_ROW_GROUP_SIZE = 64 * 1024
+_PRIMARY_KEYS = {
+    "summary": ["time"],
+    "gen_data": ["report_step", "index"],
+}
+
+
+def _sort_responses(path: Path) -> None:
+    for response_type, primary_key in _PRIMARY_KEYS.items():
+        for response_file in path.glob(
+            f"ensembles/*/realization-*/{response_type}.parquet"
+        ):
+            sorted_file = response_file.with_suffix(".parquet.tmp")
+            polars.read_parquet(response_file).sort(
+                ["response_key", *primary_key]
+            ).write_parquet(
+                sorted_file, statistics=True, row_group_size=_ROW_GROUP_SIZE
+            )
+            sorted_file.replace(response_file)
+
+
+def migrate(path: Path) -> None:
+    _sort_responses(path)
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Hashable, Optional, Tuple
+from uuid import UUID
+
+import polars
+
+DEFAULT_RESPONSE_CACHE_BYTES = 512 * 1024**2
+
+
+@dataclass(frozen=True)
+class ResponseCacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    size_bytes: int
+    max_bytes: int
+
+
+class ResponseCache:
+    """
+    Least recently used cache of loaded responses, shared by the ensembles
+    of a storage and bounded by the estimated size of the cached frames.
+
+    Entries are keyed by ensemble, so that the responses of one ensemble can
+    be invalidated when they change on disk.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_RESPONSE_CACHE_BYTES) -> None:
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[
+            Tuple[UUID, Hashable], Tuple[polars.DataFrame, int]
+        ] = OrderedDict()
+        self._size_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def get(self, ensemble_id: UUID, key: Hashable) -> Optional[polars.DataFrame]:
+        with self._lock:
+            entry = self._entries.get((ensemble_id, key))
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end((ensemble_id, key))
+            self._hits += 1
+            return entry[0]
+
+    def put(self, ensemble_id: UUID, key: Hashable, data: polars.DataFrame) -> None:
+        size = int(data.estimated_size())
+        if size > self._max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop((ensemble_id, key), None)
+            if previous is not None:
+                self._size_bytes -= previous[1]
+            self._entries[ensemble_id, key] = (data, size)
+            self._size_bytes += size
+            while self._size_bytes > self._max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._size_bytes -= evicted_size
+                self._evictions += 1
+
+    def invalidate(self, ensemble_id: Optional[UUID] = None) -> None:
+        """Drops the cached responses of an ensemble, or of all ensembles if
+        ensemble_id is None."""
+        with self._lock:
+            for cache_key in list(self._entries):
+                if ensemble_id is None or cache_key[0] == ensemble_id:
+                    _, size = self._entries.pop(cache_key)
+                    self._size_bytes -= size
+
+    def stats(self) -> ResponseCacheStats:
+        with self._lock:
+            return ResponseCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                size_bytes=self._size_bytes,
+                max_bytes=self._max_bytes,
+            )
@@ -2,25 +2,90 @@
 
 import logging
 import re
-from typing import Any, Mapping, Optional
+import threading
+from typing import (
+    TYPE_CHECKING,
+    AbstractSet,
+    Any,
+    Dict,
+    Iterable,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from pydantic import GetCoreSchemaHandler, GetJsonSchemaHandler
 from pydantic.json_schema import JsonSchemaValue
 from pydantic_core import core_schema
+from typing_extensions import Self
+
+if TYPE_CHECKING:
+    from _typeshed import SupportsKeysAndGetItem
 
 logger = logging.getLogger(__name__)
-_PATTERN = re.compile(r"<[^<>]+>")
 
 
 from collections import UserDict
 
+_PATTERN = re.compile(r"<[^<>]+>")
+_MAX_ITERATIONS = 1000
+# The number of compiled substitutions kept per Substitutions instance, one
+# for the instance itself and one per realization and iteration substituted
+_COMPILED_CACHE_SIZE = 256
+_UNRESOLVED: Any = object()
+# The magic strings which substitute_real_iter sets for each realization
+_REALIZATION_KEYS = ("<IENS>", "<ITER>", "<GEO_ID>")
+
 
 class Substitutions(UserDict[str, str]):
+    _compiled_cache: Optional[
+        Dict[Optional[Tuple[int, int]], _CompiledSubstitutions]
+    ] = None
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        # Run paths are created from several threads substituting concurrently
+        self._compiled_cache_lock = threading.Lock()
+        super().__init__(*args, **kwargs)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Locks cannot be pickled, and the compiled cache is rebuilt on use
+        state = dict(self.__dict__)
+        del state["_compiled_cache_lock"]
+        state.pop("_compiled_cache", None)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._compiled_cache_lock = threading.Lock()
+
+    def __copy__(self) -> Self:
+        copied = super().__copy__()
+        copied._compiled_cache_lock = threading.Lock()
+        copied._compiled_cache = None
+        return copied
+
+    def __setitem__(self, key: str, value: str) -> None:
+        self._compiled_cache = None
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key: str) -> None:
+        self._compiled_cache = None
+        super().__delitem__(key)
+
+    # Typed as in typeshed, which also ignores that it does not match __or__
+    def __ior__(  # type: ignore[override, misc]
+        self, other: Union[SupportsKeysAndGetItem[str, str], Iterable[Tuple[str, str]]]
+    ) -> Self:
+        # UserDict merges into the data without __setitem__
+        self._compiled_cache = None
+        return super().__ior__(other)
+
     def substitute(
         self,
         to_substitute: str,
         context: str = "",
-        max_iterations: int = 1000,
+        max_iterations: int = _MAX_ITERATIONS,
         warn_max_iter: bool = True,
     ) -> str:
         """Perform a search-replace on the first argument
@@ -29,18 +94,60 @@ def substitute(
         emitted during subsitution.
 
         """
+        if max_iterations == _MAX_ITERATIONS:
+            result = self._compiled(None).substitute(to_substitute)
+            if result is not None:
+                return result
         return _substitute(self, to_substitute, context, max_iterations, warn_max_iter)
 
     def substitute_real_iter(
         self, to_substitute: str, realization: int, iteration: int
     ) -> str:
-        copy_substituter = self.copy()
+        result = self._compiled((realization, iteration)).substitute(to_substitute)
+        if result is not None:
+            return result
+        return _substitute(self._with_real_iter(realization, iteration), to_substitute)
+
+    def realization_independent(self) -> Substitutions:
+        """The substitutions without the magic strings which are set for each
+        realization by substitute_real_iter. Substituting with these first and
+        then with substitute_real_iter gives the same result as only using
+        substitute_real_iter, but the first step can be shared between
+        realizations."""
+        return Substitutions(
+            {
+                key: value
+                for key, value in self.data.items()
+                if key not in _REALIZATION_KEYS
+            }
+        )
+
+    def _with_real_iter(self, realization: int, iteration: int) -> Dict[str, str]:
+        substitutions = dict(self.data)
         geo_id_key = f"<GEO_ID_{realization}_{iteration}>"
         if geo_id_key in self:
-            copy_substituter["<GEO_ID>"] = self[geo_id_key]
-        copy_substituter["<IENS>"] = str(realization)
-        copy_substituter["<ITER>"] = str(iteration)
-        return copy_substituter.substitute(to_substitute)
+            substitutions["<GEO_ID>"] = self[geo_id_key]
+        substitutions["<IENS>"] = str(realization)
+        substitutions["<ITER>"] = str(iteration)
+        return substitutions
+
+    def _compiled(self, real_iter: Optional[Tuple[int, int]]) -> _CompiledSubstitutions:
+        with self._compiled_cache_lock:
+            cache = self._compiled_cache
+            if cache is None:
+                cache = self._compiled_cache = {}
+            compiled = cache.get(real_iter)
+        if compiled is not None:
+            return compiled
+        compiled = _CompiledSubstitutions(
+            self.data if real_iter is None else self._with_real_iter(*real_iter)
+        )
+        with self._compiled_cache_lock:
+            if len(cache) >= _COMPILED_CACHE_SIZE:
+                # The oldest entry is evicted, so that the realizations
+                # which are being substituted stay cached
+                del cache[next(iter(cache))]
+            return cache.setdefault(real_iter, compiled)
 
     def _concise_representation(self) -> str:
         return (
@@ -123,6 +230,69 @@ def _substitute(
     return substituted_string
 
 
+class _CompiledSubstitutions:
+    """
+    Substitutions where the magic strings in the values are resolved once,
+    so that a string can be substituted in a single pass instead of once
+    per level of nesting.
+
+    Substituting iteratively may also match magic strings which are formed
+    across the boundaries of substituted values, e.g. "<A<B>>" with <B> set
+    to "C" becomes "<AC>". This can only happen if such a magic string is
+    also in the result of the single pass, and substitute returns None in
+    that case, and for cyclic definitions, to signal that the iterative
+    substitution must be used.
+    """
+
+    _MAX_DEPTH = 100
+
+    def __init__(self, substitutions: Mapping[str, str]) -> None:
+        # Empty values are never substituted
+        self._values = {key: value for key, value in substitutions.items() if value}
+        # Only holds fully resolved values, which are the same whichever
+        # thread resolves them, so it can be shared between threads
+        self._resolved: Dict[str, Optional[str]] = {}
+
+    def substitute(
+        self, string: str, resolving: AbstractSet[str] = frozenset()
+    ) -> Optional[str]:
+        if len(resolving) > self._MAX_DEPTH:
+            return None
+        start = 0
+        parts = []
+        for match in _PATTERN.finditer(string):
+            key = match[0]
+            if key not in self._values:
+                continue
+            value = self._resolve(key, resolving)
+            if value is None:
+                return None
+            parts.append(string[start : match.start()])
+            parts.append(value)
+            start = match.end()
+        if not parts:
+            return string
+        parts.append(string[start:])
+        result = "".join(parts)
+        if any(match[0] in self._values for match in _PATTERN.finditer(result)):
+            return None
+        return result
+
+    def _resolve(self, key: str, resolving: AbstractSet[str]) -> Optional[str]:
+        """The value of key with its magic strings resolved, where resolving
+        are the keys whose values are being resolved by the caller. A key
+        that is met again while it is being resolved is part of a cycle, as
+        are all the keys in between, so None is the final value of all of
+        them."""
+        if key in resolving:
+            return None
+        resolved = self._resolved.get(key, _UNRESOLVED)
+        if resolved is _UNRESOLVED:
+            resolved = self.substitute(self._values[key], resolving | {key})
+            self._resolved[key] = resolved
+        return resolved
+
+
 def _replace_strings(substitutions: Mapping[str, str], string: str) -> Optional[str]:
     start = 0
     parts = []
@@ -137,6 +307,12 @@ def _replace_strings(substitutions: Mapping[str, str], string: str) -> Optional[
     return "".join(parts)
 
 
+def depends_on_realization(string: str) -> bool:
+    """Whether substitute_real_iter may change a string which has already
+    been substituted with Substitutions.realization_independent"""
+    return any(key in string for key in _REALIZATION_KEYS)
+
+
 def substitute_runpath_name(
     to_substitute: str, realization: int, iteration: int
 ) -> str:
@@ -1,7 +1,17 @@
+from datetime import datetime
+
+import numpy as np
+import pytest
+import resfo
 from hypothesis import given
 
 from ert.config._read_summary import read_summary
 from tests.ert.unit_tests.config.summary_generator import (
+    Date,
+    Simulator,
+    Smspec,
+    SmspecIntehead,
+    UnitSystem,
     summaries,
 )
 
@@ -21,3 +31,51 @@ def test_that_length_of_fetch_keys_does_not_reduce_performance(
     (_, keys, time_map, _) = read_summary(str(tmp_path / "TEST"), fetch_keys)
     assert all(k in fetch_keys for k in keys)
     assert len(time_map) == len(unsmry.steps)
+
+
+@pytest.mark.parametrize("fetch_keys", [["WOPR:*"], ["WOPR:W1*"]])
+def test_and_benchmark_reading_large_summary(tmp_path, benchmark, fetch_keys):
+    num_wells = 20000
+    num_steps = 500
+    Smspec(
+        nx=2,
+        ny=2,
+        nz=2,
+        restarted_from_step=0,
+        num_keywords=num_wells + 1,
+        restart="        ",
+        keywords=["TIME    "] + ["WOPR    "] * num_wells,
+        well_names=[":+:+:+:+"] + [f"W{i}".ljust(8) for i in range(num_wells)],
+        region_numbers=[0] * (num_wells + 1),
+        units=["DAYS    "] + ["SM3     "] * num_wells,
+        start_date=Date(day=1, month=1, year=2014, hour=0, minutes=0, micro_seconds=0),
+        intehead=SmspecIntehead(
+            unit=UnitSystem.METRIC,
+            simulator=Simulator.ECLIPSE_100,
+        ),
+    ).to_file(tmp_path / "TEST.SMSPEC")
+    params = np.random.default_rng(0).random(
+        (num_steps, num_wells + 1), dtype=np.float32
+    )
+    params[:, 0] = np.arange(num_steps)
+    resfo.write(
+        tmp_path / "TEST.UNSMRY",
+        [
+            record
+            for step, values in enumerate(params)
+            for record in [
+                ("SEQHDR  ", np.array([step], dtype=np.int32)),
+                ("MINISTEP", np.array([step], dtype=np.int32)),
+                ("PARAMS  ", values),
+            ]
+        ],
+    )
+
+    _, keys, time_map, data = benchmark(
+        read_summary, str(tmp_path / "TEST"), fetch_keys
+    )
+
+    wells = [int(key.split(":W")[1]) for key in keys]
+    np.testing.assert_array_equal(data, params[:, np.array(wells) + 1].T)
+    assert time_map[0] == np.datetime64(datetime(2014, 1, 1))
+    assert len(time_map) == num_steps
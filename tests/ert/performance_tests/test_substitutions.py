@@ -0,0 +1,42 @@
+import pytest
+
+from ert.substitutions import Substitutions, _substitute
+
+
+def _substitute_real_iter_iteratively(substitutions, to_substitute, realization):
+    return _substitute(
+        {**substitutions, "<IENS>": str(realization), "<ITER>": "0"},
+        to_substitute,
+    )
+
+
+def _substitute_real_iter_compiled(substitutions, to_substitute, realization):
+    return substitutions.substitute_real_iter(to_substitute, realization, 0)
+
+
+@pytest.mark.parametrize(
+    "substitute",
+    [
+        pytest.param(_substitute_real_iter_iteratively, id="iterative"),
+        pytest.param(_substitute_real_iter_compiled, id="compiled"),
+    ],
+)
+def test_and_benchmark_substituting_templates_for_realizations(benchmark, substitute):
+    substitutions = Substitutions(
+        {f"<KEY_{i}>": f"value_{i}_<KEY_{i + 1}>" for i in range(20)}
+    )
+    substitutions["<KEY_20>"] = "<ECLBASE>"
+    substitutions["<ECLBASE>"] = "CASE_<IENS>"
+    template = "\n".join(
+        f"line {i} <KEY_{i % 20}> <UNKNOWN> <IENS> <ITER>" for i in range(1000)
+    )
+
+    def run():
+        return [substitute(substitutions, template, iens) for iens in range(10)]
+
+    results = benchmark(run)
+    assert results[3].startswith(
+        "line 0 value_0_value_1_"
+        + "".join(f"value_{i}_" for i in range(2, 20))
+        + "CASE_3 <UNKNOWN> 3 0"
+    )
@@ -37,7 +37,7 @@
     TEST_RUN_MODE,
 )
 from ert.scheduler.job import Job
-from ert.storage import open_storage
+from ert.storage import ParameterLayout, open_storage
 
 from .run_cli import run_cli
 
@@ -856,6 +856,33 @@ def test_exclude_parameter_from_update():
     assert (log_paths[0] / "Report.csv").exists()
 
 
+@pytest.mark.usefixtures("copy_poly_case")
+def test_that_parameters_are_stored_in_the_configured_layout():
+    with open("poly.ert", mode="a", encoding="utf-8") as fh:
+        fh.write("PARAMETER_LAYOUT ENSEMBLE\n")
+
+    run_cli(
+        ENSEMBLE_SMOOTHER_MODE,
+        "--disable-monitor",
+        "--target-case",
+        "iter-%d",
+        "--realizations",
+        "0-5",
+        "poly.ert",
+    )
+    with open_storage("storage", "r") as storage:
+        experiment = storage.get_experiment_by_name("es")
+        prior = experiment.get_ensemble_by_name("iter-0")
+        posterior = experiment.get_ensemble_by_name("iter-1")
+        assert prior.parameter_layout == ParameterLayout.ENSEMBLE
+        assert posterior.parameter_layout == ParameterLayout.ENSEMBLE
+        assert not list((prior._path / "realization-0").glob("*.nc"))
+        prior_values = prior.load_parameters_numpy("COEFFS", np.arange(6))
+        posterior_values = posterior.load_parameters_numpy("COEFFS", np.arange(6))
+        assert prior_values.shape == posterior_values.shape == (3, 6)
+        assert not np.allclose(prior_values, posterior_values)
+
+
 from ert.scheduler.driver import Driver
 
 
@@ -1,6 +1,10 @@
 import functools
 import re
+import threading
+import time
+import tracemalloc
 from contextlib import ExitStack as does_not_raise
+from datetime import datetime, timedelta
 from pathlib import Path
 from unittest.mock import patch
 
@@ -19,16 +23,26 @@
     smoother_update,
 )
 from ert.analysis._es_update import (
+    _ForwardedProgress,
+    _get_observations_and_responses,
     _load_observations_and_responses,
     _load_param_ensemble_array,
     _save_param_ensemble_array_to_disk,
+    _select_observed_responses,
+    _update_param_group_in_chunks,
+    _update_param_groups,
+)
+from ert.analysis.event import (
+    AnalysisCompleteEvent,
+    AnalysisErrorEvent,
+    AnalysisStatusEvent,
 )
-from ert.analysis.event import AnalysisCompleteEvent, AnalysisErrorEvent
 from ert.config import Field, GenDataConfig, GenKwConfig
 from ert.config.analysis_config import UpdateSettings
 from ert.config.analysis_module import ESSettings, IESSettings
 from ert.config.gen_kw_config import TransformFunctionDefinition
 from ert.field_utils import Shape
+from ert.storage import ParameterLayout
 
 
 @pytest.fixture
@@ -585,6 +599,40 @@ def test_temporary_parameter_storage_with_inactive_fields(
         np.testing.assert_array_equal(ds["values"].values[0], fields[iens]["values"])
 
 
+def test_that_saving_parameters_writes_batches_of_at_most_batch_size(
+    storage, uniform_parameter
+):
+    ensemble_size = 10
+    experiment = storage.create_experiment(parameters=[uniform_parameter])
+    ensemble = storage.create_ensemble(
+        experiment, ensemble_size=ensemble_size, iteration=0, name="post"
+    )
+    param_ensemble_array = np.arange(ensemble_size, dtype=np.float64).reshape(1, -1)
+    batch_sizes = []
+    save_parameters_many = GenKwConfig.save_parameters_many
+
+    def record_batch(self, ensemble, group, realizations, data):
+        batch_sizes.append(len(realizations))
+        save_parameters_many(self, ensemble, group, realizations, data)
+
+    # One value is updated and one is written per realization, so 48 bytes
+    # holds 3 realizations
+    with patch.object(GenKwConfig, "save_parameters_many", record_batch):
+        _save_param_ensemble_array_to_disk(
+            ensemble,
+            param_ensemble_array,
+            "PARAMETER",
+            np.arange(ensemble_size),
+            batch_bytes=48,
+        )
+
+    assert batch_sizes == [3, 3, 3, 1]
+    np.testing.assert_array_equal(
+        _load_param_ensemble_array(ensemble, "PARAMETER", np.arange(ensemble_size)),
+        param_ensemble_array,
+    )
+
+
 def _mock_load_observations_and_responses(
     observations_and_responses,
     alpha,
@@ -929,3 +977,448 @@ def test_update_subset_parameters(storage, uniform_parameter, obs):
     assert not prior.load_parameters("PARAMETER", 0)["values"].equals(
         posterior_ens.load_parameters("PARAMETER", 0)["values"]
     )
+
+
+@pytest.mark.parametrize(
+    "settings",
+    [
+        {"update_workers": 3},
+        # The budget fits one group at a time
+        {"update_workers": 3, "update_memory_budget": 500 / 1024**3},
+        {"update_workers": 2, "localization": True},
+    ],
+)
+def test_that_parallel_update_of_parameter_groups_matches_sequential(
+    storage, obs, settings
+):
+    groups = [
+        GenKwConfig(
+            name=f"PARAMETER_{i}",
+            forward_init=False,
+            template_file="",
+            transform_function_definitions=[
+                TransformFunctionDefinition("KEY1", "UNIFORM", [0, 1]),
+                TransformFunctionDefinition("KEY2", "UNIFORM", [0, 1]),
+            ],
+            output_file=None,
+            update=True,
+        )
+        for i in range(4)
+    ]
+    experiment = storage.create_experiment(
+        parameters=groups,
+        responses=[GenDataConfig(keys=["RESPONSE"])],
+        observations={"gen_data": obs},
+    )
+    prior = storage.create_ensemble(experiment, ensemble_size=10, name="prior")
+    rng = np.random.default_rng(1234)
+    for iens in range(prior.ensemble_size):
+        for group in groups:
+            group.save_parameters(prior, group.name, iens, rng.normal(size=2))
+        data = rng.uniform(0.8, 1, 3)
+        prior.save_response(
+            "gen_data",
+            polars.DataFrame(
+                {
+                    "response_key": "RESPONSE",
+                    "report_step": polars.Series([0] * len(data), dtype=polars.UInt16),
+                    "index": polars.Series(range(len(data)), dtype=polars.UInt16),
+                    "values": polars.Series(data, dtype=polars.Float32),
+                }
+            ),
+            iens,
+        )
+
+    def update(module):
+        posterior = storage.create_ensemble(
+            experiment,
+            ensemble_size=prior.ensemble_size,
+            iteration=1,
+            name="posterior",
+            prior_ensemble=prior,
+        )
+        smoother_update(
+            prior,
+            posterior,
+            ["OBSERVATION"],
+            [group.name for group in groups],
+            UpdateSettings(),
+            module,
+            rng=np.random.default_rng(42),
+        )
+        return posterior
+
+    sequential = update(ESSettings(localization=settings.get("localization", False)))
+    parallel = update(ESSettings(**settings))
+    for group in groups:
+        xr.testing.assert_equal(
+            sequential.load_parameters(group.name), parallel.load_parameters(group.name)
+        )
+
+
+@pytest.mark.parametrize("layout", list(ParameterLayout))
+def test_that_parameter_groups_larger_than_the_budget_are_updated_in_chunks(
+    storage, layout, monkeypatch
+):
+    config = GenKwConfig(
+        name="PARAMETER",
+        forward_init=False,
+        template_file="",
+        transform_function_definitions=[
+            TransformFunctionDefinition(f"KEY{i}", "UNIFORM", [0, 1]) for i in range(5)
+        ],
+        output_file=None,
+        update=True,
+    )
+    experiment = storage.create_experiment(parameters=[config])
+    prior = storage.create_ensemble(
+        experiment, ensemble_size=4, name="prior", parameter_layout=layout
+    )
+    posterior = storage.create_ensemble(
+        experiment, ensemble_size=4, name="posterior", prior_ensemble=prior
+    )
+    rng = np.random.default_rng(1234)
+    for iens in range(prior.ensemble_size):
+        config.save_parameters(prior, "PARAMETER", iens, rng.normal(size=5))
+    iens_active_index = np.array([0, 1, 3])
+    X = config.load_parameters(prior, "PARAMETER", iens_active_index)
+    T = rng.normal(size=(3, 3))
+
+    loaded_realizations = []
+    load_parameters = GenKwConfig.load_parameters
+
+    def counting_load_parameters(ensemble, group, realizations):
+        loaded_realizations.extend(realizations)
+        return load_parameters(ensemble, group, realizations)
+
+    monkeypatch.setattr(
+        GenKwConfig, "load_parameters", staticmethod(counting_load_parameters)
+    )
+    events = []
+    # Blocks of two rows of the prior, posterior and the block read for three
+    # realizations
+    _update_param_group_in_chunks(
+        prior,
+        posterior,
+        "PARAMETER",
+        iens_active_index,
+        T,
+        3 * 2 * 3 * 8,
+        events.append,
+    )
+
+    assert "in 3 chunks of at most 2 parameters" in events[0].msg
+    if layout == ParameterLayout.REALIZATION:
+        # Each realization file is read once, not once for every chunk
+        assert sorted(loaded_realizations) == [0, 1, 3]
+    np.testing.assert_allclose(
+        config.load_parameters(posterior, "PARAMETER", iens_active_index), X @ T
+    )
+
+
+def test_that_chunked_updates_of_the_ensemble_layout_read_within_the_budget(
+    storage, monkeypatch
+):
+    num_params = 2000
+    ensemble_size = 20
+    config = GenKwConfig(
+        name="PARAMETER",
+        forward_init=False,
+        template_file="",
+        transform_function_definitions=[
+            TransformFunctionDefinition(f"KEY{i}", "UNIFORM", [0, 1])
+            for i in range(num_params)
+        ],
+        output_file=None,
+        update=True,
+    )
+    experiment = storage.create_experiment(parameters=[config])
+    prior = storage.create_ensemble(
+        experiment,
+        ensemble_size=ensemble_size,
+        name="prior",
+        parameter_layout=ParameterLayout.ENSEMBLE,
+    )
+    posterior = storage.create_ensemble(
+        experiment, ensemble_size=ensemble_size, name="posterior", prior_ensemble=prior
+    )
+    rng = np.random.default_rng(1234)
+    config.save_parameters_many(
+        prior,
+        "PARAMETER",
+        np.arange(ensemble_size),
+        rng.normal(size=(num_params, ensemble_size)),
+    )
+    iens_active_index = np.arange(ensemble_size)
+    X = config.load_parameters(prior, "PARAMETER", iens_active_index)
+    T = rng.normal(size=(ensemble_size, ensemble_size))
+
+    # Blocks of 100 rows of the prior, posterior and the block read
+    memory_budget = 3 * 100 * ensemble_size * 8
+    peaks = []
+    load_parameter_rows = GenKwConfig.load_parameter_rows
+
+    def measured_load_parameter_rows(*args, **kwargs):
+        tracemalloc.start()
+        try:
+            rows = load_parameter_rows(*args, **kwargs)
+            peaks.append(tracemalloc.get_traced_memory()[1])
+        finally:
+            tracemalloc.stop()
+        return rows
+
+    monkeypatch.setattr(
+        GenKwConfig,
+        "load_parameter_rows",
+        staticmethod(measured_load_parameter_rows),
+    )
+    _update_param_group_in_chunks(
+        prior,
+        posterior,
+        "PARAMETER",
+        iens_active_index,
+        T,
+        memory_budget,
+        lambda _: None,
+    )
+
+    # Reading whole realizations would take num_params * ensemble_size * 8
+    # bytes, twenty times the budget
+    assert len(peaks) == num_params // 100
+    assert max(peaks) < memory_budget
+    np.testing.assert_allclose(
+        config.load_parameters(posterior, "PARAMETER", iens_active_index), X @ T
+    )
+
+
+def test_that_update_memory_budget_limits_concurrent_groups(storage):
+    groups = [
+        GenKwConfig(
+            name=f"PARAMETER_{i}",
+            forward_init=False,
+            template_file="",
+            transform_function_definitions=[
+                TransformFunctionDefinition("KEY1", "UNIFORM", [0, 1]),
+            ],
+            output_file=None,
+            update=True,
+        )
+        for i in range(6)
+    ]
+    experiment = storage.create_experiment(parameters=groups)
+    ensemble = storage.create_ensemble(experiment, ensemble_size=10, name="prior")
+    running = []
+    max_running = []
+    lock = threading.Lock()
+
+    def load_param_group(_):
+        with lock:
+            running.append(1)
+            max_running.append(len(running))
+        return np.zeros((1, 10))
+
+    def save_param_group(_, __):
+        time.sleep(0.05)
+        with lock:
+            running.pop()
+
+    # Each group is estimated at 3 * 1 * 10 * 8 = 240 bytes
+    budget = 500 / 1024**3
+    for update_workers in [1, 6]:
+        max_running.clear()
+        _update_param_groups(
+            [group.name for group in groups],
+            load_param_group,
+            lambda _, array: array,
+            save_param_group,
+            ensemble,
+            10,
+            ESSettings(update_workers=update_workers, update_memory_budget=budget),
+        )
+        assert len(max_running) == 6
+        assert max(max_running) == 2
+
+
+def test_that_parameter_groups_are_prefetched_and_written_back_during_update(
+    storage, uniform_parameter
+):
+    experiment = storage.create_experiment(parameters=[uniform_parameter])
+    ensemble = storage.create_ensemble(experiment, ensemble_size=10, name="prior")
+    events = []
+    lock = threading.Lock()
+
+    def record(event):
+        with lock:
+            events.append(event)
+
+    def load_param_group(param_group):
+        record(("load", param_group))
+        return np.zeros((1, 10))
+
+    def update_param_group(param_group, array):
+        time.sleep(0.05)
+        record(("update", param_group))
+        return array
+
+    def save_param_group(param_group, _):
+        record(("save", param_group))
+
+    progress_events = []
+    _update_param_groups(
+        ["PARAMETER"] * 3,
+        load_param_group,
+        update_param_group,
+        save_param_group,
+        ensemble,
+        10,
+        ESSettings(update_memory_budget=1.0),
+        progress_events.append,
+    )
+    assert len(events) == 9
+    # The second group is loaded while the first is being updated
+    assert events.index(("load", "PARAMETER"), 1) < events.index(
+        ("update", "PARAMETER")
+    )
+    assert isinstance(progress_events[-1], AnalysisStatusEvent)
+    assert progress_events[-1].msg.startswith("Updated 3 parameter groups")
+
+
+def test_that_parameter_groups_are_updated_one_at_a_time_by_default(
+    storage, uniform_parameter
+):
+    experiment = storage.create_experiment(parameters=[uniform_parameter])
+    ensemble = storage.create_ensemble(experiment, ensemble_size=10, name="prior")
+    events = []
+
+    def update_param_group(_, array):
+        events.append("update")
+        return array
+
+    _update_param_groups(
+        ["PARAMETER"] * 3,
+        lambda _: events.append("load") or np.zeros((1, 10)),
+        update_param_group,
+        lambda _, __: events.append("save"),
+        ensemble,
+        10,
+        ESSettings(),
+    )
+    assert events == ["load", "update", "save"] * 3
+
+
+@pytest.mark.parametrize(
+    "settings", [{"update_workers": 3}, {"update_memory_budget": 1.0}]
+)
+def test_that_progress_is_reported_on_the_thread_running_the_update(
+    storage, uniform_parameter, settings
+):
+    experiment = storage.create_experiment(parameters=[uniform_parameter])
+    ensemble = storage.create_ensemble(experiment, ensemble_size=10, name="prior")
+    threads = []
+    progress_callback = _ForwardedProgress(
+        lambda _: threads.append(threading.get_ident())
+    )
+
+    def load_param_group(param_group):
+        progress_callback(AnalysisStatusEvent(msg=f"Loading {param_group}"))
+        return np.zeros((1, 10))
+
+    def save_param_group(param_group, _):
+        progress_callback(AnalysisStatusEvent(msg=f"Saving {param_group}"))
+
+    _update_param_groups(
+        ["PARAMETER"] * 3,
+        load_param_group,
+        lambda _, array: array,
+        save_param_group,
+        ensemble,
+        10,
+        ESSettings(**settings),
+        progress_callback,
+    )
+    # Loading and saving three groups, and the summary
+    assert len(threads) == 7
+    assert set(threads) == {threading.get_ident()}
+
+
+def test_that_failing_parameter_group_update_is_raised_from_pipeline(
+    storage, uniform_parameter
+):
+    experiment = storage.create_experiment(parameters=[uniform_parameter])
+    ensemble = storage.create_ensemble(experiment, ensemble_size=10, name="prior")
+
+    def update_param_group(_, __):
+        raise ValueError("Failed update")
+
+    with pytest.raises(ValueError, match="Failed update"):
+        _update_param_groups(
+            ["PARAMETER"] * 3,
+            lambda _: np.zeros((1, 10)),
+            update_param_group,
+            lambda _, __: None,
+            ensemble,
+            10,
+            ESSettings(update_memory_budget=1e-9),
+        )
+
+
+def test_that_only_observed_responses_are_selected_before_pivot():
+    start = datetime(2020, 1, 1)
+    observations = polars.DataFrame(
+        {
+            "response_key": ["FOPR", "FOPR"],
+            "observation_key": ["FOPR_1", "FOPR_2"],
+            "time": [start, start + timedelta(days=2)],
+            "observations": [1.0, 2.0],
+            "std": [0.1, 0.1],
+        }
+    )
+    responses = polars.DataFrame(
+        {
+            "response_key": ["FOPR", "FOPR", "FOPR", "FOPT", "FOPR"],
+            "time": [
+                start,
+                start + timedelta(days=1),
+                start + timedelta(days=2, milliseconds=-500),
+                start,
+                start + timedelta(days=2, seconds=1, milliseconds=1),
+            ],
+            "realization": polars.Series([0, 0, 0, 0, 1], dtype=polars.UInt16),
+            "values": polars.Series([1.0, 2.0, 3.0, 4.0, 5.0], dtype=polars.Float32),
+        }
+    )
+    selected = _select_observed_responses(
+        responses.lazy(), observations, ["time"]
+    ).collect()
+    assert sorted(selected["values"].to_list()) == [1.0, 3.0]
+
+
+def test_that_realizations_without_observed_responses_keep_their_column(
+    storage, uniform_parameter, obs
+):
+    experiment = storage.create_experiment(
+        parameters=[uniform_parameter],
+        responses=[GenDataConfig(keys=["RESPONSE", "OTHER"])],
+        observations={"gen_data": obs},
+    )
+    ensemble = storage.create_ensemble(experiment, ensemble_size=3, name="prior")
+    for iens in range(ensemble.ensemble_size):
+        ensemble.save_response(
+            "gen_data",
+            polars.DataFrame(
+                {
+                    "response_key": "OTHER" if iens == 1 else "RESPONSE",
+                    "report_step": polars.Series([0] * 3, dtype=polars.UInt16),
+                    "index": polars.Series(range(3), dtype=polars.UInt16),
+                    "values": polars.Series([float(iens)] * 3, dtype=polars.Float32),
+                }
+            ),
+            iens,
+        )
+    observations_and_responses = _get_observations_and_responses(
+        ensemble, ["OBSERVATION"], np.array([2, 1, 0])
+    )
+    assert observations_and_responses.columns[5:] == ["2", "1", "0"]
+    assert observations_and_responses["2"].to_list() == [2.0] * 3
+    assert observations_and_responses["1"].to_list() == [None] * 3
+    assert observations_and_responses["0"].to_list() == [0.0] * 3
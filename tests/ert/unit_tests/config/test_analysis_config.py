@@ -188,6 +188,47 @@ def test_unknown_variable_raises_validation_error():
         )
 
 
+def test_that_parallel_update_settings_are_read_from_analysis_set_var():
+    config = AnalysisConfig.from_dict(
+        {
+            ConfigKeys.ANALYSIS_SET_VAR: [
+                ["STD_ENKF", "UPDATE_WORKERS", "4"],
+                ["IES_ENKF", "UPDATE_MEMORY_BUDGET", "8.5"],
+            ],
+        }
+    )
+    assert config.es_module.update_workers == 4
+    assert config.es_module.update_memory_budget is None
+    assert config.ies_module.update_workers == 1
+    assert config.ies_module.update_memory_budget == 8.5
+
+    with pytest.raises(ConfigValidationError, match="greater than or equal to 1"):
+        AnalysisConfig.from_dict(
+            {ConfigKeys.ANALYSIS_SET_VAR: [["STD_ENKF", "UPDATE_WORKERS", "0"]]}
+        )
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("REALIZATION", "realization"),
+        ("ENSEMBLE", "ensemble"),
+        ("ensemble", "ensemble"),
+    ],
+)
+def test_that_parameter_layout_is_set_from_corresponding_keyword(value, expected):
+    assert AnalysisConfig.from_dict({}).parameter_layout == "realization"
+    assert (
+        AnalysisConfig.from_dict({ConfigKeys.PARAMETER_LAYOUT: value}).parameter_layout
+        == expected
+    )
+
+
+def test_that_an_unknown_parameter_layout_raises_config_validation_error():
+    with pytest.raises(ConfigValidationError, match="PARAMETER_LAYOUT must be one of"):
+        AnalysisConfig.from_dict({ConfigKeys.PARAMETER_LAYOUT: "COLUMNS"})
+
+
 def test_default_alpha_is_set():
     default_alpha = 3.0
     assert AnalysisConfig.from_dict({}).observation_settings.alpha == default_alpha
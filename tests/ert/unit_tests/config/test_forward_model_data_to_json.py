@@ -6,10 +6,12 @@
 from textwrap import dedent
 from typing import List
 
+import orjson
 import pytest
 
 from ert.config import ErtConfig, ForwardModelStep
 from ert.config.ert_config import (
+    ForwardModelJSONTemplate,
     _forward_model_step_from_config_file,
     forward_model_data_to_json,
 )
@@ -827,3 +829,45 @@ def test_that_executables_in_path_are_not_made_realpath(tmp_path):
     )
 
     assert data["jobList"][0]["executable"] == "echo"
+
+
+@pytest.mark.usefixtures("use_tmpdir")
+def test_that_forward_model_json_template_is_rendered_for_each_realization():
+    with open("job_file", "w", encoding="utf-8") as fout:
+        fout.write("EXECUTABLE echo\nARGLIST <ARG> <IENS> <MSG>\n")
+    with open("static_job_file", "w", encoding="utf-8") as fout:
+        fout.write("EXECUTABLE echo\nARGLIST <MSG>\n")
+
+    with open("config_file.ert", "w", encoding="utf-8") as fout:
+        fout.write("NUM_REALIZATIONS 3\n")
+        fout.write("DEFINE <CASE> case_<IENS>_<ITER>\n")
+        fout.write("INSTALL_JOB job_name job_file\n")
+        fout.write("INSTALL_JOB static_job_name static_job_file\n")
+        fout.write("FORWARD_MODEL job_name(<ARG>=<CASE>, <MSG>=hello)\n")
+        fout.write("FORWARD_MODEL static_job_name(<MSG>=hello)\n")
+
+    ert_config = ErtConfig.from_file("config_file.ert")
+    template = ForwardModelJSONTemplate(
+        context=ert_config.substitutions,
+        forward_model_steps=ert_config.forward_model_steps,
+        env_vars=ert_config.env_vars,
+        user_config_file=ert_config.user_config_file,
+    )
+    for iens in range(3):
+        data = orjson.loads(template.render_json(f"run_{iens}", iens, 1))
+        assert data == forward_model_data_to_json(
+            substitutions=ert_config.substitutions,
+            forward_model_steps=ert_config.forward_model_steps,
+            env_vars=ert_config.env_vars,
+            user_config_file=ert_config.user_config_file,
+            run_id=f"run_{iens}",
+            iens=iens,
+            itr=1,
+        )
+        step, static_step = data["jobList"]
+        assert data["run_id"] == f"run_{iens}"
+        assert step["argList"] == [f"case_{iens}_1", str(iens), "hello"]
+        assert step["environment"]["_ERT_REALIZATION_NUMBER"] == str(iens)
+        assert step["environment"]["_ERT_ITERATION_NUMBER"] == "1"
+        assert static_step["argList"] == ["hello"]
+        assert static_step["environment"]["_ERT_REALIZATION_NUMBER"] == str(iens)
@@ -4,6 +4,8 @@
 from typing import List
 
 import hypothesis.strategies as st
+import numpy as np
+import polars
 import pytest
 from hypothesis import given
 
@@ -135,6 +137,29 @@ def test_that_invalid_gendata_outfile_error_propagates(tmp_path):
         config.read_from_file(tmp_path, 0, 0)
 
 
+def test_that_invalid_values_are_reported_with_their_row_and_column(tmp_path):
+    (tmp_path / "poly.out").write_text("# header\n1.0\n\n2.0 3.0 # comment\n4.0 x\n")
+    config = GenDataConfig(
+        name="gen_data",
+        keys=["something"],
+        report_steps_list=[None],
+        input_files=["poly.out"],
+    )
+    with pytest.raises(
+        InvalidResponseFile,
+        match="could not convert string 'x' to float64 at row 2, column 2",
+    ):
+        config.read_from_file(tmp_path, 0, 0)
+
+
+def test_that_reading_without_files_is_an_invalid_response(tmp_path):
+    config = GenDataConfig(
+        name="gen_data", keys=[], report_steps_list=[], input_files=[]
+    )
+    with pytest.raises(InvalidResponseFile, match="No files were given"):
+        config.read_from_file(tmp_path, 0, 0)
+
+
 @pytest.mark.usefixtures("use_tmpdir")
 @given(st.binary())
 def test_that_read_file_does_not_raise_unexpected_exceptions_on_invalid_file(contents):
@@ -168,3 +193,37 @@ def test_that_read_file_does_not_raise_unexpected_exceptions_on_missing_director
             report_steps_list=[None],
             input_files=["DOES_NOT_EXIST"],
         ).read_from_file(str(tmp_path / "DOES_NOT_EXIST"), 0, 0)
+
+
+@pytest.mark.parametrize("num_keys", [1, 20])
+def test_that_read_file_reads_all_keys_and_report_steps(tmp_path, num_keys):
+    keys = [f"KEY{i}" for i in range(num_keys)]
+    for key in keys:
+        for report_step in [0, 1, 2]:
+            (tmp_path / f"{key}_{report_step}.out").write_text(
+                "# values\n"
+                + "\n".join(str(report_step + i / 4) for i in range(report_step + 1))
+                + "\n"
+            )
+        (tmp_path / f"{key}_2.out_active").write_text("1\n0\n1\n")
+
+    df = GenDataConfig(
+        name="gen_data",
+        keys=keys,
+        input_files=[f"{key}_%d.out" for key in keys],
+        report_steps_list=[[0, 1, 2] for _ in keys],
+    ).read_from_file(str(tmp_path), 0, 0)
+
+    assert df.schema == {
+        "response_key": polars.String,
+        "report_step": polars.UInt16,
+        "index": polars.UInt16,
+        "values": polars.Float32,
+    }
+    assert df["response_key"].to_list() == [key for key in keys for _ in range(6)]
+    assert df["report_step"].to_list() == [0, 1, 1, 2, 2, 2] * num_keys
+    assert df["index"].to_list() == [0, 0, 1, 0, 1, 2] * num_keys
+    np.testing.assert_array_equal(
+        df["values"].to_numpy(),
+        [0.0, 1.0, 1.25, 2.0, np.nan, 2.5] * num_keys,
+    )
@@ -19,7 +19,14 @@
     SlurmQueueOptions,
     TorqueQueueOptions,
 )
-from ert.scheduler import LocalDriver, LsfDriver, OpenPBSDriver, SlurmDriver
+from ert.scheduler import (
+    LocalDriver,
+    LsfDriver,
+    OpenPBSDriver,
+    PackedDriver,
+    SlurmDriver,
+    create_driver,
+)
 
 
 def test_create_local_copy_is_a_copy_with_local_queue_system():
@@ -512,6 +519,52 @@ def test_driver_initialization_from_defaults(queue_system):
         SlurmDriver(**SlurmQueueOptions().driver_options)
 
 
+@pytest.mark.parametrize("queue_system", ["LSF", "SLURM", "TORQUE"])
+def test_that_array_submit_is_passed_on_to_the_driver(queue_system):
+    queue_config = ErtConfig.from_file_contents(
+        "NUM_REALIZATIONS 1\n"
+        f"QUEUE_SYSTEM {queue_system}\n"
+        "QUEUE_OPTION GENERIC ARRAY_SUBMIT TRUE\n"
+    ).queue_config
+    assert queue_config.queue_options.driver_options["array_submit"] is True
+    assert create_driver(queue_config.queue_options).gathers_submits
+
+
+@pytest.mark.parametrize("queue_system", ["LOCAL", "LSF", "SLURM", "TORQUE"])
+def test_that_realizations_are_packed_when_pack_size_is_set(queue_system):
+    queue_config = ErtConfig.from_file_contents(
+        "NUM_REALIZATIONS 1\n"
+        f"QUEUE_SYSTEM {queue_system}\n"
+        "QUEUE_OPTION GENERIC PACK_SIZE 4\n"
+        "QUEUE_OPTION GENERIC PACK_PARALLEL FALSE\n"
+    ).queue_config
+    assert queue_config.queue_options.pack_size == 4
+    assert queue_config.queue_options.pack_parallel is False
+    assert "pack_size" not in queue_config.queue_options.driver_options
+    assert isinstance(create_driver(queue_config.queue_options), PackedDriver)
+
+
+def test_that_pack_size_must_be_positive():
+    with pytest.raises(ConfigValidationError, match="greater than 0"):
+        ErtConfig.from_file_contents(
+            "NUM_REALIZATIONS 1\n"
+            "QUEUE_SYSTEM LSF\n"
+            "QUEUE_OPTION GENERIC PACK_SIZE 0\n"
+        )
+
+
+@pytest.mark.parametrize("queue_system", ["LOCAL", "LSF", "SLURM", "TORQUE"])
+def test_that_ingestion_workers_is_a_generic_queue_option(queue_system):
+    queue_config = ErtConfig.from_file_contents(
+        "NUM_REALIZATIONS 1\n"
+        f"QUEUE_SYSTEM {queue_system}\n"
+        "QUEUE_OPTION GENERIC INGESTION_WORKERS 3\n"
+    ).queue_config
+    assert queue_config.ingestion_workers == 3
+    assert "ingestion_workers" not in queue_config.queue_options.driver_options
+    create_driver(queue_config.queue_options)
+
+
 @pytest.mark.parametrize(
     "venv, expected", [("my_env", "source my_env/bin/activate"), (None, "")]
 )
@@ -7,12 +7,14 @@
 from hypothesis import given
 from resdata.summary import Summary, SummaryVarType
 
-from ert.config import InvalidResponseFile
+from ert.config import InvalidResponseFile, _read_summary
 from ert.config._read_summary import make_summary_key, read_summary
 from ert.summary_key_type import SummaryKeyType
 
 from .summary_generator import (
     inter_region_summary_variables,
+    simple_smspec,
+    simple_unsmry,
     summaries,
     summary_variables,
 )
@@ -285,7 +287,7 @@ def to_date(start_date: datetime, offset: float, unit: str) -> datetime:
     assert all(
         abs(actual - expected) <= timedelta(minutes=15)
         for actual, expected in zip_longest(
-            time_map,
+            time_map.tolist(),
             [
                 to_date(
                     smspec.start_date.to_datetime(),
@@ -486,3 +488,37 @@ def test_that_ambiguous_case_restart_raises_an_informative_error(
         match="Ambiguous reference to unified summary",
     ):
         read_summary(str(tmp_path / "test"), ["*"])
+
+
+def test_that_identical_summary_specifications_are_only_parsed_once(
+    tmp_path, monkeypatch
+):
+    parse_spec = _read_summary._parse_spec
+    parsed = []
+
+    def counting_parse_spec(spec, fetch_keys):
+        parsed.append(spec)
+        return parse_spec(spec, fetch_keys)
+
+    monkeypatch.setattr(_read_summary, "_parse_spec", counting_parse_spec)
+    monkeypatch.setattr(_read_summary, "_spec_cache", _read_summary.OrderedDict())
+
+    smspec = simple_smspec()
+    for realization in range(3):
+        run_path = tmp_path / f"realization-{realization}"
+        run_path.mkdir()
+        smspec.to_file(run_path / "TEST.SMSPEC")
+        simple_unsmry().to_file(run_path / "TEST.UNSMRY")
+        (_, keys, _, data) = read_summary(str(run_path / "TEST"), ["F*"])
+        assert keys == ["FOPR"]
+        assert data.tolist() == [[pytest.approx(5.629901e16)]]
+    assert len(parsed) == 1
+
+    read_summary(str(tmp_path / "realization-0" / "TEST"), ["FOPR"])
+    assert len(parsed) == 2
+
+    smspec.keywords = ["TIME    ", "FGPR"]
+    smspec.to_file(tmp_path / "realization-0" / "TEST.SMSPEC")
+    (_, keys, _, _) = read_summary(str(tmp_path / "realization-0" / "TEST"), ["F*"])
+    assert keys == ["FGPR"]
+    assert len(parsed) == 3
@@ -3,6 +3,8 @@
 from pathlib import Path
 
 import hypothesis.strategies as st
+import numpy as np
+import polars
 import pytest
 from hypothesis import given, settings
 
@@ -12,6 +14,7 @@
     InvalidResponseFile,
     SummaryConfig,
 )
+from ert.config._read_summary import read_summary
 
 from .summary_generator import summaries
 
@@ -36,6 +39,29 @@ def test_reading_empty_summaries_raises(wopr_summary):
         SummaryConfig("summary", ["CASE"], ["WWCT:OP1"]).read_from_file(".", 0, 0)
 
 
+@settings(max_examples=10)
+@given(summaries())
+@pytest.mark.usefixtures("use_tmpdir")
+def test_that_read_file_gives_one_row_per_key_and_time(summary):
+    smspec, unsmry = summary
+    smspec.to_file("CASE.SMSPEC")
+    unsmry.to_file("CASE.UNSMRY")
+    _, keys, time_map, data = read_summary("CASE", ["*"])
+
+    df = SummaryConfig("summary", ["CASE"], ["*"]).read_from_file(".", 0, 0)
+
+    assert df.schema == {
+        "response_key": polars.String,
+        "time": polars.Datetime("ms"),
+        "values": polars.Float32,
+    }
+    assert df["response_key"].to_list() == [
+        key for key in keys for _ in range(len(time_map))
+    ]
+    np.testing.assert_array_equal(df["time"].to_numpy(), np.tile(time_map, len(keys)))
+    np.testing.assert_array_equal(df["values"].to_numpy(), np.ravel(data))
+
+
 def test_summary_config_normalizes_list_of_keys():
     assert SummaryConfig("summary", "CASE", ["FOPR", "WOPR", "WOPR"]).keys == [
         "FOPR",
@@ -1,3 +1,4 @@
+import asyncio
 import os
 import uuid
 from pathlib import Path
@@ -8,7 +9,7 @@
 
 from ert.config import ErtConfig, ModelConfig
 from ert.ensemble_evaluator.snapshot import EnsembleSnapshot
-from ert.run_models import BaseRunModel
+from ert.run_models import BaseRunModel, base_run_model
 from ert.storage import Storage
 from ert.substitutions import Substitutions
 
@@ -299,3 +300,39 @@ def test_get_current_status(
     brm._iter_snapshot[0] = iter_snapshot
     brm.active_realizations = new_active_realizations
     assert dict(brm.get_current_status()) == expected_result
+
+
+async def test_that_the_evaluator_is_cancelled_when_run_path_creation_fails(
+    monkeypatch,
+):
+    evaluator_cancelled = False
+
+    class MockEvaluator:
+        def __init__(self, *args):
+            pass
+
+        async def run_and_get_successful_realizations(self):
+            nonlocal evaluator_cancelled
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                evaluator_cancelled = True
+                raise
+
+    async def run_monitor(*args):
+        return True
+
+    def create_run_paths(realization_ready):
+        raise ValueError("Could not create run paths")
+
+    monkeypatch.setattr(base_run_model, "EnsembleEvaluator", MockEvaluator)
+    BaseRunModel.validate_active_realizations_count = MagicMock()
+    brm = BaseRunModel(MagicMock(), None, None, None, [True])
+    brm._build_ensemble = MagicMock()
+    brm.run_monitor = run_monitor
+
+    with pytest.raises(ValueError, match="Could not create run paths"):
+        await brm.run_ensemble_evaluator_async(
+            [], MagicMock(), MagicMock(), create_run_paths
+        )
+    assert evaluator_cancelled
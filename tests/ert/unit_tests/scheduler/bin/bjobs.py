@@ -12,7 +12,9 @@
 
 class Job(BaseModel):
     job_id: str
+    job_index: str = "0"
     job_state: JobState
+    exit_code: str = "-"
 
 
 def get_parser() -> argparse.ArgumentParser:
@@ -26,8 +28,17 @@ def get_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def bjobs_formatter(jobstats: List[Job]) -> str:
-    return "".join([f"{job.job_id}^{job.job_state}^-\n" for job in jobstats])
+def bjobs_formatter(jobstats: List[Job], fields: List[str]) -> str:
+    values = {
+        "jobid": lambda job: job.job_id,
+        "jobindex": lambda job: job.job_index,
+        "stat": lambda job: job.job_state,
+        "exec_host": lambda job: "-",
+        "exit_code": lambda job: job.exit_code,
+    }
+    return "".join(
+        "^".join(values[field](job) for field in fields) + "\n" for job in jobstats
+    )
 
 
 def read(path: Path, default: Optional[str] = None) -> Optional[str]:
@@ -57,16 +68,20 @@ def main() -> None:
         elif pid is not None:
             state = "RUN"
 
+        # The tasks of array jobs have ids like jobid[index]
+        job_id, _, job_index = job.rstrip("]").partition("[")
         jobs_output.append(
             Job(
                 **{
-                    "job_id": job,
+                    "job_id": job_id,
+                    "job_index": job_index or "0",
                     "job_state": state,
+                    "exit_code": returncode or "-",
                 }
             )
         )
 
-    print(bjobs_formatter(jobs_output))
+    print(bjobs_formatter(jobs_output, args.o.replace("delimiter='^'", "").split()))
 
 
 if __name__ == "__main__":
@@ -9,6 +9,7 @@
 import random
 import subprocess
 from pathlib import Path
+from typing import List
 
 
 def get_parser() -> argparse.ArgumentParser:
@@ -20,28 +21,24 @@ def get_parser() -> argparse.ArgumentParser:
     parser.add_argument("--parsable", action="store_true")
     parser.add_argument("--output", type=str)
     parser.add_argument("--error", type=str)
+    parser.add_argument("--array", type=str)
     parser.add_argument("script", type=str)
     return parser
 
 
-def main() -> None:
-    args = get_parser().parse_args()
-
-    jobid = random.randint(1, 2**15)
-    jobdir = Path(os.getenv("PYTEST_TMP_PATH", "."))
-    (jobdir / "mock_jobs").mkdir(parents=True, exist_ok=True)
+def start_job(
+    jobdir: Path, jobid: str, args: argparse.Namespace, env: str = ""
+) -> None:
     (jobdir / "mock_jobs" / f"{jobid}.script").write_text(args.script, encoding="utf-8")
     (jobdir / "mock_jobs" / f"{jobid}.name").write_text(args.job_name, encoding="utf-8")
     env_file = jobdir / "mock_jobs" / f"{jobid}.env"
 
     if args.ntasks:
-        env_file.write_text(
+        env += (
             f"export SLURM_JOB_CPUS_PER_NODE={args.ntasks}\n"
-            f"export SLURM_CPUS_ON_NODE={args.ntasks}",
-            encoding="utf-8",
+            f"export SLURM_CPUS_ON_NODE={args.ntasks}\n"
         )
-    else:
-        env_file.touch()
+    env_file.write_text(env, encoding="utf-8")
 
     subprocess.Popen(
         [str(Path(__file__).parent / "runner"), f"{jobdir}/mock_jobs/{jobid}"],
@@ -50,6 +47,34 @@ def main() -> None:
         stderr=open(args.error, "w", encoding="utf-8"),  # noqa: SIM115
     )
 
+
+def array_indices(array: str) -> List[int]:
+    """The indices of an array like 0-2,5"""
+    indices = []
+    for part in array.split(","):
+        first, _, last = part.partition("-")
+        indices.extend(range(int(first), int(last or first) + 1))
+    return indices
+
+
+def main() -> None:
+    args = get_parser().parse_args()
+
+    jobid = random.randint(1, 2**15)
+    jobdir = Path(os.getenv("PYTEST_TMP_PATH", "."))
+    (jobdir / "mock_jobs").mkdir(parents=True, exist_ok=True)
+
+    if args.array:
+        for index in array_indices(args.array):
+            start_job(
+                jobdir,
+                f"{jobid}_{index}",
+                args,
+                f"export SLURM_ARRAY_TASK_ID={index}\n",
+            )
+    else:
+        start_job(jobdir, str(jobid), args)
+
     if args.parsable:
         print(jobid)
     else:
@@ -18,7 +18,7 @@ def get_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser()
     parser.add_argument("format")
     parser.add_argument("jobstr")
-    parser.add_argument("jobid", type=str, default="")
+    parser.add_argument("jobid", type=str, nargs="?", default="")
     return parser
 
 
@@ -52,7 +52,14 @@ def main() -> None:
             if returncode != "0":
                 state = "FAILED"
 
-        print(f"JobId={job} JobName={name}")
+        if "_" in job:
+            array_job_id, array_task_id = job.split("_")
+            print(
+                f"JobId={job} ArrayJobId={array_job_id} "
+                f"ArrayTaskId={array_task_id} JobName={name}"
+            )
+        else:
+            print(f"JobId={job} JobName={name}")
         print(f"   JobState={state}")
         if returncode:
             print(f"   ExitCode={returncode}:0")
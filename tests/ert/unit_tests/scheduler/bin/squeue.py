@@ -19,11 +19,10 @@ def get_parser() -> argparse.ArgumentParser:
     parser.add_argument("-o", "--format", type=str, default="%i %T")
     parser.add_argument("-h", "--noheader", action="store_true")
     parser.add_argument("--user", type=str, default=None)
-    parser.add_argument(
-        "--job",
-        type=str,
-    )
+    parser.add_argument("-j", "--jobs", type=str, default=None)
+    parser.add_argument("-t", "--states", type=str, default=None)
     parser.add_argument("-w", action="store_true")
+    parser.add_argument("-r", "--array", action="store_true")
     return parser
 
 
@@ -43,6 +42,8 @@ def main() -> None:
 
     for pidfile in glob.glob(f"{jobs_path}/*.pid"):
         job = pidfile.split("/")[-1].split(".")[0]
+        if args.jobs is not None and job not in args.jobs.split(","):
+            continue
         pid = read(Path(pidfile))
         returncode = read(jobs_path / f"{job}.returncode")
 
@@ -56,7 +57,7 @@ def main() -> None:
             if returncode != "0":
                 state = "FAILED"
 
-        if state in ["PENDING", "RUNNING"]:
+        if args.states == "all" or state in ["PENDING", "RUNNING"]:
             print(f"{job} {state}")
 
 
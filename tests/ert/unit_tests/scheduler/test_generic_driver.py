@@ -3,11 +3,18 @@
 import os
 import signal
 import sys
+import time
 from pathlib import Path
 
 import pytest
 
-from ert.scheduler.driver import SIGNAL_OFFSET, Driver
+from ert.scheduler.driver import (
+    SIGNAL_OFFSET,
+    AdaptivePollPeriod,
+    ArraySubmitter,
+    BatchedQuery,
+    Driver,
+)
 from ert.scheduler.local_driver import LocalDriver
 from ert.scheduler.lsf_driver import LsfDriver
 from ert.scheduler.openpbs_driver import OpenPBSDriver
@@ -52,6 +59,13 @@ def driver(request, pytestconfig, monkeypatch, tmp_path):
     return class_(queue_name=queue_name)
 
 
+@pytest.fixture(params=[LsfDriver, OpenPBSDriver, SlurmDriver])
+def array_driver(request, monkeypatch, tmp_path):
+    mock_bin(monkeypatch, tmp_path)
+    monkeypatch.setattr(ArraySubmitter, "COLLECT_PERIOD", 0.1)
+    return request.param(array_submit=True)
+
+
 @pytest.mark.integration_test
 async def test_submit(driver: Driver, tmp_path, job_name):
     os.chdir(tmp_path)
@@ -229,6 +243,58 @@ async def test_execute_with_retry_exits_on_filenotfounderror(driver: Driver, cap
     assert "/usr/bin/foo" in message
 
 
+async def test_execute_with_retry_records_metrics_per_command(driver: Driver):
+    await driver._execute_with_retry(["true"])
+    await driver._execute_with_retry(["/bin/true"])
+    await driver._execute_with_retry(["false"])
+
+    assert driver.metrics.commands["true"].calls == 2
+    assert driver.metrics.commands["true"].failures == 0
+    assert driver.metrics.commands["false"].calls == 1
+    assert driver.metrics.commands["false"].failures == 1
+    assert "true: 2 calls, 0 failed" in str(driver.metrics)
+
+
+async def test_that_concurrent_queries_are_batched():
+    queries = []
+
+    async def query(job_ids):
+        queries.append(job_ids)
+        return {job_id: f"state of {job_id}" for job_id in job_ids if job_id != "3"}
+
+    batched_query = BatchedQuery(query)
+    results = await asyncio.gather(
+        batched_query.get("1"),
+        batched_query.get("2"),
+        batched_query.get_many(["2", "3"]),
+    )
+
+    assert queries == [{"1", "2", "3"}]
+    assert results == ["state of 1", "state of 2", {"2": "state of 2"}]
+    assert await batched_query.get("3") is None
+    assert queries[-1] == {"3"}
+
+
+def test_that_poll_period_backs_off_until_a_job_changes_state():
+    period = AdaptivePollPeriod()
+    states = {"1": "PENDING", "2": "RUNNING"}
+    assert period.next_period(2.0, states, num_pending=1) == 2.0
+    assert period.next_period(2.0, states, num_pending=1) == 3.0
+    for _ in range(10):
+        backed_off = period.next_period(2.0, states, num_pending=1)
+    assert backed_off == 2.0 * AdaptivePollPeriod.MAX_FACTOR
+
+    assert period.next_period(2.0, {**states, "1": "RUNNING"}, num_pending=0) == 2.0
+
+
+def test_that_poll_period_backs_off_further_when_all_jobs_are_pending():
+    period = AdaptivePollPeriod()
+    states = {"1": "PENDING", "2": "PENDING"}
+    for _ in range(20):
+        backed_off = period.next_period(2.0, states, num_pending=2)
+    assert backed_off == 2.0 * AdaptivePollPeriod.PENDING_MAX_FACTOR
+
+
 @pytest.mark.integration_test
 async def test_poll_exits_on_filenotfounderror(driver: Driver, caplog):
     if isinstance(driver, LocalDriver):
@@ -246,3 +312,122 @@ async def test_poll_exits_on_filenotfounderror(driver: Driver, caplog):
     assert "retry" not in str(caplog.text)
     assert "No such file or directory" in str(caplog.text)
     assert "/usr/bin/foo" in str(caplog.text)
+
+
+SUBMIT_COMMANDS = {LsfDriver: "bsub", OpenPBSDriver: "qsub", SlurmDriver: "sbatch"}
+
+
+@pytest.mark.integration_test
+async def test_that_realizations_submitted_together_are_one_array_job(
+    array_driver: Driver, tmp_path, job_name
+):
+    os.chdir(tmp_path)
+    finished_returncodes = {}
+
+    async def finished(iens, returncode):
+        finished_returncodes[iens] = returncode
+
+    await asyncio.gather(
+        *(
+            array_driver.submit(
+                iens,
+                "sh",
+                "-c",
+                f"echo {iens} > {tmp_path}/test{iens}; exit {iens}",
+                name=f"{job_name}{iens}",
+                runpath=tmp_path,
+            )
+            for iens in range(3)
+        )
+    )
+    assert array_driver.metrics.commands[SUBMIT_COMMANDS[type(array_driver)]].calls == 1
+    await poll(array_driver, {0, 1, 2}, finished=finished)
+
+    assert finished_returncodes == {0: 0, 1: 1, 2: 2}
+    for iens in range(3):
+        assert (tmp_path / f"test{iens}").read_text(encoding="utf-8") == f"{iens}\n"
+
+    # Realizations are resubmitted on their own
+    await array_driver.submit(
+        1, "sh", "-c", f"echo again > {tmp_path}/test1", runpath=tmp_path
+    )
+    await poll(array_driver, {1})
+    assert (tmp_path / "test1").read_text(encoding="utf-8") == "again\n"
+
+
+@pytest.mark.integration_test
+async def test_that_one_task_of_an_array_job_can_be_killed(
+    array_driver: Driver, tmp_path, job_name
+):
+    os.chdir(tmp_path)
+    finished_returncodes = {}
+
+    async def started(iens):
+        if iens == 0:
+            await array_driver.kill(iens)
+
+    async def finished(iens, returncode):
+        finished_returncodes[iens] = returncode
+
+    await asyncio.gather(
+        array_driver.submit(
+            0, "sh", "-c", "sleep 60", name=f"{job_name}0", runpath=tmp_path
+        ),
+        array_driver.submit(
+            1, "sh", "-c", "sleep 1", name=f"{job_name}1", runpath=tmp_path
+        ),
+    )
+    submitted = time.monotonic()
+    await poll(array_driver, {0, 1}, started=started, finished=finished)
+
+    # The killed realization does not get to finish its sleep
+    assert time.monotonic() - submitted < 60
+    assert finished_returncodes[1] == 0
+
+
+@pytest.mark.integration_test
+@pytest.mark.parametrize("driver_class", [LsfDriver, OpenPBSDriver, SlurmDriver])
+async def test_that_array_jobs_are_split_at_max_array_size(
+    driver_class, monkeypatch, tmp_path, job_name
+):
+    mock_bin(monkeypatch, tmp_path)
+    monkeypatch.setattr(ArraySubmitter, "COLLECT_PERIOD", 0.1)
+    array_driver = driver_class(array_submit=True, max_array_size=2)
+    os.chdir(tmp_path)
+    finished_returncodes = {}
+
+    async def finished(iens, returncode):
+        finished_returncodes[iens] = returncode
+
+    # The realization numbers are larger than the array size, which works
+    # as array jobs are indexed by position
+    realizations = [3, 4, 5]
+    await asyncio.gather(
+        *(
+            array_driver.submit(
+                iens,
+                "sh",
+                "-c",
+                f"exit {iens}",
+                name=f"{job_name}{iens}",
+                runpath=tmp_path,
+            )
+            for iens in realizations
+        )
+    )
+    assert array_driver.metrics.commands[SUBMIT_COMMANDS[driver_class]].calls == 2
+    await poll(array_driver, set(realizations), finished=finished)
+    assert finished_returncodes == {iens: iens for iens in realizations}
+
+
+async def test_that_realizations_killed_before_their_array_job_is_submitted_are_left_out(
+    array_driver: Driver, tmp_path
+):
+    os.chdir(tmp_path)
+    submit = asyncio.create_task(array_driver.submit(0, "sh", "-c", "sleep 60"))
+    await asyncio.sleep(0)
+    submit.cancel()
+    await array_driver.kill(0)
+    await asyncio.sleep(ArraySubmitter.COLLECT_PERIOD * 2)
+
+    assert SUBMIT_COMMANDS[type(array_driver)] not in array_driver.metrics.commands
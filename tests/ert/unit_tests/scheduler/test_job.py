@@ -1,5 +1,7 @@
 import asyncio
+import hashlib
 import logging
+import os
 import shutil
 from functools import partial
 from pathlib import Path
@@ -20,6 +22,7 @@
     JobState,
     log_info_from_exit_file,
 )
+from ert.scheduler.scheduler import AdaptiveSubmitSleeper
 
 
 def create_scheduler():
@@ -29,6 +32,11 @@ def create_scheduler():
     sch.driver = AsyncMock()
     sch._manifest_queue = None
     sch._cancelled = False
+    sch.ingestion_executor = None
+    sch.checksum_executor = None
+    sch.ingestion_backlog = 0
+    sch.submit_sleep_state = None
+    sch.pending_jobs = 0
     return sch
 
 
@@ -135,9 +143,7 @@ async def load_result(**_):
     job.started.set()
 
     job_run_task = asyncio.create_task(
-        job.run(
-            asyncio.Semaphore(), asyncio.Lock(), asyncio.Lock(), max_submit=max_submit
-        )
+        job.run(asyncio.Semaphore(), max_submit=max_submit)
     )
 
     for attempt in range(max_submit):
@@ -178,9 +184,7 @@ async def test_num_cpu_is_propagated_to_driver(realization: Realization):
     realization.num_cpu = 8
     scheduler = create_scheduler()
     job = Job(scheduler, realization)
-    job_run_task = asyncio.create_task(
-        job.run(asyncio.Semaphore(), asyncio.Lock(), asyncio.Lock(), max_submit=1)
-    )
+    job_run_task = asyncio.create_task(job.run(asyncio.Semaphore(), max_submit=1))
     job.started.set()
     job.returncode.set_result(0)
     await job_run_task
@@ -201,9 +205,7 @@ async def test_realization_memory_is_propagated_to_driver(realization: Realizati
     realization.realization_memory = 8 * 1024**2
     scheduler = create_scheduler()
     job = Job(scheduler, realization)
-    job_run_task = asyncio.create_task(
-        job.run(asyncio.Semaphore(), asyncio.Lock(), asyncio.Lock(), max_submit=1)
-    )
+    job_run_task = asyncio.create_task(job.run(asyncio.Semaphore(), max_submit=1))
     job.started.set()
     job.returncode.set_result(0)
     await job_run_task
@@ -218,6 +220,27 @@ async def test_realization_memory_is_propagated_to_driver(realization: Realizati
     )
 
 
+@pytest.mark.usefixtures("use_tmpdir")
+@pytest.mark.asyncio
+async def test_that_many_pending_jobs_decrease_the_adaptive_submit_rate(
+    realization: Realization,
+):
+    scheduler = create_scheduler()
+    scheduler.submit_sleep_state = AdaptiveSubmitSleeper()
+    scheduler.pending_jobs = AdaptiveSubmitSleeper.MAX_PENDING + 1
+    job = Job(scheduler, realization)
+    job_run_task = asyncio.create_task(job.run(asyncio.Semaphore(), max_submit=1))
+    job.started.set()
+    job.returncode.set_result(0)
+    await job_run_task
+
+    assert scheduler.submit_sleep_state.submit_rate == (
+        AdaptiveSubmitSleeper.INITIAL_RATE * AdaptiveSubmitSleeper.RATE_DECREASE
+    )
+    # The job was counted while it was pending
+    assert scheduler.pending_jobs == AdaptiveSubmitSleeper.MAX_PENDING + 1
+
+
 @pytest.mark.asyncio
 async def test_when_waiting_for_disk_sync_times_out_an_error_is_logged(
     realization: Realization, monkeypatch
@@ -239,9 +262,7 @@ async def test_when_waiting_for_disk_sync_times_out_an_error_is_logged(
     job.started.set()
 
     with captured_logs(log_msgs, logging.ERROR):
-        job_run_task = asyncio.create_task(
-            job.run(asyncio.Semaphore(), asyncio.Lock(), asyncio.Lock(), max_submit=1)
-        )
+        job_run_task = asyncio.create_task(job.run(asyncio.Semaphore(), max_submit=1))
         job.started.set()
         job.returncode.set_result(0)
         await job_run_task
@@ -270,9 +291,7 @@ async def test_when_files_in_manifest_are_not_created_an_error_is_logged(
     job.started.set()
 
     with captured_logs(log_msgs, logging.ERROR):
-        job_run_task = asyncio.create_task(
-            job.run(asyncio.Semaphore(), asyncio.Lock(), asyncio.Lock(), max_submit=1)
-        )
+        job_run_task = asyncio.create_task(job.run(asyncio.Semaphore(), max_submit=1))
         job.started.set()
         job.returncode.set_result(0)
         await job_run_task
@@ -304,9 +323,7 @@ async def test_when_checksums_do_not_match_a_warning_is_logged(
     job.started.set()
 
     with captured_logs(log_msgs, logging.WARNING):
-        job_run_task = asyncio.create_task(
-            job.run(asyncio.Semaphore(), asyncio.Lock(), asyncio.Lock(), max_submit=1)
-        )
+        job_run_task = asyncio.create_task(job.run(asyncio.Semaphore(), max_submit=1))
         job.started.set()
         job.returncode.set_result(0)
         await job_run_task
@@ -314,6 +331,42 @@ async def test_when_checksums_do_not_match_a_warning_is_logged(
     assert f"File {file_path} checksum verification failed." in log_msgs
 
 
+@pytest.mark.usefixtures("use_tmpdir")
+@pytest.mark.asyncio
+async def test_that_checksums_of_files_are_verified_in_chunks_when_they_appear(
+    realization: Realization, caplog
+):
+    caplog.set_level(logging.DEBUG)
+    scheduler = create_scheduler()
+    scheduler._manifest_queue = asyncio.Queue()
+    contents = os.urandom(3 * 1024**2 + 1)
+    paths = [Path("large_file"), Path("late_file")]
+    scheduler.checksum = {
+        "test_runpath": {
+            str(path): {
+                "path": str(path),
+                "md5sum": hashlib.md5(contents).hexdigest(),
+            }
+            for path in paths
+        }
+    }
+    paths[0].write_bytes(contents)
+
+    async def write_late_file():
+        await asyncio.sleep(0.3)
+        paths[1].write_bytes(contents)
+
+    job = Job(scheduler, realization)
+    job.started.set()
+    job_run_task = asyncio.create_task(job.run(asyncio.Semaphore(), max_submit=1))
+    job.returncode.set_result(0)
+    await asyncio.gather(job_run_task, write_late_file())
+
+    for path in paths:
+        assert f"File {path} checksum successful." in caplog.messages
+    assert "Disk synchronization failed" not in caplog.text
+
+
 @pytest.mark.usefixtures("use_tmpdir")
 @pytest.mark.asyncio
 async def test_when_no_checksum_info_is_received_a_warning_is_logged(
@@ -332,9 +385,7 @@ async def test_when_no_checksum_info_is_received_a_warning_is_logged(
     mocker.patch("asyncio.sleep", return_value=None)
 
     with captured_logs(log_msgs, logging.WARNING):
-        job_run_task = asyncio.create_task(
-            job.run(asyncio.Semaphore(), asyncio.Lock(), asyncio.Lock(), max_submit=1)
-        )
+        job_run_task = asyncio.create_task(job.run(asyncio.Semaphore(), max_submit=1))
         job.started.set()
         job.returncode.set_result(0)
         await job_run_task
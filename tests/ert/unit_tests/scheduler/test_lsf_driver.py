@@ -94,6 +94,34 @@ async def test_exit_codes(tmp_path_factory, bjobs_script, bhist_script, exit_cod
     assert await driver._get_exit_code("0") == exit_code
 
 
+async def test_exit_codes_of_several_jobs_are_fetched_with_one_bjobs_call(tmp_path):
+    mocked_bjobs = tmp_path / "bjobs"
+    mocked_bjobs.write_text(
+        dedent(
+            f"""\
+            #!/bin/sh
+            echo "$@" >> {tmp_path}/bjobs_calls
+            echo "1^129"
+            echo "2^-"
+            """
+        )
+    )
+    mocked_bjobs.chmod(mocked_bjobs.stat().st_mode | stat.S_IEXEC)
+    driver = LsfDriver(bjobs_cmd=mocked_bjobs)
+
+    exit_codes = await asyncio.gather(
+        driver._get_exit_code("1"),
+        driver._get_exit_code("2"),
+        driver._get_exit_code("3"),
+    )
+
+    assert exit_codes == [129, LSF_FAILED_JOB, LSF_FAILED_JOB]
+    assert (tmp_path / "bjobs_calls").read_text(encoding="utf-8").splitlines() == [
+        "-o jobid exit_code delimiter='^' -noheader 1 2 3"
+    ]
+    assert driver.metrics.commands["bjobs"].calls == 1
+
+
 @given(
     jobstate_sequence=st.lists(st.sampled_from(JobState.__args__)),
     exit_code=st.integers(min_value=1, max_value=254),
@@ -0,0 +1,232 @@
+import asyncio
+import signal
+from contextlib import asynccontextmanager, suppress
+
+import pytest
+
+from ert.scheduler.driver import SIGNAL_OFFSET, ArraySubmitter
+from ert.scheduler.event import FinishedEvent, StartedEvent
+from ert.scheduler.local_driver import LocalDriver
+from ert.scheduler.lsf_driver import LsfDriver
+from ert.scheduler.packed_driver import PackedDriver
+
+from .conftest import mock_bin
+
+
+@pytest.fixture(autouse=True)
+def short_collect_period(monkeypatch):
+    monkeypatch.setattr(ArraySubmitter, "COLLECT_PERIOD", 0.1)
+    monkeypatch.setattr(PackedDriver, "RUNPATH_POLL_PERIOD", 0.1)
+
+
+async def submit_realizations(driver, tmp_path, commands):
+    runpaths = [tmp_path / f"realization-{iens}" for iens in range(len(commands))]
+    for runpath in runpaths:
+        runpath.mkdir()
+    await asyncio.gather(
+        *(
+            driver.submit(
+                iens, "bash", "-c", command, name=f"real{iens}", runpath=runpath
+            )
+            for iens, (command, runpath) in enumerate(
+                zip(commands, runpaths, strict=True)
+            )
+        )
+    )
+    return runpaths
+
+
+@asynccontextmanager
+async def polling(driver):
+    poll_task = asyncio.create_task(driver.poll())
+    try:
+        yield
+        # Realizations are reported finished before their pack has exited
+        await driver.finish()
+    finally:
+        poll_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await poll_task
+
+
+async def events_until_finished(driver, num_realizations):
+    events = []
+    while (
+        len([event for event in events if isinstance(event, FinishedEvent)])
+        < num_realizations
+    ):
+        events.append(await driver.event_queue.get())
+    return events
+
+
+@pytest.mark.parametrize("parallel", [True, False])
+@pytest.mark.timeout(30)
+async def test_that_realizations_in_a_pack_finish_with_their_own_returncodes(
+    tmp_path, parallel
+):
+    inner_driver = LocalDriver()
+    driver = PackedDriver(inner_driver, pack_size=3, parallel=parallel)
+    runpaths = await submit_realizations(
+        driver, tmp_path, ["touch here", "exit 3", "touch here"]
+    )
+    assert len(inner_driver._tasks) == 1
+
+    async with polling(driver):
+        events = await events_until_finished(driver, 3)
+    assert sorted(
+        (event.iens for event in events if isinstance(event, StartedEvent))
+    ) == [0, 1, 2]
+    assert sorted(
+        (event.iens, event.returncode)
+        for event in events
+        if isinstance(event, FinishedEvent)
+    ) == [(0, 0), (1, 3), (2, 0)]
+    assert (runpaths[0] / "here").exists()
+    assert (runpaths[2] / "here").exists()
+
+
+@pytest.mark.timeout(30)
+async def test_that_realizations_are_split_into_packs_of_at_most_pack_size(
+    tmp_path,
+):
+    inner_driver = LocalDriver()
+    driver = PackedDriver(inner_driver, pack_size=2)
+    await submit_realizations(driver, tmp_path, ["true"] * 5)
+    assert len(inner_driver._tasks) == 3
+
+    async with polling(driver):
+        events = await events_until_finished(driver, 5)
+    assert sorted(
+        event.iens for event in events if isinstance(event, FinishedEvent)
+    ) == list(range(5))
+
+
+@pytest.mark.timeout(30)
+async def test_that_realizations_in_a_sequential_pack_start_when_the_previous_finishes(
+    tmp_path,
+):
+    driver = PackedDriver(LocalDriver(), pack_size=2, parallel=False)
+    await submit_realizations(driver, tmp_path, ["sleep 0.5", "sleep 0.5"])
+    async with polling(driver):
+        events = await events_until_finished(driver, 2)
+    assert [(type(event), event.iens) for event in events] == [
+        (StartedEvent, 0),
+        (FinishedEvent, 0),
+        (StartedEvent, 1),
+        (FinishedEvent, 1),
+    ]
+
+
+@pytest.mark.timeout(30)
+async def test_that_a_realization_finishes_before_the_rest_of_its_pack(tmp_path):
+    driver = PackedDriver(LocalDriver(), pack_size=2)
+    await submit_realizations(driver, tmp_path, ["true", "sleep 60"])
+    async with polling(driver):
+        events = []
+        while FinishedEvent(iens=0, returncode=0) not in events:
+            events.append(await driver.event_queue.get())
+        assert not [
+            event
+            for event in events
+            if isinstance(event, FinishedEvent) and event.iens == 1
+        ]
+        await driver.kill(1)
+        await events_until_finished(driver, 1)
+
+
+@pytest.mark.timeout(30)
+async def test_that_a_killed_realization_does_not_stop_the_rest_of_its_pack(
+    tmp_path,
+):
+    driver = PackedDriver(LocalDriver(), pack_size=2)
+    await submit_realizations(driver, tmp_path, ["sleep 5", "sleep 60"])
+    async with polling(driver):
+        assert sorted([(await driver.event_queue.get()).iens for _ in range(2)]) == [
+            0,
+            1,
+        ]
+        await driver.kill(1)
+        events = await events_until_finished(driver, 2)
+    assert FinishedEvent(iens=0, returncode=0) in events
+    assert FinishedEvent(iens=1, returncode=signal.SIGTERM + SIGNAL_OFFSET) in events
+
+
+@pytest.mark.timeout(30)
+async def test_that_realizations_of_a_failed_pack_get_its_error_message(
+    tmp_path, monkeypatch
+):
+    inner_driver = LocalDriver()
+    monkeypatch.setattr(inner_driver, "error_message", lambda iens: "Node failure")
+    driver = PackedDriver(inner_driver, pack_size=2)
+    await submit_realizations(driver, tmp_path, ["sleep 60", "sleep 60"])
+    async with polling(driver):
+        await driver.event_queue.get()
+        (pack_id,) = driver._packs
+        await inner_driver.kill(pack_id)
+        await events_until_finished(driver, 2)
+    assert driver.error_message(0) == "Node failure"
+    assert driver.error_message(1) == "Node failure"
+
+
+@pytest.mark.timeout(30)
+async def test_that_the_pack_is_killed_with_its_last_realization(tmp_path):
+    inner_driver = LocalDriver()
+    driver = PackedDriver(inner_driver, pack_size=2)
+    await submit_realizations(driver, tmp_path, ["sleep 60", "sleep 60"])
+    async with polling(driver):
+        assert sorted([(await driver.event_queue.get()).iens for _ in range(2)]) == [
+            0,
+            1,
+        ]
+        await driver.kill(0)
+        await driver.kill(1)
+        assert not inner_driver._tasks
+        events = await events_until_finished(driver, 2)
+    assert {event.iens for event in events} == {0, 1}
+
+
+async def test_that_a_realization_is_withdrawn_when_killed_before_it_is_packed(
+    tmp_path,
+):
+    inner_driver = LocalDriver()
+    driver = PackedDriver(inner_driver, pack_size=2)
+    (tmp_path / "realization-0").mkdir()
+    submit = asyncio.create_task(
+        driver.submit(0, "bash", "-c", "true", runpath=tmp_path / "realization-0")
+    )
+    await asyncio.sleep(0)
+    await driver.kill(0)
+    with suppress(asyncio.CancelledError):
+        await submit
+    assert submit.cancelled()
+    await asyncio.sleep(0.2)
+    assert not inner_driver._tasks
+
+
+@pytest.mark.usefixtures("use_tmpdir")
+@pytest.mark.timeout(60)
+async def test_that_a_pack_is_submitted_with_one_bsub_call(monkeypatch, tmp_path):
+    mock_bin(monkeypatch, tmp_path)
+    inner_driver = LsfDriver()
+    driver = PackedDriver(inner_driver, pack_size=3)
+    await submit_realizations(driver, tmp_path, ["exit 0", "exit 1", "exit 2"])
+    assert inner_driver.metrics.commands["bsub"].calls == 1
+
+    pack_finished = asyncio.Event()
+    get_event = inner_driver.event_queue.get
+
+    async def recording_get():
+        event = await get_event()
+        if isinstance(event, FinishedEvent):
+            pack_finished.set()
+        return event
+
+    monkeypatch.setattr(inner_driver.event_queue, "get", recording_get)
+    async with polling(driver):
+        events = await events_until_finished(driver, 3)
+        await pack_finished.wait()
+    assert sorted(
+        (event.iens, event.returncode)
+        for event in events
+        if isinstance(event, FinishedEvent)
+    ) == [(0, 0), (1, 1), (2, 2)]
@@ -3,6 +3,8 @@
 import json
 import random
 import shutil
+import stat
+import threading
 import time
 from functools import partial
 from pathlib import Path
@@ -10,15 +12,33 @@
 
 import pytest
 
-from _ert.events import Id, RealizationFailed, RealizationTimeout
+from _ert.events import (
+    Id,
+    RealizationFailed,
+    RealizationPending,
+    RealizationSuccess,
+    RealizationTimeout,
+)
+from ert import callbacks
 from ert.config import QueueConfig
 from ert.constant_filenames import CERT_FILE
 from ert.ensemble_evaluator import Realization
 from ert.load_status import LoadResult, LoadStatus
 from ert.run_arg import RunArg
-from ert.scheduler import LsfDriver, OpenPBSDriver, create_driver, job, scheduler
+from ert.scheduler import (
+    LocalDriver,
+    LsfDriver,
+    OpenPBSDriver,
+    PackedDriver,
+    create_driver,
+    job,
+    scheduler,
+)
+from ert.scheduler.driver import FailedSubmit
 from ert.scheduler.job import JobState
 
+from .conftest import mock_bin
+
 
 def create_jobs_json(realization: Realization) -> None:
     jobs = {
@@ -167,6 +187,81 @@ async def test_add_dispatch_information_to_jobs_file(
         assert cert_file_path.read_text(encoding="utf-8") == test_ee_cert
 
 
+async def test_that_jobs_are_only_submitted_when_their_run_path_is_ready(
+    storage, tmp_path: Path, mock_driver
+):
+    ensemble = storage.create_experiment().create_ensemble(name="foo", ensemble_size=3)
+    realizations = [
+        create_stub_realization(ensemble, tmp_path, iens) for iens in range(3)
+    ]
+    submitted = []
+    second_submitted = asyncio.Event()
+
+    async def init(iens, *args, **kwargs):
+        submitted.append(iens)
+        if iens == 2:
+            second_submitted.set()
+
+    sch = scheduler.Scheduler(
+        mock_driver(init=init), realizations, ens_id="ens_id", max_running=0
+    )
+    ready_realizations = asyncio.Queue()
+    scheduler_task = asyncio.create_task(
+        sch.execute(ready_realizations=ready_realizations)
+    )
+
+    create_jobs_json(realizations[2])
+    await ready_realizations.put(2)
+    await asyncio.wait_for(second_submitted.wait(), timeout=5)
+    assert submitted == [2]
+
+    create_jobs_json(realizations[0])
+    await ready_realizations.put(0)
+    await ready_realizations.put(None)
+    assert await scheduler_task == Id.ENSEMBLE_SUCCEEDED
+
+    assert submitted == [2, 0]
+    assert sch._job_tasks[1].cancelled()
+    failures = []
+    while not sch._events.empty():
+        event = await sch._events.get()
+        if type(event) is RealizationFailed:
+            failures.append(event.real)
+    assert failures == ["1"]
+    for iens in (0, 2):
+        jobs_json = Path(realizations[iens].run_arg.runpath) / "jobs.json"
+        assert json.loads(jobs_json.read_text(encoding="utf-8"))["ens_id"] == "ens_id"
+
+
+async def test_that_jobs_json_of_ready_realizations_is_updated_off_the_event_loop(
+    storage, tmp_path: Path, mock_driver
+):
+    ensemble = storage.create_experiment().create_ensemble(name="foo", ensemble_size=2)
+    realizations = [
+        create_stub_realization(ensemble, tmp_path, iens) for iens in range(2)
+    ]
+    sch = scheduler.Scheduler(mock_driver(), realizations, ens_id="ens_id")
+    update_jobs_json = sch._update_jobs_json
+    update_threads = []
+
+    def recording_update_jobs_json(iens, runpath):
+        update_threads.append(threading.get_ident())
+        update_jobs_json(iens, runpath)
+
+    sch._update_jobs_json = recording_update_jobs_json
+    ready_realizations = asyncio.Queue()
+    for realization in realizations:
+        create_jobs_json(realization)
+        await ready_realizations.put(realization.iens)
+    await ready_realizations.put(None)
+
+    assert await sch.execute(ready_realizations=ready_realizations) == (
+        Id.ENSEMBLE_SUCCEEDED
+    )
+    assert len(update_threads) == 2
+    assert threading.get_ident() not in update_threads
+
+
 @pytest.mark.parametrize("max_submit", [1, 2, 3])
 async def test_that_max_submit_was_reached(realization, max_submit, mock_driver):
     retries = 0
@@ -574,6 +669,246 @@ async def wait():
     assert min(deltas) >= submit_sleep * 0.8
 
 
+def test_that_adaptive_submit_rate_increases_additively_and_decreases_multiplicatively():
+    sleeper = scheduler.AdaptiveSubmitSleeper()
+    assert sleeper.submit_rate == 1.0
+
+    started = time.time() - 1
+    sleeper.record_submit(started, 0.1)
+    sleeper.record_submit(started, 0.1)
+    assert sleeper.submit_rate == 2.0
+
+    sleeper.record_submit(started, sleeper.SLOW_SUBMIT + 1)
+    assert sleeper.submit_rate == 1.0
+
+    # Submits started before the last decrease do not decrease the rate again
+    sleeper.record_submit(started, 0.1, failed=True)
+    assert sleeper.submit_rate == 1.0
+
+    sleeper.record_submit(time.time(), 0.1, failed=True)
+    assert sleeper.submit_rate == 0.5
+
+    for _ in range(10):
+        sleeper.record_submit(time.time(), 0.1, failed=True)
+    assert sleeper.submit_rate == sleeper.MIN_RATE
+
+
+def test_that_submit_sleep_bounds_the_adaptive_submit_rate():
+    sleeper = scheduler.AdaptiveSubmitSleeper(submit_sleep=2.0)
+    assert sleeper.submit_rate == 0.5
+    sleeper.record_submit(time.time(), 0.1)
+    assert sleeper.submit_rate == 0.5
+
+
+def test_that_many_pending_jobs_decrease_the_adaptive_submit_rate():
+    sleeper = scheduler.AdaptiveSubmitSleeper()
+    sleeper.record_submit(time.time(), 0.1, pending=sleeper.MAX_PENDING)
+    assert sleeper.submit_rate == 1.5
+    sleeper.record_submit(time.time(), 0.1, pending=sleeper.MAX_PENDING + 1)
+    assert sleeper.submit_rate == 0.75
+
+
+async def test_that_jobs_pending_in_the_queue_decrease_the_adaptive_submit_rate(
+    storage, tmp_path, mock_driver, monkeypatch
+):
+    monkeypatch.setattr(scheduler.AdaptiveSubmitSleeper, "INITIAL_RATE", 10.0)
+    monkeypatch.setattr(scheduler.AdaptiveSubmitSleeper, "MAX_PENDING", 1)
+    all_submitted = asyncio.Event()
+    submitted = set()
+
+    async def pending_until_all_are_submitted(iens, *args, **kwargs):
+        submitted.add(iens)
+        if len(submitted) == 3:
+            all_submitted.set()
+        await all_submitted.wait()
+
+    ensemble = storage.create_experiment().create_ensemble(name="foo", ensemble_size=3)
+    realizations = [
+        create_stub_realization(ensemble, tmp_path, iens) for iens in range(3)
+    ]
+    sch = scheduler.Scheduler(
+        mock_driver(init=pending_until_all_are_submitted),
+        realizations,
+        max_running=3,
+        adaptive_submit=True,
+    )
+    await sch.execute()
+    # Only the last submit leaves more than one job pending
+    assert sch.submit_sleep_state.submit_rate == 5.5
+
+
+@pytest.mark.parametrize(
+    "bsub_script, submit_fails",
+    [
+        pytest.param('sleep 0.5\nexec "$MOCK_BSUB" "$@"', False, id="delayed"),
+        pytest.param("echo 'bsub is not responding' >&2\nexit 1", True, id="failing"),
+    ],
+)
+@pytest.mark.timeout(60)
+async def test_that_a_slow_or_failing_bsub_decreases_the_adaptive_submit_rate(
+    storage, tmp_path, monkeypatch, bsub_script, submit_fails
+):
+    mock_bin(monkeypatch, tmp_path)
+    monkeypatch.setenv("MOCK_BSUB", shutil.which("bsub"))
+    bsub_path = tmp_path / "bsub"
+    bsub_path.write_text(f"#!/bin/sh\n{bsub_script}\n")
+    bsub_path.chmod(bsub_path.stat().st_mode | stat.S_IEXEC)
+    monkeypatch.setattr(scheduler.AdaptiveSubmitSleeper, "INITIAL_RATE", 10.0)
+    monkeypatch.setattr(scheduler.AdaptiveSubmitSleeper, "SLOW_SUBMIT", 0.2)
+
+    ensemble = storage.create_experiment().create_ensemble(name="foo", ensemble_size=1)
+    realization = create_stub_realization(ensemble, tmp_path, 0)
+    realization.job_script = "true"
+    Path(realization.run_arg.runpath).mkdir()
+    sch = scheduler.Scheduler(
+        LsfDriver(bsub_cmd=str(bsub_path)), [realization], adaptive_submit=True
+    )
+    assert await sch.execute() == Id.ENSEMBLE_SUCCEEDED
+    assert sch.submit_sleep_state.submit_rate == 5.0
+    # The mock bsub keeps the jobs it has been given in mock_jobs
+    assert (tmp_path / "mock_jobs").exists() != submit_fails
+
+
+@pytest.mark.parametrize("adaptive_submit", [True, False])
+@pytest.mark.parametrize(
+    "driver",
+    [
+        pytest.param(lambda: LsfDriver(array_submit=True), id="array"),
+        pytest.param(lambda: PackedDriver(LocalDriver(), pack_size=2), id="pack"),
+    ],
+)
+async def test_that_submits_are_not_spaced_out_when_the_driver_gathers_submits(
+    driver, adaptive_submit
+):
+    sch = scheduler.Scheduler(
+        driver(),
+        submit_sleep=2.0,
+        adaptive_submit=adaptive_submit,
+    )
+    assert sch.submit_sleep_state is None
+
+
+async def test_that_adaptive_submit_rate_is_sent_with_pending_events(
+    storage, tmp_path, mock_driver, monkeypatch
+):
+    monkeypatch.setattr(scheduler.AdaptiveSubmitSleeper, "INITIAL_RATE", 10.0)
+    driver = mock_driver()
+    submit = driver.submit
+
+    async def fail_first_submit(iens, *args, **kwargs):
+        if iens == 0:
+            raise FailedSubmit("bsub is not responding")
+        await submit(iens, *args, **kwargs)
+
+    driver.submit = fail_first_submit
+
+    ensemble = storage.create_experiment().create_ensemble(name="foo", ensemble_size=5)
+    realizations = [
+        create_stub_realization(ensemble, tmp_path, iens) for iens in range(5)
+    ]
+    sch = scheduler.Scheduler(driver, realizations, adaptive_submit=True)
+    await sch.execute()
+
+    submit_rates = []
+    while not sch._events.empty():
+        event = await sch._events.get()
+        if type(event) is RealizationPending:
+            submit_rates.append(event.submit_rate)
+    assert sorted(submit_rates) == [5.5, 6.0, 6.5, 7.0]
+    assert sch.submit_sleep_state.submit_rate == 7.0
+
+
+async def test_that_results_of_realizations_are_loaded_concurrently(
+    storage, tmp_path, mock_driver, monkeypatch
+):
+    ensemble_size = 3
+    # Only passes if all realizations are loaded at the same time, and
+    # without blocking the event loop
+    barrier = threading.Barrier(ensemble_size, timeout=10)
+
+    def load_results(*args):
+        barrier.wait()
+        return LoadResult(LoadStatus.LOAD_SUCCESSFUL, "")
+
+    monkeypatch.setattr(callbacks, "_forward_model_ok", load_results)
+    ensemble = storage.create_experiment().create_ensemble(
+        name="foo", ensemble_size=ensemble_size
+    )
+    realizations = [
+        create_stub_realization(ensemble, tmp_path, iens)
+        for iens in range(ensemble_size)
+    ]
+    sch = scheduler.Scheduler(mock_driver(), realizations, max_running=0)
+    assert await sch.execute() == Id.ENSEMBLE_SUCCEEDED
+
+    ingestion_backlogs = []
+    while not sch._events.empty():
+        event = await sch._events.get()
+        if type(event) is RealizationSuccess:
+            ingestion_backlogs.append(event.ingestion_backlog)
+    assert sorted(ingestion_backlogs) == [0, 1, 2]
+    assert sch.ingestion_backlog == 0
+
+
+@pytest.mark.timeout(15)
+async def test_that_results_being_loaded_when_cancelled_are_written_before_execute_returns(
+    storage, tmp_path, mock_driver, monkeypatch
+):
+    loading = threading.Event()
+    loaded = threading.Event()
+
+    def load_results(*args):
+        loading.set()
+        time.sleep(0.5)
+        loaded.set()
+        return LoadResult(LoadStatus.LOAD_SUCCESSFUL, "")
+
+    monkeypatch.setattr(callbacks, "_forward_model_ok", load_results)
+    ensemble = storage.create_experiment().create_ensemble(name="foo", ensemble_size=1)
+    sch = scheduler.Scheduler(
+        mock_driver(), [create_stub_realization(ensemble, tmp_path, 0)]
+    )
+    scheduler_task = asyncio.create_task(sch.execute())
+    assert await asyncio.to_thread(loading.wait, 10)
+
+    await sch.cancel_all_jobs()
+    await scheduler_task
+    assert loaded.is_set()
+
+
+async def test_that_results_are_loaded_by_at_most_ingestion_workers_threads(
+    storage, tmp_path, mock_driver, monkeypatch
+):
+    ensemble_size = 4
+    lock = threading.Lock()
+    loading = 0
+    max_loading = 0
+
+    def load_results(*args):
+        nonlocal loading, max_loading
+        with lock:
+            loading += 1
+            max_loading = max(max_loading, loading)
+        time.sleep(0.1)
+        with lock:
+            loading -= 1
+        return LoadResult(LoadStatus.LOAD_SUCCESSFUL, "")
+
+    monkeypatch.setattr(callbacks, "_forward_model_ok", load_results)
+    ensemble = storage.create_experiment().create_ensemble(
+        name="foo", ensemble_size=ensemble_size
+    )
+    realizations = [
+        create_stub_realization(ensemble, tmp_path, iens)
+        for iens in range(ensemble_size)
+    ]
+    sch = scheduler.Scheduler(
+        mock_driver(), realizations, max_running=0, ingestion_workers=2
+    )
+    assert await sch.execute() == Id.ENSEMBLE_SUCCEEDED
+    assert max_loading == 2
+
+
 async def mock_failure(message, *args, **kwargs):
     raise RuntimeError(message)
 
@@ -7,13 +7,19 @@
 import sys
 from contextlib import ExitStack as does_not_raise
 from pathlib import Path
+from textwrap import dedent
 
 import pytest
 from hypothesis import given
 from hypothesis import strategies as st
 
 from ert.scheduler import SlurmDriver
-from ert.scheduler.slurm_driver import _seconds_to_slurm_time_format
+from ert.scheduler.slurm_driver import (
+    JobStatus,
+    SqueueInfo,
+    _parse_squeue_output,
+    _seconds_to_slurm_time_format,
+)
 from tests.ert.utils import poll
 
 from .conftest import mock_bin
@@ -63,6 +69,83 @@ async def test_exit_codes(tmp_path_factory, sbatch_script, scontrol_script, exit
     assert await driver._get_exit_code("0") == exit_code
 
 
+async def test_that_jobs_missing_from_squeue_are_looked_up_with_one_squeue_call(
+    tmp_path,
+):
+    mocked_squeue = tmp_path / "squeue"
+    mocked_squeue.write_text(
+        dedent(
+            f"""\
+            #!/bin/sh
+            echo "$@" >> {tmp_path}/squeue_calls
+            echo "1 COMPLETED"
+            echo "2 TIMEOUT"
+            echo "3 SUSPENDED"
+            echo "4 TIMEOUT"
+            """
+        )
+    )
+    mocked_squeue.chmod(mocked_squeue.stat().st_mode | stat.S_IEXEC)
+    driver = SlurmDriver(squeue_cmd=mocked_squeue)
+
+    infos = await driver._poll_missing_jobs({"1", "2", "3"})
+
+    # Job 4 is another user's job, and job 3 has no meaning for the driver
+    assert infos == {
+        "1": SqueueInfo(JobStatus.COMPLETED),
+        "2": SqueueInfo(JobStatus.FAILED),
+    }
+    assert (tmp_path / "squeue_calls").read_text(encoding="utf-8").splitlines() == [
+        "-h --format=%i %T --states=all --jobs=1,2,3"
+    ]
+
+
+async def test_that_exit_codes_of_jobs_failing_together_are_fetched_with_one_scontrol_call(
+    tmp_path,
+):
+    mocked_scontrol = tmp_path / "scontrol"
+    mocked_scontrol.write_text(
+        dedent(
+            f"""\
+            #!/bin/sh
+            echo "$@" >> {tmp_path}/scontrol_calls
+            echo "JobId=1 JobName=a"
+            echo "   JobState=FAILED ExitCode=1:0"
+            echo ""
+            echo "JobId=7 ArrayJobId=2 ArrayTaskId=0 JobName=b"
+            echo "   JobState=TIMEOUT ExitCode=0:15"
+            echo ""
+            echo "JobId=3 JobName=c"
+            echo "   JobState=OUT_OF_MEMORY ExitCode=125:0"
+            echo ""
+            echo "JobId=4 JobName=d"
+            echo "   JobState=RUNNING"
+            echo ""
+            """
+        )
+    )
+    mocked_scontrol.chmod(mocked_scontrol.stat().st_mode | stat.S_IEXEC)
+    driver = SlurmDriver(scontrol_cmd=mocked_scontrol)
+
+    exit_codes = await asyncio.gather(
+        driver._get_exit_code("1"),
+        driver._get_exit_code("2_0"),
+        driver._get_exit_code("3"),
+    )
+
+    assert exit_codes == [1, 0, 125]
+    assert (tmp_path / "scontrol_calls").read_text(encoding="utf-8").splitlines() == [
+        "show job"
+    ]
+
+
+def test_that_unknown_job_states_are_skipped_in_squeue_output():
+    assert list(_parse_squeue_output("1 RUNNING\n2 SUSPENDED\n3 OUT_OF_MEMORY\n")) == [
+        ("1", SqueueInfo(JobStatus.RUNNING)),
+        ("3", SqueueInfo(JobStatus.FAILED)),
+    ]
+
+
 @pytest.mark.usefixtures("capturing_sbatch")
 async def test_submit_sets_out():
     driver = SlurmDriver()
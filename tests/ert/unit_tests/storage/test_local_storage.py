@@ -2,6 +2,7 @@
 import os
 import shutil
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -12,8 +13,10 @@
 import hypothesis.strategies as st
 import numpy as np
 import polars
+import pyarrow.parquet as pq
 import pytest
 import xarray as xr
+import xtgeo
 from hypothesis import assume, given, note, settings
 from hypothesis.extra.numpy import arrays
 from hypothesis.stateful import Bundle, RuleBasedStateMachine, initialize, rule
@@ -34,7 +37,13 @@
 from ert.config.gen_kw_config import TransformFunctionDefinition
 from ert.config.general_observation import GenObservation
 from ert.config.observation_vector import ObsVector
-from ert.storage import ErtStorageException, LocalEnsemble, open_storage
+from ert.field_utils import Shape
+from ert.storage import (
+    ErtStorageException,
+    LocalEnsemble,
+    ParameterLayout,
+    open_storage,
+)
 from ert.storage.local_storage import _LOCAL_STORAGE_VERSION
 from ert.storage.mode import ModeError
 from ert.storage.realization_storage_state import RealizationStorageState
@@ -169,6 +178,44 @@ def test_that_saving_response_updates_configs(tmp_path):
         }
 
 
+def test_that_responses_of_realizations_can_be_saved_concurrently(tmp_path):
+    ensemble_size = 20
+    with open_storage(tmp_path, mode="w") as storage:
+        experiment = storage.create_experiment(
+            responses=[SummaryConfig(keys=["*"], input_files=["not_relevant"])]
+        )
+        ensemble = storage.create_ensemble(
+            experiment, ensemble_size=ensemble_size, iteration=0, name="prior"
+        )
+
+        def save(realization: int) -> None:
+            ensemble.save_response(
+                "summary",
+                polars.DataFrame(
+                    {
+                        "response_key": ["FOPR", "FOPT"],
+                        "time": polars.Series(
+                            [datetime(2000, 1, 1)] * 2
+                        ).dt.cast_time_unit("ms"),
+                        "values": polars.Series(
+                            [realization, 2.0 * realization], dtype=polars.Float32
+                        ),
+                    }
+                ),
+                realization,
+            )
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(save, range(ensemble_size)))
+
+        assert experiment.response_configuration["summary"].keys == ["FOPR", "FOPT"]
+        assert experiment.response_type_to_response_keys == {
+            "summary": ["FOPR", "FOPT"]
+        }
+        responses = ensemble.load_responses("FOPR", tuple(range(ensemble_size)))
+        assert responses["values"].to_list() == list(range(ensemble_size))
+
+
 def test_that_saving_empty_parameters_fails_nicely(tmp_path):
     with open_storage(tmp_path, mode="w") as storage:
         experiment = storage.create_experiment()
@@ -407,6 +454,76 @@ def test_that_open_storage_in_write_mode_with_newer_version_throws_exception(
         open_storage(tmp_path, mode="w")
 
 
+def test_that_responses_are_saved_sorted_by_key_in_row_groups(tmp_path):
+    with open_storage(tmp_path, mode="w") as storage:
+        experiment = storage.create_experiment(
+            responses=[GenDataConfig(keys=["A", "B", "C"])]
+        )
+        ensemble = experiment.create_ensemble(ensemble_size=1, name="prior")
+        num_indices = 50000
+        gen_data = polars.DataFrame(
+            {
+                "response_key": np.repeat(["C", "A", "B"], 2 * num_indices),
+                "report_step": polars.Series(
+                    np.tile(np.repeat([1, 0], num_indices), 3), dtype=polars.UInt16
+                ),
+                "index": polars.Series(
+                    np.tile(np.arange(num_indices)[::-1], 6), dtype=polars.UInt16
+                ),
+                "values": polars.Series(
+                    np.arange(6 * num_indices), dtype=polars.Float32
+                ),
+            }
+        )
+        ensemble.save_response("gen_data", gen_data.clone(), 0)
+
+        response_file = ensemble._path / "realization-0" / "gen_data.parquet"
+        saved = polars.read_parquet(response_file)
+        assert saved.drop("realization").equals(
+            gen_data.sort(["response_key", "report_step", "index"])
+        )
+
+        metadata = pq.ParquetFile(response_file).metadata
+        key_column = saved.columns.index("response_key")
+        key_ranges = [
+            (
+                metadata.row_group(i).column(key_column).statistics.min,
+                metadata.row_group(i).column(key_column).statistics.max,
+            )
+            for i in range(metadata.num_row_groups)
+        ]
+        assert len(key_ranges) > 3
+        assert key_ranges == sorted(key_ranges)
+        assert [low <= "B" <= high for low, high in key_ranges].count(False) > 1
+
+
+def test_that_migrating_to_version_9_sorts_stored_responses(tmp_path):
+    with open_storage(tmp_path, mode="w") as storage:
+        experiment = storage.create_experiment(
+            responses=[GenDataConfig(keys=["A", "B"])]
+        )
+        ensemble = experiment.create_ensemble(ensemble_size=1, name="prior")
+        unsorted = polars.DataFrame(
+            {
+                "response_key": ["B", "A", "B", "A"],
+                "report_step": polars.Series([0, 0, 0, 0], dtype=polars.UInt16),
+                "index": polars.Series([1, 1, 0, 0], dtype=polars.UInt16),
+                "values": polars.Series([1.0, 2.0, 3.0, 4.0], dtype=polars.Float32),
+            }
+        )
+        ensemble.save_response("gen_data", unsorted.clone(), 0)
+        response_file = ensemble._path / "realization-0" / "gen_data.parquet"
+        unsorted.write_parquet(response_file)
+        storage._index.version = 8
+        storage._save_index()
+
+    with open_storage(tmp_path, mode="w") as storage:
+        assert polars.read_parquet(response_file).equals(
+            unsorted.sort(["response_key", "report_step", "index"])
+        )
+        assert storage._index.migrations[-1].version_range == (8, 9)
+
+
 def test_ensemble_no_parameters(storage):
     ensemble = storage.create_experiment(name="my-experiment").create_ensemble(
         ensemble_size=2,
@@ -418,6 +535,294 @@ def test_ensemble_no_parameters(storage):
     )
 
 
+def _gen_kw_dataset(values):
+    return xr.Dataset(
+        {
+            "values": ("names", np.array(values)),
+            "transformed_values": ("names", np.array(values) * 2),
+            "names": ["KEY1", "KEY2"],
+        }
+    )
+
+
+@pytest.fixture
+def gen_kw_parameter():
+    return GenKwConfig(
+        name="PARAMETER",
+        forward_init=False,
+        template_file="",
+        transform_function_definitions=[
+            TransformFunctionDefinition("KEY1", "UNIFORM", [0, 1]),
+            TransformFunctionDefinition("KEY2", "UNIFORM", [0, 1]),
+        ],
+        output_file="kw.txt",
+        update=True,
+    )
+
+
+def test_that_ensemble_parameter_layout_round_trips(tmp_path, gen_kw_parameter):
+    with open_storage(tmp_path, mode="w") as storage:
+        experiment = storage.create_experiment(parameters=[gen_kw_parameter])
+        prior = experiment.create_ensemble(
+            ensemble_size=4, name="prior", parameter_layout=ParameterLayout.ENSEMBLE
+        )
+        for realization in [0, 2, 3]:
+            prior.save_parameters(
+                "PARAMETER",
+                realization,
+                _gen_kw_dataset([realization, realization + 0.5]),
+            )
+
+        assert (prior.mount_point / "parameters" / "PARAMETER").exists()
+        assert not (prior.mount_point / "realization-0" / "PARAMETER.nc").exists()
+        assert prior.is_initalized() == [0, 2, 3]
+        assert prior.get_parameter_state(1) == {
+            "PARAMETER": RealizationStorageState.UNDEFINED
+        }
+
+        single = prior.load_parameters("PARAMETER", 2)
+        assert "realizations" not in single.dims
+        assert single["values"].values.tolist() == [2.0, 2.5]
+        assert single["transformed_values"].values.tolist() == [4.0, 5.0]
+        assert single["names"].values.tolist() == ["KEY1", "KEY2"]
+
+        many = prior.load_parameters("PARAMETER", np.array([3, 0]))
+        assert many["realizations"].values.tolist() == [3, 0]
+        assert many["values"].values.tolist() == [[3.0, 3.5], [0.0, 0.5]]
+        assert prior.load_parameters("PARAMETER")["realizations"].values.tolist() == [
+            0,
+            2,
+            3,
+        ]
+        np.testing.assert_array_equal(
+            gen_kw_parameter.load_parameters(prior, "PARAMETER", np.array([0, 2])),
+            [[0.0, 2.0], [0.5, 2.5]],
+        )
+
+        with pytest.raises(KeyError, match="realization 1"):
+            prior.load_parameters("PARAMETER", np.array([0, 1]))
+        with pytest.raises(KeyError):
+            prior.load_parameters("I_DONT_EXIST", 1)
+
+        posterior = storage.create_ensemble(
+            experiment, ensemble_size=4, name="posterior", prior_ensemble=prior
+        )
+        assert posterior.parameter_layout == ParameterLayout.ENSEMBLE
+
+    with open_storage(tmp_path, mode="r") as storage:
+        prior = storage.get_ensemble(prior.id)
+        assert prior.parameter_layout == ParameterLayout.ENSEMBLE
+        assert prior.load_parameters("PARAMETER", 3)["values"].values.tolist() == [
+            3.0,
+            3.5,
+        ]
+
+
+def test_that_ensemble_parameter_layout_rejects_mismatching_shapes(
+    tmp_path, gen_kw_parameter
+):
+    with open_storage(tmp_path, mode="w") as storage:
+        experiment = storage.create_experiment(parameters=[gen_kw_parameter])
+        prior = experiment.create_ensemble(
+            ensemble_size=2, name="prior", parameter_layout=ParameterLayout.ENSEMBLE
+        )
+        prior.save_parameters("PARAMETER", 0, _gen_kw_dataset([1.0, 2.0]))
+        with pytest.raises(ValueError, match="has shape"):
+            prior.save_parameters(
+                "PARAMETER",
+                1,
+                xr.Dataset(
+                    {
+                        "values": ("names", np.array([1.0, 2.0, 3.0])),
+                        "transformed_values": ("names", np.array([1.0, 2.0, 3.0])),
+                        "names": ["KEY1", "KEY2", "KEY3"],
+                    }
+                ),
+            )
+
+
+@pytest.mark.parametrize("layout", list(ParameterLayout))
+def test_that_field_parameters_load_as_active_cell_matrix(tmp_path, layout):
+    grid = xtgeo.create_box_grid(dimension=(2, 3, 1))
+    actnum = grid.get_actnum()
+    actnum.values = [1, 0, 1, 1, 1, 0]
+    grid.set_actnum(actnum)
+    grid.to_file(tmp_path / "GRID.EGRID", "egrid")
+    field = Field.from_config_list(
+        str(tmp_path / "GRID.EGRID"),
+        Shape(2, 3, 1),
+        ["PORO", "PORO", "poro.roff", "INIT_FILES:poro_%d.roff"],
+    )
+    with open_storage(tmp_path / "storage", mode="w") as storage:
+        experiment = storage.create_experiment(parameters=[field])
+        ensemble = experiment.create_ensemble(
+            ensemble_size=3, name="prior", parameter_layout=layout
+        )
+        values = {
+            realization: np.arange(6, dtype=np.float32).reshape(2, 3, 1)
+            + 10 * realization
+            for realization in range(3)
+        }
+        for realization, value in values.items():
+            ensemble.save_parameters(
+                "PORO", realization, xr.Dataset({"values": (["x", "y", "z"], value)})
+            )
+
+        loaded = field.load_parameters(ensemble, "PORO", np.array([2, 0]))
+        mask = field.mask
+        assert loaded.shape == (4, 2)
+        assert loaded.flags.c_contiguous
+        assert field.load_parameters(
+            ensemble, "PORO", np.array([], dtype=int)
+        ).shape == (
+            4,
+            0,
+        )
+        np.testing.assert_array_equal(
+            loaded,
+            np.stack([values[2][~mask], values[0][~mask]], axis=1),
+        )
+        np.testing.assert_array_equal(
+            ensemble.load_parameters_numpy("PORO", np.array([1])),
+            values[1].reshape(-1, 1),
+        )
+
+        np.testing.assert_array_equal(
+            field.load_parameter_rows(
+                ensemble, "PORO", np.array([2, 0]), np.array([3, 1])
+            ),
+            loaded[[3, 1]],
+        )
+        np.testing.assert_array_equal(
+            field.load_parameter_rows(
+                ensemble, "PORO", np.array([2, 0]), np.array([1, 2]), block_bytes=1
+            ),
+            loaded[[1, 2]],
+        )
+
+        field.save_parameters_many(ensemble, "PORO", np.array([2, 0]), loaded + 1)
+        np.testing.assert_array_equal(
+            field.load_parameters(ensemble, "PORO", np.array([2, 0])), loaded + 1
+        )
+        assert np.isnan(
+            ensemble.load_parameters("PORO", 0)["values"].values[mask]
+        ).all()
+
+
+@pytest.mark.parametrize("layout", list(ParameterLayout))
+def test_that_saving_many_parameters_equals_saving_one_at_a_time(
+    tmp_path, gen_kw_parameter, layout
+):
+    data = np.array([[0.1, -0.2, 0.3], [1.0, 2.0, -1.0]])
+    realizations = np.array([3, 0, 2])
+    with open_storage(tmp_path, mode="w") as storage:
+        experiment = storage.create_experiment(parameters=[gen_kw_parameter])
+        one_at_a_time = experiment.create_ensemble(
+            ensemble_size=4, name="single", parameter_layout=layout
+        )
+        many = experiment.create_ensemble(
+            ensemble_size=4, name="many", parameter_layout=layout
+        )
+        for i, realization in enumerate(realizations):
+            gen_kw_parameter.save_parameters(
+                one_at_a_time, "PARAMETER", realization, data[:, i]
+            )
+        gen_kw_parameter.save_parameters_many(many, "PARAMETER", realizations, data)
+
+        assert many.is_initalized() == [0, 2, 3]
+        xr.testing.assert_equal(
+            many.load_parameters("PARAMETER", np.array([0, 2, 3])),
+            one_at_a_time.load_parameters("PARAMETER", np.array([0, 2, 3])),
+        )
+        np.testing.assert_allclose(
+            gen_kw_parameter.load_parameters(many, "PARAMETER", realizations), data
+        )
+
+        with pytest.raises(ValueError, match="'realizations' dimension of length"):
+            many.save_parameters_many(
+                "PARAMETER",
+                np.array([1]),
+                _gen_kw_dataset([1.0, 2.0]).expand_dims(realizations=[0, 1]),
+            )
+
+
+@pytest.mark.parametrize("source_layout", list(ParameterLayout))
+@pytest.mark.parametrize("target_layout", list(ParameterLayout))
+def test_that_copying_parameters_between_ensembles_preserves_them(
+    tmp_path, gen_kw_parameter, source_layout, target_layout
+):
+    with open_storage(tmp_path, mode="w") as storage:
+        experiment = storage.create_experiment(parameters=[gen_kw_parameter])
+        prior = experiment.create_ensemble(
+            ensemble_size=3, name="prior", parameter_layout=source_layout
+        )
+        for realization in range(3):
+            prior.save_parameters(
+                "PARAMETER", realization, _gen_kw_dataset([realization, 1.0])
+            )
+        posterior = experiment.create_ensemble(
+            ensemble_size=3, name="posterior", parameter_layout=target_layout
+        )
+        posterior.copy_parameters_from(prior, "PARAMETER", np.array([0, 2]))
+
+        assert posterior.is_initalized() == [0, 2]
+        xr.testing.assert_equal(
+            posterior.load_parameters("PARAMETER", np.array([0, 2])),
+            prior.load_parameters("PARAMETER", np.array([0, 2])),
+        )
+        if ParameterLayout.ENSEMBLE not in {source_layout, target_layout}:
+            assert (posterior.mount_point / "realization-0" / "PARAMETER.nc").samefile(
+                prior.mount_point / "realization-0" / "PARAMETER.nc"
+            )
+
+        posterior.save_parameters("PARAMETER", 0, _gen_kw_dataset([5.0, 5.0]))
+        assert prior.load_parameters("PARAMETER", 0)["values"].values.tolist() == [
+            0.0,
+            1.0,
+        ]
+
+        with pytest.raises(KeyError, match="realization 1"):
+            experiment.create_ensemble(
+                ensemble_size=3, name="other", parameter_layout=target_layout
+            ).copy_parameters_from(posterior, "PARAMETER", np.array([1]))
+
+
+def test_that_responses_can_be_scanned_lazily_across_realizations(tmp_path):
+    with open_storage(tmp_path, mode="w") as storage:
+        experiment = storage.create_experiment(
+            responses=[GenDataConfig(keys=["A", "B"])]
+        )
+        ensemble = experiment.create_ensemble(ensemble_size=12, name="prior")
+        for realization in [0, 2, 11]:
+            ensemble.save_response(
+                "gen_data",
+                polars.DataFrame(
+                    {
+                        "response_key": ["A", "B"],
+                        "report_step": polars.Series([0, 0], dtype=polars.UInt16),
+                        "index": polars.Series([0, 0], dtype=polars.UInt16),
+                        "values": polars.Series(
+                            [realization, -realization], dtype=polars.Float32
+                        ),
+                    }
+                ),
+                realization,
+            )
+
+        scanned = ensemble.scan_responses("gen_data")
+        assert isinstance(scanned, polars.LazyFrame)
+        assert scanned.filter(polars.col("response_key") == "A").select(
+            "realization", "values"
+        ).collect().rows() == [(0, 0.0), (2, 2.0), (11, 11.0)]
+        assert ensemble.scan_responses("gen_data", [11, 0]).filter(
+            polars.col("response_key") == "B"
+        ).collect()["values"].to_list() == [-11.0, -0.0]
+        assert ensemble.load_responses("B", (2,))["values"].to_list() == [-2.0]
+
+        with pytest.raises(KeyError, match="realization: 1"):
+            ensemble.scan_responses("gen_data", [0, 1])
+
+
 def test_get_unique_experiment_name(snake_oil_storage):
     with patch(
         "ert.storage.local_storage.LocalStorage.experiments", new_callable=PropertyMock
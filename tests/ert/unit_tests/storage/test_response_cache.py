@@ -0,0 +1,81 @@
+from uuid import uuid4
+
+import polars
+
+from ert.config import GenDataConfig
+from ert.storage import open_storage
+from ert.storage.response_cache import ResponseCache
+
+
+def _frame(num_rows):
+    return polars.DataFrame(
+        {"values": polars.Series(range(num_rows), dtype=polars.Float64)}
+    )
+
+
+def test_that_response_cache_evicts_least_recently_used_beyond_budget():
+    ensemble_id = uuid4()
+    cache = ResponseCache(max_bytes=_frame(10).estimated_size() * 2)
+    cache.put(ensemble_id, "a", _frame(10))
+    cache.put(ensemble_id, "b", _frame(10))
+    assert cache.get(ensemble_id, "a") is not None
+    cache.put(ensemble_id, "c", _frame(10))
+
+    assert cache.get(ensemble_id, "b") is None
+    assert cache.get(ensemble_id, "a") is not None
+    assert cache.get(ensemble_id, "c") is not None
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.evictions, stats.entries) == (3, 1, 1, 2)
+    assert stats.size_bytes <= stats.max_bytes
+
+
+def test_that_response_cache_does_not_keep_frames_larger_than_budget():
+    cache = ResponseCache(max_bytes=_frame(10).estimated_size())
+    cache.put(uuid4(), "a", _frame(100))
+    assert cache.stats().entries == 0
+
+
+def test_that_response_cache_is_invalidated_per_ensemble():
+    first, second = uuid4(), uuid4()
+    cache = ResponseCache()
+    cache.put(first, "a", _frame(1))
+    cache.put(second, "a", _frame(1))
+    cache.invalidate(first)
+    assert cache.get(first, "a") is None
+    assert cache.get(second, "a") is not None
+    cache.invalidate()
+    assert cache.stats().entries == 0
+    assert cache.stats().size_bytes == 0
+
+
+def _gen_data(value):
+    return polars.DataFrame(
+        {
+            "response_key": ["A"],
+            "report_step": polars.Series([0], dtype=polars.UInt16),
+            "index": polars.Series([0], dtype=polars.UInt16),
+            "values": polars.Series([value], dtype=polars.Float32),
+        }
+    )
+
+
+def test_that_loaded_responses_are_cached_until_the_ensemble_changes(tmp_path):
+    with open_storage(tmp_path, mode="w") as storage:
+        experiment = storage.create_experiment(responses=[GenDataConfig(keys=["A"])])
+        ensemble = experiment.create_ensemble(ensemble_size=2, name="prior")
+        ensemble.save_response("gen_data", _gen_data(1.0), 0)
+
+        first = ensemble.load_responses("A", (0,))
+        assert ensemble.load_responses("A", (0,)) is first
+        assert storage.response_cache.stats().hits == 1
+
+        ensemble.save_response("gen_data", _gen_data(2.0), 0)
+        assert ensemble.load_responses("A", (0,))["values"].to_list() == [2.0]
+
+        (ensemble.mount_point / "realization-0" / "gen_data.parquet").unlink()
+        _gen_data(3.0).with_columns(
+            polars.lit(0, dtype=polars.UInt16).alias("realization")
+        ).write_parquet(ensemble.mount_point / "realization-0" / "gen_data.parquet")
+        assert ensemble.load_responses("A", (0,))["values"].to_list() == [2.0]
+        ensemble.refresh_ensemble_state()
+        assert ensemble.load_responses("A", (0,))["values"].to_list() == [3.0]
@@ -118,6 +118,45 @@ def test_run_template_replace_in_file_with_custom_define(
     ).read_text() == "I WANT TO REPLACE:my_custom_variable"
 
 
+@pytest.mark.usefixtures("use_tmpdir")
+def test_that_templates_are_rendered_for_each_realization(
+    prior_ensemble, run_args, run_paths
+):
+    config_text = dedent(
+        """
+        NUM_REALIZATIONS 50
+        JOBNAME my_case%d
+        DEFINE <MY_VAR> my_custom_variable_<IENS>
+        RUN_TEMPLATE template.tmpl result_<IENS>.txt
+        """
+    )
+    Path("template.tmpl").write_text(
+        "<MY_VAR> <IENS> <ITER> <ECLBASE> <UNKNOWN>", encoding="utf-8"
+    )
+    Path("config.ert").write_text(config_text, encoding="utf-8")
+
+    ert_config = ErtConfig.from_file("config.ert")
+    run_arg = run_args(ert_config, prior_ensemble)
+    create_run_path(
+        run_args=run_arg,
+        ensemble=prior_ensemble,
+        user_config_file=ert_config.user_config_file,
+        env_vars=ert_config.env_vars,
+        env_pr_fm_step=ert_config.env_pr_fm_step,
+        forward_model_steps=ert_config.forward_model_steps,
+        substitutions=ert_config.substitutions,
+        templates=ert_config.ert_templates,
+        model_config=ert_config.model_config,
+        runpaths=run_paths(ert_config),
+    )
+    for iens, arg in enumerate(run_arg):
+        assert (Path(arg.runpath) / f"result_{iens}.txt").read_text(
+            encoding="utf-8"
+        ) == f"my_custom_variable_{iens} {iens} 0 my_case{iens} <UNKNOWN>"
+        assert (Path(arg.runpath) / "jobs.json").exists()
+        assert (Path(arg.runpath) / "manifest.json").exists()
+
+
 @pytest.mark.usefixtures("use_tmpdir")
 @pytest.mark.parametrize(
     "key, expected",
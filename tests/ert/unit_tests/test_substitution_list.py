@@ -1,11 +1,20 @@
+import copy
 import os
+import pickle
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 from hypothesis import assume, given, settings
+from hypothesis import strategies as st
 
 from ert.config import ErtConfig
 from ert.config.parsing import ConfigKeys
-from ert.substitutions import Substitutions
+from ert.substitutions import (
+    _COMPILED_CACHE_SIZE,
+    Substitutions,
+    _CompiledSubstitutions,
+    _substitute,
+)
 
 from .config.config_dict_generator import config_generators
 
@@ -73,3 +82,117 @@ def test_substitutions():
     assert subst_list.get("nosuchkey") is None
     assert subst_list.get(513) is None
     assert subst_list == {"<Key>": "Value", "<Key2>": "Value2"}
+
+
+@given(
+    st.dictionaries(
+        st.sampled_from(["<A>", "<B>", "<AB>", "<BA>"]),
+        st.text(alphabet="<>AB", max_size=5),
+    ),
+    st.text(alphabet="<>AB", max_size=10),
+)
+def test_that_compiled_substitution_gives_same_result_as_iterative(
+    substitutions, to_substitute
+):
+    compiled = _CompiledSubstitutions(substitutions).substitute(to_substitute)
+    # None means that the iterative substitution is used instead
+    assume(compiled is not None)
+    assert compiled == _substitute(
+        substitutions, to_substitute, max_iterations=50, warn_max_iter=False
+    )
+
+
+def test_that_nested_substitutions_are_resolved():
+    substitutions = Substitutions(
+        {"<ECLBASE>": "<CASE>_<IENS>", "<CASE>": "<NAME>", "<NAME>": "my_case"}
+    )
+    assert substitutions.substitute("<ECLBASE>.DATA") == "my_case_<IENS>.DATA"
+    assert substitutions.substitute_real_iter("<ECLBASE>-<ITER>", 3, 1) == (
+        "my_case_3-1"
+    )
+
+
+def test_that_substitution_reflects_changes_to_the_substitutions():
+    substitutions = Substitutions({"<A>": "<B>", "<B>": "b"})
+    assert substitutions.substitute("<A>") == "b"
+    assert substitutions.substitute_real_iter("<A><IENS>", 1, 0) == "b1"
+
+    substitutions["<B>"] = "c"
+    assert substitutions.substitute("<A>") == "c"
+    assert substitutions.substitute_real_iter("<A><IENS>", 1, 0) == "c1"
+
+    del substitutions["<B>"]
+    assert substitutions.substitute("<A>") == "<B>"
+
+    substitutions |= {"<B>": "d"}
+    assert substitutions.substitute("<A>") == "d"
+
+    copied = substitutions.copy()
+    copied["<B>"] = "e"
+    assert copied.substitute("<A>") == "e"
+    assert substitutions.substitute("<A>") == "d"
+
+
+def pickle_roundtrip(substitutions):
+    return pickle.loads(pickle.dumps(substitutions))
+
+
+@pytest.mark.parametrize("duplicate", [copy.copy, copy.deepcopy, pickle_roundtrip])
+def test_that_duplicated_substitutions_have_their_own_lock(duplicate):
+    substitutions = Substitutions({"<A>": "<B>", "<B>": "b"})
+    assert substitutions.substitute("<A>") == "b"
+
+    duplicated = duplicate(substitutions)
+
+    assert duplicated._compiled_cache_lock is not substitutions._compiled_cache_lock
+    assert duplicated.substitute("<A>") == "b"
+    duplicated["<B>"] = "c"
+    assert duplicated.substitute("<A>") == "c"
+    assert substitutions.substitute("<A>") == "b"
+
+
+def test_that_cyclic_substitutions_fall_back_to_iterative_substitution():
+    substitutions = Substitutions({"<A>": "<B>", "<B>": "<A>"})
+    assert substitutions.substitute("<A>", max_iterations=1000) == "<A>"
+    assert substitutions.substitute("<A><A>", max_iterations=3) == "<B><B>"
+
+
+def test_that_substituting_from_several_threads_gives_the_same_results():
+    substitutions = Substitutions(
+        {
+            "<ECLBASE>": "<CASE>_<IENS>",
+            "<CASE>": "<NAME>-<ITER>",
+            "<NAME>": "my_case",
+            "<A>": "<B>",
+            "<B>": "<A>",
+        }
+    )
+    strings = ["<ECLBASE>.DATA", "<CASE>/<NAME>", "<A>", "<B>/<ECLBASE>"]
+    jobs = [
+        (string, real, it)
+        for real in range(50)
+        for it in range(2)
+        for string in strings
+    ]
+    expected = [
+        _substitute(
+            substitutions._with_real_iter(real, it), string, warn_max_iter=False
+        )
+        for string, real, it in jobs
+    ]
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        results = list(
+            executor.map(lambda job: substitutions.substitute_real_iter(*job), jobs * 4)
+        )
+    assert results == expected * 4
+
+
+def test_that_only_the_oldest_compiled_substitutions_are_evicted():
+    substitutions = Substitutions({"<A>": "a"})
+    for real in range(_COMPILED_CACHE_SIZE + 1):
+        substitutions.substitute_real_iter("<A><IENS>", real, 0)
+    cache = substitutions._compiled_cache
+    assert len(cache) == _COMPILED_CACHE_SIZE
+    assert (0, 0) not in cache
+    assert (1, 0) in cache
+    assert (_COMPILED_CACHE_SIZE, 0) in cache
@@ -284,6 +284,8 @@ def test_everest_to_ert_torque():
         "num_nodes": 1,
         "keep_qsub_output": True,
         "queue_name": "permanent_8",
+        "array_submit": False,
+        "max_array_size": 1000,
     }
 
 